@@ -4,6 +4,10 @@ __author__ = """Dougal Scott"""
 __email__ = "dougal.scott@gmail.com"
 
 from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Optional
 from prettytable import PrettyTable
 import colors
 
@@ -47,6 +51,12 @@ from pycs.characters import Barbarian, Cleric, Fighter, Paladin, Ranger, Rogue,
 from pycs.constant import DamageType
 
 from pycs.arena import Arena
+from pycs.bands import BandArena
+from pycs.cache import ResultCache
+from pycs.encounter import Encounter
+from pycs.log import log, get_level, set_level, NORMAL
+from pycs.rng import Rng, Seed, combat_seed
+from pycs.util import wilson_interval
 
 from pycs.gear import Chainmail, Hide, Leather, Plate, Shield, Studded
 from pycs.gear import Greataxe, Longsword, Mace, Quarterstaff, Shortsword
@@ -66,17 +76,150 @@ GNOLL_ARMY = True
 HUMAN_ARMY = True
 
 
+# How many combats to run between checks on the confidence intervals
+PRECISION_BATCH = 100
+
+# What the combats are fought on - a grid, or range bands for quicker rougher results
+ENGINES = {"grid": Arena, "band": BandArena}
+
+
+##############################################################################
+def start(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    rounds: int,
+    workers: int = 1,
+    seed: Seed = None,
+    target_ci: Optional[float] = None,
+    cache: Optional[ResultCache] = None,
+    engine: str = "grid",
+) -> None:
+    """Main - with a {target_ci} {rounds} is the most that will be run"""
+    if target_ci is None:
+        winning_stats, all_stats = run_combats(rounds, workers, seed, cache=cache, engine=engine)
+    else:
+        winning_stats, all_stats, rounds = run_to_precision(
+            target_ci, rounds, workers, seed, cache=cache, engine=engine
+        )
+    print_overall_stats(all_stats)
+    win_report(winning_stats, rounds)
+
+
 ##############################################################################
-def start(rounds: int) -> None:
-    """Main"""
+def run_to_precision(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    target_ci: float,
+    max_rounds: int,
+    workers: int = 1,
+    seed: Seed = None,
+    batch: int = PRECISION_BATCH,
+    cache: Optional[ResultCache] = None,
+    engine: str = "grid",
+) -> tuple[defaultdict[str, int], Statistics, int]:
+    """Keep running combats until the 95% interval on every side's win rate is
+    narrower than {target_ci} - or {max_rounds} have been run
+    Returns the winners, stats and how many combats it took. Combats are
+    numbered on from each batch so a seeded run gives the same results as
+    running that many rounds in one go. The workers are started once and kept
+    for every batch"""
     winning_stats: defaultdict[str, int] = defaultdict(int)
-    all_stats = Statistics()
-    for _ in range(rounds):
-        winner, stats = combat_test()
+    all_stats = Statistics(summary_only=True)
+    done = 0
+    with new_pool(workers) if workers > 1 else nullcontext() as pool:
+        while done < max_rounds:
+            count = min(batch, max_rounds - done)
+            wins, stats = run_combats(count, workers, seed, first=done, cache=cache, engine=engine, pool=pool)
+            for side, won in wins.items():
+                winning_stats[side] += won
+            all_stats += stats
+            done += count
+            if widest_interval(winning_stats, done) < target_ci:
+                break
+    return winning_stats, all_stats, done
+
+
+##############################################################################
+def new_pool(workers: int) -> ProcessPoolExecutor:
+    """Processes to run combats in - logging as loudly as we are"""
+    return ProcessPoolExecutor(max_workers=workers, initializer=set_level, initargs=(get_level(),))
+
+
+##############################################################################
+def split_rounds(first: int, rounds: int, workers: int) -> list[tuple[int, int]]:
+    """Share {rounds} combats, numbered from {first}, as evenly as possible
+    between {workers} - as (first, count) for each worker that gets any"""
+    batches = [rounds // workers + (1 if _ < rounds % workers else 0) for _ in range(workers)]
+    firsts = [first + sum(batches[:_]) for _ in range(workers)]
+    return [(start, count) for start, count in zip(firsts, batches) if count]
+
+
+##############################################################################
+def widest_interval(winning_stats: dict[str, int], rounds: int) -> float:
+    """The width of the least certain side's win rate interval"""
+    widths = [hi - lo for lo, hi in (wilson_interval(_, rounds) for _ in winning_stats.values())]
+    return max(widths, default=1.0)
+
+
+##############################################################################
+def run_combats(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    rounds: int,
+    workers: int = 1,
+    seed: Seed = None,
+    first: int = 0,
+    cache: Optional[ResultCache] = None,
+    engine: str = "grid",
+    pool: Optional[Executor] = None,
+) -> tuple[defaultdict[str, int], Statistics]:
+    """Run {rounds} combats spread across {workers} processes and merge the results
+    With a {seed} the results are the same however many workers there are
+    {first} is the index of the first combat - see run_batch()
+    With a {cache} only the seeded combats it doesn't already know are fought
+    {engine} is one of ENGINES
+    {pool} is somewhere to run them - otherwise one is started just for these"""
+    scenario = default_encounter().scenario
+    if cache is not None and seed is not None and scenario is not None:
+        if engine != "grid":
+            scenario = f"{scenario}@{engine}"
+        return cache.run(
+            scenario,
+            seed,
+            first,
+            rounds,
+            lambda start, count: run_combats(count, workers, seed, start, engine=engine, pool=pool),
+        )
+    if workers <= 1:
+        return run_batch(first, rounds, seed, engine=engine)
+    if pool is None:
+        with new_pool(workers) as owned_pool:
+            return run_combats(rounds, workers, seed, first, engine=engine, pool=owned_pool)
+    winning_stats: defaultdict[str, int] = defaultdict(int)
+    all_stats = Statistics(summary_only=True)
+    # Each worker gets one batch so the results come back as one Statistics per worker
+    jobs = split_rounds(first, rounds, workers)
+    for wins, stats in pool.map(
+        run_batch,
+        [_[0] for _ in jobs],
+        [_[1] for _ in jobs],
+        [seed] * len(jobs),
+        [None] * len(jobs),
+        [engine] * len(jobs),
+    ):
+        for side, count in wins.items():
+            winning_stats[side] += count
+        all_stats += stats
+    return winning_stats, all_stats
+
+
+##############################################################################
+def run_batch(
+    first: int, rounds: int, seed: Seed = None, encounter: Optional[Encounter] = None, engine: str = "grid"
+) -> tuple[defaultdict[str, int], Statistics]:
+    """Run {rounds} combats one after the other - each in its own arena
+    {first} is the index of the first combat so each gets its own seed"""
+    winning_stats: defaultdict[str, int] = defaultdict(int)
+    all_stats = Statistics(summary_only=True)
+    for index in range(first, first + rounds):
+        winner, stats = combat_test(combat_seed(seed, index), encounter, engine=engine)
         winning_stats[winner] += 1
         all_stats += stats
-    print_overall_stats(all_stats)
-    win_report(winning_stats, rounds)
+    return winning_stats, all_stats
 
 
 ##############################################################################
@@ -101,9 +244,10 @@ def win_report(stats: dict[str, int], rounds: int) -> None:
     """Who is winning"""
     print("\nWinning stats")
     tbl = PrettyTable()
-    tbl.field_names = ["Side", "Win Count", "Percentage"]
+    tbl.field_names = ["Side", "Win Count", "Percentage", "95% Interval"]
     for side, wins in stats.items():
-        tbl.add_row([side, wins, 100.0 * wins / rounds])
+        low, high = wilson_interval(wins, rounds)
+        tbl.add_row([side, wins, 100.0 * wins / rounds, f"{100.0 * low:.1f} - {100.0 * high:.1f}"])
 
     print(tbl)
 
@@ -111,7 +255,7 @@ def win_report(stats: dict[str, int], rounds: int) -> None:
 ##############################################################################
 def flaming_weapon(source: Creature, target: Creature, dmg: Damage) -> None:
     """Add some extra spice"""
-    dmg = DamageRoll("1d6", 0, DamageType.FIRE).roll()
+    dmg = DamageRoll("1d6", 0, DamageType.FIRE).roll(source.rng)
     target.hit(dmg, source, False, "Flaming Weapon")
 
 
@@ -129,7 +273,7 @@ def damage_report(arena: Arena) -> None:
         "Criticals",
         "Crit %",
     ]
-    for creat in arena.pick_everyone():
+    for creat in arena.roster.pick_everyone():
         stats = arena.statistics.creature_summary(creat)
         for atk, stat in stats.items():
             try:
@@ -145,7 +289,7 @@ def damage_report(arena: Arena) -> None:
     tbl.sortby = "Damage"
     tbl.align["Name"] = "l"
     tbl.align["Attack"] = "l"
-    print(tbl)
+    log.info("%s", tbl)
 
 
 ##############################################################################
@@ -160,24 +304,24 @@ def participant_report(arena: Arena) -> None:
     """Participant details"""
     tbl = PrettyTable()
     tbl.field_names = ["Name", "HP", "State"]
-    for creat in arena.pick_everyone():
+    for creat in arena.roster.pick_everyone():
         tbl.add_row(
             [
                 creat.name,
                 f"{creat.hp}/{creat.max_hp}",
-                ", ".join([_.name.title() for _ in creat.conditions]),
+                creat.conditions.describe().title(),
             ]
         )
     tbl.sortby = "Name"
     tbl.align["Name"] = "l"
-    print(tbl)
+    log.info("%s", tbl)
 
 
 ##############################################################################
 def participant_state(arena: Arena) -> None:
     """Report on participants"""
     sides = defaultdict(list)
-    for part in arena.pick_everyone():
+    for part in arena.roster.pick_everyone():
         sides[part.side].append(part)
     for side in sides:
         output = []
@@ -186,7 +330,7 @@ def participant_state(arena: Arena) -> None:
                 output.append(colors.green(creat))
             else:
                 output.append(colors.red(creat))
-        print(f"{side}: {', '.join(output)}")
+        log.info("%s: %s", side, ", ".join(output))
 
 
 ##############################################################################
@@ -356,38 +500,58 @@ def human_army(arena: Arena) -> None:
 
 
 ##############################################################################
-def combat_test() -> tuple[str, Statistics]:
-    """Run through a combat"""
-    turn = 0
-    print("#" * 80)
-    arena = Arena(max_x=45, max_y=25)
+def default_encounter() -> Encounter:
+    """The armies picked by the *_ARMY flags - only built once per process
+    for each choice of armies"""
+    return army_encounter(DRAGON_ARMY, UNDEAD_ARMY, MONSTER_ARMY, GNOLL_ARMY, HUMAN_ARMY)
 
-    if DRAGON_ARMY:
-        dragon_army(arena)
 
-    if UNDEAD_ARMY:
-        undead_army(arena)
-
-    if MONSTER_ARMY:
-        monster_army(arena)
+##############################################################################
+@lru_cache(maxsize=None)
+def army_encounter(dragon: bool, undead: bool, monster: bool, gnoll: bool, human: bool) -> Encounter:
+    """The encounter with each of the armies that is picked"""
+    armies = []
+    if dragon:
+        armies.append(dragon_army)
+    if undead:
+        armies.append(undead_army)
+    if monster:
+        armies.append(monster_army)
+    if gnoll:
+        armies.append(gnoll_army)
+    if human:
+        armies.append(human_army)
+    return Encounter(*armies)
 
-    if GNOLL_ARMY:
-        gnoll_army(arena)
 
-    if HUMAN_ARMY:
-        human_army(arena)
+##############################################################################
+def combat_test(
+    seed: Seed = None, encounter: Optional[Encounter] = None, rng: Optional[Rng] = None, engine: str = "grid"
+) -> tuple[str, Statistics]:
+    """Run through a combat - the same {seed} gives the same combat
+    An {rng} is used instead of one made from {seed}
+    {engine} picks the sort of arena from ENGINES"""
+    turn = 0
+    log.info("#" * 80)
+    arena = ENGINES[engine](max_x=45, max_y=25, rng=rng or Rng(seed), summary_only=True)
+    if encounter is None:
+        encounter = default_encounter()
+    encounter.populate(arena)
 
     arena.do_initiative()
-    print(f"{arena}")
-    while arena.still_going():
-        print(f"##### Turn {turn}")
-        participant_state(arena)
+    log.info("%s", arena)
+    reporting = log.isEnabledFor(NORMAL)
+    while arena.roster.still_going():
+        log.info("##### Turn %d", turn)
+        if reporting:
+            participant_state(arena)
         arena.turn()
         turn += 1
         assert turn < 100
-    print(f"{turn=}")
-    statistics_report(arena)
-    return arena.winning_side(), arena.statistics
+    log.info("turn=%d", turn)
+    if reporting:
+        statistics_report(arena)
+    return arena.roster.winning_side(), arena.statistics
 
 
 # EOF
@@ -3,15 +3,17 @@ from typing import Any, Optional, TYPE_CHECKING, cast
 from pycs.constant import ActionCategory
 from pycs.constant import ActionType
 from pycs.constant import DamageType
-from pycs.constant import Condition
+from pycs.constant import Condition, EXPOSED, EXPOSED_TO_MELEE, HINDERED
 from pycs.damage import Damage
 from pycs.constant import Stat
 from pycs.util import check_args
 from pycs.damageroll import DamageRoll
+from pycs.log import log, NORMAL
 
 if TYPE_CHECKING:
     from pycs.creature import Creature
     from pycs.equipment import Equipment
+    from pycs.rng import Rng
 
 
 ##############################################################################
@@ -57,10 +59,24 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             "side_effect",
         }
 
+    ########################################################################
+    @property
+    def rng(self) -> Optional["Rng"]:
+        """The dice of whoever is doing the action"""
+        if self.owner is None:
+            return None
+        return self.owner.rng
+
     ########################################################################
     @property
     def use_stat(self) -> Stat:
         """What stat to use"""
+        if self.owner is None:
+            return self._use_stat()
+        return self.owner.derived(("use_stat", self), self._use_stat)
+
+    ########################################################################
+    def _use_stat(self) -> Stat:
         # Set from the equipment
         if self.gear and hasattr(self.gear, "use_stat"):
             return self.gear.use_stat
@@ -74,14 +90,14 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
     def atk_modifier(self, attacker: "Creature") -> int:  # pylint: disable=unused-argument
         """Modifier to the attack dice roll"""
         # Don't use NotImplementedError as isn't required for every action
-        print(f"{self.__class__.__name__} hasn't implemented atk_modifier()")
+        log.info("%s hasn't implemented atk_modifier()", self.__class__.__name__)
         return 0
 
     ########################################################################
     def dmg_modifier(self, attacker: "Creature") -> Damage:  # pylint: disable=unused-argument
         """Modifier to the damage bonus"""
         # Don't use NotImplementedError as isn't required for every action
-        print(f"{self.__class__.__name__} hasn't implemented dmg_modifier()")
+        log.info("%s hasn't implemented dmg_modifier()", self.__class__.__name__)
         return Damage(0, DamageType.NONE)
 
     ########################################################################
@@ -159,7 +175,6 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
     ##########################################################################
     def roll_to_hit(self, target: "Creature") -> tuple[int, bool, bool]:
         """Roll to hit with the attack"""
-        msg = ""
         rnge = self.owner.distance(target)
         balance = 0
         if self.has_disadvantage(target, rnge):
@@ -167,39 +182,39 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         elif self.has_advantage(target, rnge):
             balance += 1
 
-        if balance < 0:
-            roll1 = self.owner.rolld20("attack")
-            roll2 = self.owner.rolld20("attack")
-            to_hit_roll = min(roll1, roll2)
-            msg += f"Rolled {to_hit_roll}; [{roll1}, {roll2}] with disadvantage"
-        elif balance > 0:
-            roll1 = self.owner.rolld20("attack")
-            roll2 = self.owner.rolld20("attack")
-            to_hit_roll = max(roll1, roll2)
-            msg += f"Rolled {to_hit_roll}; [{roll1}, {roll2}] with advantage"
+        rolls: tuple[int, int] = (0, 0)  # Both rolls - only with advantage or disadvantage
+        if balance:
+            rolls = (self.owner.rolld20("attack"), self.owner.rolld20("attack"))
+            to_hit_roll = min(rolls) if balance < 0 else max(rolls)
         else:
             to_hit_roll = self.owner.rolld20("attack")
-            msg += f"Rolled {to_hit_roll};"
 
         crit_hit, crit_miss = self.check_criticals(to_hit_roll)
         to_hit, msg1 = self.calculate_to_hit(to_hit_roll, target=target)
-        if crit_hit:
-            msg += " (critical hit)"
-        elif crit_miss:
-            msg += " (critical miss)"
-            msg1 = ""
-        print(f"{self.owner} got {to_hit} to hit ({msg} {msg1})")
+        if log.isEnabledFor(NORMAL):
+            msg = f"Rolled {to_hit_roll};"
+            if balance < 0:
+                msg += f" [{rolls[0]}, {rolls[1]}] with disadvantage"
+            elif balance > 0:
+                msg += f" [{rolls[0]}, {rolls[1]}] with advantage"
+            if crit_hit:
+                msg += " (critical hit)"
+            elif crit_miss:
+                msg += " (critical miss)"
+                msg1 = ""
+            log.info("%s got %s to hit (%s %s)", self.owner, to_hit, msg, msg1)
         return int(to_hit), crit_hit, crit_miss
 
     ########################################################################
     def calculate_to_hit(self, to_hit_roll: int, target: "Creature") -> tuple[int, str]:
-        """Calculate the to_hit"""
-        msg = []
+        """Calculate the to_hit - and how it was made up if anyone is listening"""
+        reporting = log.isEnabledFor(NORMAL)
+        msg: list[str] = []
         rnge = self.owner.distance(target)
         modifier = self.atk_modifier(self.owner)
-        msg.append(f"+{modifier} (stat modifier)")
         profbon = self.owner.prof_bonus
-        msg.append(f"+{profbon} (prof bonus)")
+        if reporting:
+            msg.extend([f"+{modifier} (stat modifier)", f"+{profbon} (prof bonus)"])
         to_hit = to_hit_roll + modifier + profbon
         to_hit_mod, msg_mod = self.owner.effects.hook_attack_to_hit(target=target, range_=rnge, action=self)
         to_hit += to_hit_mod
@@ -209,7 +224,8 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
                 mod = self.gear.hook_attack_to_hit(target=target)
                 if mod:
                     to_hit += mod
-                    msg.append(f"+{mod} from {self.gear}")
+                    if reporting:
+                        msg.append(f"+{mod} from {self.gear}")
         return to_hit, ", ".join(msg)
 
     ########################################################################
@@ -235,9 +251,9 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             return False
         rnge = self.owner.distance(target)
         if rnge > self.range()[1]:
-            print(f"{target} is out of range")
+            log.info("%s is out of range", target)
             return False
-        print(f"{self.owner} attacking {target} with {self}")
+        log.info("%s attacking %s with %s", self.owner, target, self)
 
         did_hit, crit_hit = self.did_we_hit(target)
         if did_hit:
@@ -250,10 +266,12 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
 
             # If the target or source of the damage has a buff
             self.buff_attack_damage(target)
-            print(f"{self.owner} hit {target} (AC: {target.ac})" f" with {self} for {dmg} damage")
+            if log.isEnabledFor(NORMAL):
+                log.info("%s hit %s (AC: %s) with %s for %s damage", self.owner, target, target.ac, self, dmg)
         else:
             target.miss(source=self.owner, atkname=self.name)
-            print(f"{self.owner} missed {target} (AC: {target.ac}) with {self}")
+            if log.isEnabledFor(NORMAL):
+                log.info("%s missed %s (AC: %s) with %s", self.owner, target, target.ac, self)
         target.effects.removal_after_being_attacked()
         return True
 
@@ -284,32 +302,29 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
     ########################################################################
     def roll_dmg(self, _: Any, critical: bool = False) -> Damage:
         """Roll the damage of the attack"""
-        msg = ""
         if critical:
-            dmg_roll = self.dmgroll.roll_max() + self.dmgroll.roll()
+            dmg_roll = self.dmgroll.roll_max() + self.dmgroll.roll(self.rng)
         else:
-            dmg_roll = self.dmgroll.roll()
+            dmg_roll = self.dmgroll.roll(self.rng)
         dmg = dmg_roll.copy()
-        dmg_bon = self.dmg_bonus()
-        for bonus, cause in dmg_bon:
+        bonuses = []
+        for bonus, cause in self.dmg_bonus():
             if isinstance(bonus, DamageRoll):
-                bonus_roll = bonus.roll()
+                bonus_roll = bonus.roll(self.rng)
             else:
                 bonus_roll = bonus.copy()
             dmg += bonus_roll
-            msg += f"+{bonus_roll.hp} ({cause}); "
-        print(f"{self.owner} inflicted {dmg} damage (Rolled {dmg_roll.hp} on {self.dmgroll}; {msg.strip()})")
+            bonuses.append((bonus_roll.hp, cause))
+        if log.isEnabledFor(NORMAL):
+            msg = " ".join(f"+{hp} ({cause});" for hp, cause in bonuses)
+            log.info("%s inflicted %s damage (Rolled %s on %s; %s)", self.owner, dmg, dmg_roll.hp, self.dmgroll, msg)
         return dmg
 
     ########################################################################
     def has_disadvantage(self, target: "Creature", rnge: int) -> bool:
         """Does this attack have disadvantage"""
         # Needs to change to be related to the source of the fright
-        if (
-            self.owner.has_condition(Condition.POISONED)
-            or self.owner.has_condition(Condition.FRIGHTENED)
-            or self.owner.has_condition(Condition.PRONE)
-        ):
+        if self.owner.has_condition(HINDERED):
             return True
         if target.has_condition(Condition.PRONE) and rnge > 1:
             return True
@@ -322,11 +337,9 @@ class Action:  # pylint: disable=too-many-instance-attributes, too-many-public-m
     ########################################################################
     def has_advantage(self, target: "Creature", rnge: int) -> bool:
         """Does this attack have advantage at this range"""
-        if target.has_condition(Condition.BLINDED) or target.has_condition(Condition.RESTRAINED):
-            return True
-        if target.has_condition(Condition.UNCONSCIOUS) and rnge <= 1:
+        if target.has_condition(EXPOSED):
             return True
-        if target.has_condition(Condition.PRONE) and rnge <= 1:
+        if rnge <= 1 and target.has_condition(EXPOSED_TO_MELEE):
             return True
         if target.effects.hook_gives_advantage_against():
             return True
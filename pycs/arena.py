@@ -1,79 +1,114 @@
 """ Class defining the play area """
 import math
-import random
-from typing import Any, Optional
-from collections import defaultdict
+from typing import Any, Callable, Optional
+from collections import defaultdict, deque
 from collections import namedtuple
-from astar import AStar
-from pycs.constant import Stat, MonsterType
+from pycs.constant import Stat
 from pycs.creature import Creature
+from pycs.roster import Roster
 from pycs.statistics import Statistics
+from pycs.log import log
+from pycs.rng import Rng
+
+# Size of the squares the spatial index groups combatants into
+BUCKET_SIZE = 5
+
+# What the padding around the edge of the grid holds - never free to move into
+OFF_GRID = object()
 
 
 ##############################################################################
 ##############################################################################
 ##############################################################################
-class Arena(AStar):
-    """Arena Class"""
+class Arena:  # pylint: disable=too-many-instance-attributes
+    """Arena Class
+    Who is fighting, and whether they are still standing, is kept in {roster}"""
 
     ##############################################################################
     def __init__(self, **kwargs: Any):
         self.max_x: int = kwargs.get("max_x", 20)
         self.max_y: int = kwargs.get("max_y", 20)
-        self.grid: dict = {}
-        self.statistics = Statistics()
-        self._combatants: list = []
+        # The grid is a flat list with a one square border of OFF_GRID so
+        # neighbours never need bounds checks - see _cell_index()
+        self._stride = self.max_x + 2
+        self._cells: list[Any] = [OFF_GRID] * (self._stride * (self.max_y + 2))
+        self._coords: list[Optional[tuple[int, int]]] = [None] * len(self._cells)
         for j in range(self.max_y):
             for i in range(self.max_x):
-                self.grid[(i, j)] = None
+                self._cells[self._cell_index((i, j))] = None
+                self._coords[self._cell_index((i, j))] = (i, j)
+        # Index offsets to the eight neighbouring squares
+        self._neighbour_offsets = tuple(dx + dy * self._stride for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+        self.statistics = Statistics(summary_only=kwargs.get("summary_only", False))
+        self.rng: Rng = kwargs.get("rng") or Rng(kwargs.get("seed"))
+        self.roster = Roster()
+        # Spatial index - bucket -> combatant -> coords, and combatant -> coords
+        self._buckets: defaultdict[tuple[int, int], dict[Any, tuple[int, int]]] = defaultdict(dict)
+        self._where: dict[Any, tuple[int, int]] = {}
+        # Route each mover is following - target and the steps from where they are
+        self._routes: dict[Any, tuple[tuple[int, int], list[tuple[int, int]]]] = {}
+        # Bumped whenever who is where, or who is still standing, changes
+        self.version = 0
 
-    ##############################################################################
-    def distance_between(
-        self, n1: tuple[int, int], n2: tuple[int, int]
-    ) -> int:  # pylint: disable=unused-argument, invalid-name
-        """This method always returns 1, as two 'neighbors' are always adjacent"""
-        return 1
+    ##########################################################################
+    def neighbors(self, node: tuple[int, int]) -> list[tuple[int, int]]:
+        """Returns all the places we can reach from node"""
+        base = self._cell_index(node)
+        cells = self._cells
+        return [self._coords[base + _] for _ in self._neighbour_offsets if cells[base + _] is None]  # type: ignore
 
     ##########################################################################
-    def heuristic_cost_estimate(self, current: tuple[int, int], goal: tuple[int, int]) -> float:
-        """computes the 'direct' distance between two (x,y) tuples"""
-        (point_x1, point_y1) = current
-        (point_x2, point_y2) = goal
-        hce = math.hypot(point_x2 - point_x1, point_y2 - point_y1)
-        return hce
+    def _cell_index(self, coords: tuple[int, int]) -> int:
+        """Where {coords} is in the flat grid"""
+        return coords[0] + 1 + (coords[1] + 1) * self._stride
 
     ##########################################################################
-    def neighbors(self, node: tuple[int, int]) -> list[tuple[int, int]]:
-        """Returns all the places we can reach from node"""
-        node_x, node_y = node
-        ans = []
-        for nbx in range(node_x - 1, node_x + 2):
-            for nby in range(node_y - 1, node_y + 2):
-                if nbx == node_x and nby == node_y:
-                    continue
-                pos = (nbx, nby)
-                try:
-                    if self[pos] is None:
-                        ans.append(pos)
-                except KeyError:  # Skip off the edge
-                    continue
-        return ans
+    def on_grid(self, coords: tuple[int, int]) -> bool:
+        """Are {coords} within the arena"""
+        return 0 <= coords[0] < self.max_x and 0 <= coords[1] < self.max_y
 
     ##############################################################################
     def do_initiative(self) -> None:
         """Roll everyone's initiative and sort"""
-        # ID is here as an ultimate tie breaker
-        tmp = [(_.roll_initiative(), _.stats[Stat.DEX], id(_), _) for _ in self._combatants]
+        # Join order is here as an ultimate tie breaker
+        tmp = [(_.roll_initiative(), _.stats[Stat.DEX], _.join_order, _) for _ in self.roster.pick_everyone()]
         tmp.sort(reverse=True)
-        self._combatants = [_[-1] for _ in tmp]
-        print(f"Initiative: {self._combatants}")
+        self.roster.reorder([_[-1] for _ in tmp])
+        log.info("Initiative: %s", self.roster.pick_everyone())
 
     ##############################################################################
     def turn(self) -> None:
-        """Give all the combatants a turn in initiative order"""
-        for comb in self.pick_everyone():
+        """Give all the combatants a turn in initiative order - the dead don't get one"""
+        for comb in self.roster.not_dead():
             comb.turn()
 
+    ##############################################################################
+    def check_auras(self) -> None:
+        """Let every aura affect whoever is within its radius"""
+        for aura in self.roster.auras():
+            if aura not in self.roster.auras() or not aura.owner.is_alive():
+                continue
+            for comb in self.pick_nearest(aura.owner.coords, lambda _: _.is_alive(), within=aura.aura_radius):
+                aura.hook_start_in_range(comb)
+
+    ##############################################################################
+    def changed(self, comb: Optional[Creature] = None) -> None:
+        """Something has happened that makes remembered decisions stale
+        If it happened to {comb} check whether it is still standing"""
+        self.version += 1
+        if comb is not None:
+            self.roster.check(comb)
+
+    ##############################################################################
+    def broadcast(self, event: str, creat: Creature) -> None:
+        """Tell all the living listeners for {event} (other than {creat}) about {creat}"""
+        for comb, radius in self.roster.listeners(event).items():
+            if comb == creat or not comb.is_alive():
+                continue
+            if radius is not None and self.distance(comb, creat) > radius:
+                continue
+            getattr(comb, event)(creat)
+
     ##############################################################################
     def remove_combatant(self, comb: Creature) -> None:
         """Remove combatant from arena - generally means dead"""
@@ -83,11 +118,13 @@ class Arena(AStar):
     def add_combatant(self, comb: Creature, coords: Optional[tuple[int, int]] = None) -> None:
         """Add a combatant"""
         comb.arena = self
-        self._combatants.append(comb)
+        self.roster.add(comb)
+        comb.roll_hit_points()
+        comb.effects.join_arena(self)
         if coords is None:
             while True:
-                rndx = random.randint(0, self.max_x - 1)
-                rndy = random.randint(0, self.max_y - 1)
+                rndx = self.rng.randint(0, self.max_x - 1)
+                rndy = self.rng.randint(0, self.max_y - 1)
                 if self[(rndx, rndy)] is None:
                     coords = (rndx, rndy)
                     break
@@ -116,145 +153,196 @@ class Arena(AStar):
         dists = []
         result = namedtuple("result", "distance id coord")
         for nbour in self.neighbors(creat.coords):
-            dists.append(result(self.distance_coords(nbour, cause.coords), id(nbour), nbour))
+            dists.append(result(self.distance_coords(nbour, cause.coords), nbour, nbour))
         dists.sort(reverse=True)
         dest = dists[0].coord
         self[creat.coords] = None
         self[dest] = creat
         return dest
 
+    ##############################################################################
+    def moves_used(
+        self, creat: Creature, start: tuple[int, int], end: tuple[int, int]  # pylint: disable=unused-argument
+    ) -> int:
+        """How many of {creat}'s moves getting from {start} to {end} took - one a square"""
+        return 1
+
     ##############################################################################
     def move_towards(self, creat: Creature, target: tuple[int, int]) -> tuple[int, int]:
         """Move the creature creat towards target coords one step"""
-        # We can't move to the target square because it is occupied so no route
-        # so try all the adjacent squares for the shortest route
+        # We can't move to the target square because it is occupied so route
+        # to whichever adjacent square is closest
         assert isinstance(target, tuple)
-        routes = {}
-        for dest in self.neighbors(target):
-            route_iter = self.astar(creat.coords, dest)
-            if route_iter:
-                routes[dest] = list(route_iter)
-
-        if not routes:
-            print(f"{creat} couldn't find path to {target}")
+        route = self._routes.get(creat)
+        if route is None or not self._route_usable(route, creat.coords, target):
+            route = (target, self.find_route(creat.coords, target))
+            self._routes[creat] = route
+
+        steps = route[1]
+        if not steps:
+            log.info("%s couldn't find path to %s", creat, target)
             return creat.coords
 
-        # Now pick the shortest workable route
-        shortest = 999
-        target_adj: tuple[int, int]
-        for dest, rout in routes.items():
-            if rout and len(rout) < shortest:
-                shortest = len(rout)
-                target_adj = dest
-        route = routes[target_adj]
-
         # Are we adjacent - then don't bother moving
-        if len(route) < 2:
+        if len(steps) < 2:
             return creat.coords
 
-        dest = route[1]
-        if self[dest] is not None:
-            print(f"{creat} @ {creat.coords} trying to jump in with {self[dest]} @ {dest}")
+        dest = steps[1]
+        self._routes[creat] = (target, steps[1:])
         self[creat.coords] = None
         self[dest] = creat
         return dest
 
     ##############################################################################
-    def remaining_type(self, creat: Creature, typ_: MonsterType) -> list[Creature]:
-        """Return the remaining combatants of the specified type"""
-        remain = [_ for _ in self.pick_alive() if _.side != creat.side and _.is_type(typ_)]
-        return remain
+    def _route_usable(
+        self, route: tuple[tuple[int, int], list], start: tuple[int, int], target: tuple[int, int]
+    ) -> bool:
+        """Can we keep following a previously found {route}"""
+        route_target, steps = route
+        if route_target != target or not steps or steps[0] != start:
+            return False
+        # Somebody has moved into the way
+        return all(self._cells[self._cell_index(_)] is None for _ in steps[1:])
 
     ##############################################################################
-    def pick_everyone(self) -> list[Creature]:
-        """Return all combatants"""
-        return self._combatants
+    def forget_route(self, creat: Creature) -> None:
+        """{creat} has finished moving - don't reuse its route"""
+        self._routes.pop(creat, None)
 
     ##############################################################################
-    def pick_alive(self) -> list[Creature]:
-        """Return the list of living combatants"""
-        combs = [_ for _ in self._combatants if _.is_alive()]
-        return combs
+    def find_route(self, start: tuple[int, int], target: tuple[int, int]) -> list[tuple[int, int]]:
+        """Shortest route from {start} to any free square next to {target}
+        One breadth first search with all the adjacent squares as goals
+        Empty if there is no way there"""
+        cells = self._cells
+        goals = {self._cell_index(_) for _ in self.neighbors(target)}
+        came_from = {self._cell_index(start): -1}
+        frontier = deque(came_from)
+        while frontier and goals:
+            idx = frontier.popleft()
+            if idx in goals:
+                route = []
+                while idx >= 0:
+                    route.append(self._coords[idx])
+                    idx = came_from[idx]
+                return route[::-1]  # type: ignore
+            for offset in self._neighbour_offsets:
+                nbour = idx + offset
+                if cells[nbour] is None and nbour not in came_from:
+                    came_from[nbour] = idx
+                    frontier.append(nbour)
+        return []
 
     ##############################################################################
-    def pick_closest_friends(self, creat: Creature) -> list[Creature]:
-        """Pick the closest friends to creat sorted by distance"""
-        result = namedtuple("result", "distance id creature")
-        combs = [
-            result(self.distance(creat, _), id(_), _) for _ in self.pick_alive() if _.side == creat.side and _ != creat
-        ]
-        combs.sort()
-        res = [_.creature for _ in combs]
-        return res
+    def pick_closest_friends(
+        self, creat: Creature, count: Optional[int] = None, within: Optional[int] = None
+    ) -> list[Creature]:
+        """Pick the closest friends to creat sorted by distance
+        Only the closest {count} and only those {within} range if specified"""
+        return self.pick_nearest(
+            creat.coords, lambda _: _.side == creat.side and _ != creat and _.is_alive(), count, within
+        )
 
     ##############################################################################
-    def pick_closest_enemy(self, creat: Creature) -> list[Creature]:
-        """Pick the closest enemy creatures to {creat} sorted by distance"""
-        result = namedtuple("result", "distance id creature")
-        combs = [result(self.distance(creat, _), id(_), _) for _ in self.pick_alive() if _.side != creat.side]
-        combs.sort()
-        res = [_.creature for _ in combs]
-        return res
+    def pick_closest_enemy(
+        self, creat: Creature, count: Optional[int] = None, within: Optional[int] = None
+    ) -> list[Creature]:
+        """Pick the closest enemy creatures to {creat} sorted by distance
+        Only the closest {count} and only those {within} range if specified"""
+        return self.pick_nearest(creat.coords, lambda _: _.side != creat.side and _.is_alive(), count, within)
 
     ##############################################################################
-    def still_going(self) -> bool:
-        """Do we still have alive combatants on both sides"""
-        sides = self.remaining_participants_count()
-        if len([_ for _ in sides if _]) > 1:
-            return True
-        return False
+    def pick_nearest(
+        self,
+        coords: tuple[int, int],
+        wanted: Callable[[Any], bool],
+        count: Optional[int] = None,
+        within: Optional[int] = None,
+    ) -> list[Creature]:
+        """The {wanted} combatants nearest {coords} sorted by distance (then join order)
+        Searches outwards a ring of buckets at a time and stops as soon as
+        nothing further out could make the cut"""
+        origin_x, origin_y = coords[0] // BUCKET_SIZE, coords[1] // BUCKET_SIZE
+        max_ring = max(
+            origin_x, (self.max_x - 1) // BUCKET_SIZE - origin_x, origin_y, (self.max_y - 1) // BUCKET_SIZE - origin_y
+        )
+        found = []
+        for ring in range(max_ring + 1):
+            for bucket in self._ring(origin_x, origin_y, ring):
+                for comb, where in self._buckets.get(bucket, {}).items():
+                    if not wanted(comb):
+                        continue
+                    dist = self.distance_coords(coords, where)
+                    if within is None or dist <= within:
+                        found.append((dist, comb.join_order, comb))
+            # Anything in a further ring is at least this far away
+            horizon = ring * BUCKET_SIZE + 1
+            if within is not None and horizon > within:
+                break
+            if count is not None and len([_ for _ in found if _[0] < horizon]) >= count:
+                break
+        found.sort(key=lambda _: (_[0], _[1]))
+        return [_[2] for _ in found[:count]]
 
     ##############################################################################
-    def my_side(self, side: str) -> list[Creature]:
-        """Who is still standing on my side"""
-        return [_ for _ in self.pick_alive() if _.side == side]
+    @staticmethod
+    def _ring(origin_x: int, origin_y: int, ring: int) -> list[tuple[int, int]]:
+        """The buckets {ring} buckets away from the origin bucket"""
+        if ring == 0:
+            return [(origin_x, origin_y)]
+        buckets = []
+        for offset in range(-ring, ring + 1):
+            buckets.append((origin_x + offset, origin_y - ring))
+            buckets.append((origin_x + offset, origin_y + ring))
+        for offset in range(-ring + 1, ring):
+            buckets.append((origin_x - ring, origin_y + offset))
+            buckets.append((origin_x + ring, origin_y + offset))
+        return buckets
 
     ##############################################################################
-    def remaining_participants_count(self) -> defaultdict[str, int]:
-        """How many are still standing"""
-        sides: defaultdict[str, int] = defaultdict(int)
-        for participant in self.pick_alive():
-            sides[participant.side] += 1
-        return sides
+    def _index_remove(self, comb: Any) -> None:
+        """Take {comb} out of the spatial index"""
+        where = self._where.pop(comb)
+        del self._buckets[(where[0] // BUCKET_SIZE, where[1] // BUCKET_SIZE)][comb]
 
     ##############################################################################
-    def winning_side(self) -> str:
-        """Which side won?"""
-        sides = self.remaining_participants_count()
-        return list(sides.keys())[0]
+    def _index_add(self, comb: Any, where: tuple[int, int]) -> None:
+        """Put {comb} into the spatial index at {where}"""
+        self._where[comb] = where
+        self._buckets[(where[0] // BUCKET_SIZE, where[1] // BUCKET_SIZE)][comb] = where
 
     ##############################################################################
     def __setitem__(self, key: tuple[int, int], val: Any) -> None:
         """Change the grid"""
-        assert isinstance(key, tuple)
-        assert isinstance(key[0], int)
-        assert isinstance(key[1], int)
-        assert key[0] >= 0
-        assert key[0] < self.max_x
-        assert key[1] >= 0
-        assert key[1] < self.max_y
-        self.grid[key] = val
+        if not self.on_grid(key):
+            raise KeyError(key)
+        idx = self._cell_index(key)
+        self.version += 1
+        occupant = self._cells[idx]
+        if occupant is not None and self._where.get(occupant) == key:
+            self._index_remove(occupant)
+        if val is not None:
+            if val in self._where:
+                self._index_remove(val)
+            self._index_add(val, key)
+        self._cells[idx] = val
 
     ##############################################################################
     def __getitem__(self, key: tuple[int, int]) -> Any:
         """Access the grid"""
-        return self.grid[key]
+        if not self.on_grid(key):
+            raise KeyError(key)
+        return self._cells[self._cell_index(key)]
 
     ##############################################################################
     def __repr__(self) -> str:
         """Display the grid"""
         output = []
         for j in range(self.max_y):
-            lineout = []
-            for i in range(self.max_x):
-                cell = ""
-                # cell = f"{i},{j}="
-                if self.grid[(i, j)] is None:
-                    cell += "."
-                else:
-                    cell += self.grid[(i, j)].shortrepr()
-                lineout.append(cell)
-            output.append(" ".join(lineout))
+            start = self._cell_index((0, j))
+            end = start + self.max_x
+            row = self._cells[start:end]
+            output.append(" ".join("." if _ is None else _.shortrepr() for _ in row))
         return "\n".join(output)
 
 
@@ -1,11 +1,11 @@
 """ Handle Attacks """
 from typing import Any, TYPE_CHECKING
-import dice
 from pycs.action import Action
 from pycs.damage import Damage
 from pycs.constant import ActionType
 from pycs.constant import Stat
 from pycs.util import check_args
+from pycs.log import log
 
 if TYPE_CHECKING:
     from pycs.creature import Creature
@@ -35,11 +35,11 @@ class Attack(Action):
         response = False
         apa = self.owner.attacks_per_action
         if isinstance(self.attacks_per_action, tuple):
-            apa *= int(dice.roll(self.attacks_per_action[0])) + self.attacks_per_action[1]
+            apa *= self.owner.rng.roll(self.attacks_per_action[0]) + self.attacks_per_action[1]
         elif isinstance(self.attacks_per_action, int):
             apa = self.owner.attacks_per_action
         if apa != 1:
-            print(f"Doing {apa} attacks")
+            log.info("Doing %s attacks", apa)
         for _ in range(apa):
             success = self.do_attack()
             if success:
@@ -95,11 +95,11 @@ class MeleeAttack(Attack):
     ########################################################################
     def heuristic(self) -> int:
         """Should we perform this attack - yes if adjacent"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if not enemy:
             return 0
-        if self.owner.distance(enemy[0]) <= 1:
-            return int(self.max_dmg())
+        if self.owner.decision.distance(enemy[0]) <= 1:
+            return int(self.owner.decision.max_dmg(self))
         return 0
 
 
@@ -127,15 +127,15 @@ class RangedAttack(Attack):
     def heuristic(self) -> int:
         """Should we perform this attack - no if adjacent,
         yes if in range, middling if at long range"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if not enemy:
             return 0
         if not self.available:
             return 0
-        dist = self.owner.distance(enemy[0])
+        dist = self.owner.decision.distance(enemy[0])
         if dist <= 1:
             return 0
-        return int(self.max_dmg())
+        return int(self.owner.decision.max_dmg(self))
 
     ########################################################################
     def range(self) -> tuple[int, int]:
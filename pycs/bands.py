@@ -0,0 +1,127 @@
+""" Quick resolve arena - engaged / near / far range bands rather than a grid """
+from typing import Any, Callable, Optional
+from pycs.arena import Arena
+from pycs.creature import Creature
+
+# The bands along the battlefield - named for how far they are from the middle
+BANDS = ("far", "near", "engaged", "near", "far")
+
+# Squares between neighbouring bands - a creature with a speed of 30ft
+# crosses one a turn
+BAND_WIDTH = 6
+
+# Distance between creatures in the same band - close enough for melee
+ENGAGED = 1
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class BandArena(Arena):
+    """Arena without a grid - for quick, approximate results
+    Everyone is in one of the BANDS and their x coordinate is which. Two
+    creatures in the same band are engaged (distance 1), the next band over
+    is near (BAND_WIDTH squares) and anything further is far. Moving is a
+    move from one band to the next, using up to a band's worth of moves in
+    one go, and nobody blocks anybody.
+    The creatures, actions and effects are exactly the same as on the grid"""
+
+    ##########################################################################
+    def __init__(self, **kwargs: Any):
+        kwargs.update({"max_x": len(BANDS), "max_y": 1})
+        super().__init__(**kwargs)
+        # Which half of the battlefield each side starts in - in the order they join
+        self._halves: dict[Any, int] = {}
+
+    ##########################################################################
+    def add_combatant(self, comb: Creature, coords: Optional[tuple[int, int]] = None) -> None:
+        """Add a combatant - in a random band of their side's half, where the
+        engaged band is in both halves. {coords} on a grid mean nothing here so
+        are ignored"""
+        half = self._halves.setdefault(comb.side, len(self._halves) % 2)
+        middle = len(BANDS) // 2
+        if half == 0:
+            band = self.rng.randint(0, middle)
+        else:
+            band = self.rng.randint(middle, len(BANDS) - 1)
+        super().add_combatant(comb, (band, 0))
+
+    ##########################################################################
+    def distance_coords(self, one: tuple[int, int], two: tuple[int, int]) -> int:
+        """Distance between two points - it only depends on their bands"""
+        bands = abs(one[0] - two[0])
+        return bands * BAND_WIDTH if bands else ENGAGED
+
+    ##########################################################################
+    def moves_used(self, creat: Creature, start: tuple[int, int], end: tuple[int, int]) -> int:
+        """Moving to the next band takes all the moves it takes to cross it"""
+        return min(creat.moves, BAND_WIDTH * abs(end[0] - start[0]))
+
+    ##########################################################################
+    def _step(self, creat: Creature, towards: int) -> tuple[int, int]:
+        """Into the next band towards {towards} - or away if negative
+        It needs at least half a band's worth of moves"""
+        band = creat.coords[0] + towards
+        if not 0 <= band < len(BANDS) or creat.moves < BAND_WIDTH // 2:
+            return creat.coords
+        dest = (band, 0)
+        self[creat.coords] = None
+        self[dest] = creat
+        return dest
+
+    ##########################################################################
+    def move_towards(self, creat: Creature, target: tuple[int, int]) -> tuple[int, int]:
+        """Move a band towards {target} - unless already engaged with it"""
+        if creat.coords[0] == target[0]:
+            return creat.coords
+        return self._step(creat, 1 if target[0] > creat.coords[0] else -1)
+
+    ##########################################################################
+    def move_away(self, creat: Creature, cause: Creature) -> tuple[int, int]:
+        """Move a band away from {cause}"""
+        if cause.coords[0] == creat.coords[0]:
+            # Away from the middle of the battlefield
+            return self._step(creat, -1 if creat.coords[0] <= len(BANDS) // 2 else 1)
+        return self._step(creat, -1 if cause.coords[0] > creat.coords[0] else 1)
+
+    ##########################################################################
+    def pick_nearest(
+        self,
+        coords: tuple[int, int],
+        wanted: Callable[[Any], bool],
+        count: Optional[int] = None,
+        within: Optional[int] = None,
+    ) -> list[Creature]:
+        """The {wanted} combatants nearest {coords} sorted by distance (then join order)"""
+        found = []
+        for comb in self.roster.pick_alive():
+            if not wanted(comb):
+                continue
+            dist = self.distance_coords(coords, comb.coords)
+            if within is None or dist <= within:
+                found.append((dist, comb.join_order, comb))
+        found.sort(key=lambda _: (_[0], _[1]))
+        return [_[2] for _ in found[:count]]
+
+    ##########################################################################
+    def __setitem__(self, key: tuple[int, int], val: Any) -> None:
+        """Nothing is kept - anyone can share a band"""
+        if not self.on_grid(key):
+            raise KeyError(key)
+        self.version += 1
+
+    ##########################################################################
+    def __getitem__(self, key: tuple[int, int]) -> Any:
+        """Never anyone in the way"""
+        return None
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        """Who is in each band"""
+        bands: dict[int, list[str]] = {}
+        for comb in self.roster.pick_alive():
+            bands.setdefault(comb.coords[0], []).append(comb.name)
+        return "\n".join(f"{BANDS[band].title()} ({band}): {', '.join(names)}" for band, names in sorted(bands.items()))
+
+
+# EOF
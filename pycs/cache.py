@@ -0,0 +1,157 @@
+""" Results of seeded combats kept between runs """
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+from typing import Callable
+
+from pycs.rng import Seed
+from pycs.statistics import Statistics
+
+# Where results are kept between runs unless told otherwise
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pycs")
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, "results.sqlite")
+
+# What running some combats gives back - wins per side and their statistics
+Fight = Callable[[int, int], tuple[dict[str, int], Statistics]]
+
+# Which combats some results are for - combats {first} to {first}+{rounds}
+# of {scenario} fought with {seed}
+Combats = namedtuple("Combats", "scenario seed first rounds")
+
+
+##############################################################################
+@lru_cache(maxsize=None)
+def code_version() -> str:
+    """Hash of the rules - every source file in pycs
+    Any change at all means old results can't be trusted"""
+    digest = hashlib.sha256()
+    top = os.path.dirname(os.path.abspath(__file__))
+    for dirpath, dirnames, filenames in os.walk(top):
+        dirnames.sort()
+        for fname in sorted(filenames):
+            if fname.endswith(".py"):
+                path = os.path.join(dirpath, fname)
+                digest.update(os.path.relpath(path, top).encode())
+                with open(path, "rb") as infh:
+                    digest.update(infh.read())
+    return digest.hexdigest()
+
+
+##############################################################################
+def fingerprint(scenario: str) -> str:
+    """Content hash of a description of the combatants"""
+    return hashlib.sha256(scenario.encode()).hexdigest()
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class ResultCache:
+    """Win counts and statistics for ranges of seeded combats in SQLite
+    Keyed by scenario fingerprint, seed, range of combat indexes and the code
+    version - so only the combats not already known need to be fought"""
+
+    ##########################################################################
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """{path} of ":memory:" keeps the results for as long as we exist"""
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS combats (
+                scenario TEXT, version TEXT, seed TEXT, first INTEGER, rounds INTEGER,
+                wins TEXT, stats BLOB, PRIMARY KEY (scenario, version, seed, first, rounds))"""
+        )
+        self._db.commit()
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        return f"<ResultCache {self.path}>"
+
+    ##########################################################################
+    def close(self) -> None:
+        """Finished with the database"""
+        self._db.close()
+
+    ##########################################################################
+    def _chunks(self, scenario: str, seed: Seed, first: int, rounds: int) -> list[tuple[int, int, str, bytes]]:
+        """Stored ranges that are wholly within {first} to {first}+{rounds} -
+        as (first, rounds, wins, stats) and not overlapping each other"""
+        rows = self._db.execute(
+            "SELECT first, rounds, wins, stats FROM combats WHERE scenario=? AND version=? AND seed=?"
+            " AND first >= ? AND first + rounds <= ? ORDER BY first, rounds DESC",
+            (fingerprint(scenario), code_version(), str(seed), first, first + rounds),
+        ).fetchall()
+        chunks = []
+        upto = first
+        for row in rows:
+            if row[0] >= upto:
+                chunks.append(row)
+                upto = row[0] + row[1]
+        return chunks
+
+    ##########################################################################
+    def missing(self, scenario: str, seed: Seed, first: int, rounds: int) -> list[tuple[int, int]]:
+        """The (first, rounds) ranges of combats that would need fighting"""
+        gaps = []
+        upto = first
+        for start, count, _, _ in self._chunks(scenario, seed, first, rounds):
+            if start > upto:
+                gaps.append((upto, start - upto))
+            upto = start + count
+        if upto < first + rounds:
+            gaps.append((upto, first + rounds - upto))
+        return gaps
+
+    ##########################################################################
+    def store(self, combats: Combats, wins: dict[str, int], stats: Statistics) -> None:
+        """Remember the results of the {combats}"""
+        self._db.execute(
+            "INSERT OR REPLACE INTO combats VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                fingerprint(combats.scenario),
+                code_version(),
+                str(combats.seed),
+                combats.first,
+                combats.rounds,
+                json.dumps(wins),
+                pickle.dumps(stats, pickle.HIGHEST_PROTOCOL),
+            ),
+        )
+        self._db.commit()
+
+    ##########################################################################
+    def run(
+        self, scenario: str, seed: Seed, first: int, rounds: int, fight: Fight
+    ) -> tuple[defaultdict[str, int], Statistics]:
+        """The results of combats {first} to {first}+{rounds} of {scenario}
+        Only the ranges that aren't stored are fought - with {fight}(first, rounds)"""
+        winning_stats: defaultdict[str, int] = defaultdict(int)
+        all_stats = Statistics(summary_only=True)
+        upto = first
+        for start, count, wins, stats in self._chunks(scenario, seed, first, rounds) + [(first + rounds, 0, "{}", b"")]:
+            if start > upto:
+                fought_wins, fought_stats = fight(upto, start - upto)
+                self.store(Combats(scenario, seed, upto, start - upto), fought_wins, fought_stats)
+                self._merge(winning_stats, all_stats, fought_wins, fought_stats)
+            if count:
+                self._merge(winning_stats, all_stats, json.loads(wins), pickle.loads(stats))
+            upto = start + count
+        return winning_stats, all_stats
+
+    ##########################################################################
+    @staticmethod
+    def _merge(
+        winning_stats: defaultdict[str, int], all_stats: Statistics, wins: dict[str, int], stats: Statistics
+    ) -> None:
+        for side, won in wins.items():
+            winning_stats[side] += won
+        all_stats += stats
+
+
+# EOF
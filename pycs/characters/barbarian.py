@@ -3,7 +3,6 @@ import unittest
 from typing import Any
 from unittest.mock import patch
 import colors
-import dice
 from pycs.action import Action
 from pycs.arena import Arena
 from pycs.damageroll import DamageRoll
@@ -18,6 +17,8 @@ from pycs.creature import Creature
 from pycs.effect import Effect
 from pycs.gear import Greataxe
 from pycs.monsters import Orc
+from pycs.log import log
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -69,7 +70,7 @@ class Barbarian(Character):
         super().report()
         javs = self.pick_action_by_name("Javelin")
         assert javs is not None
-        print(f"|  Javelins: {javs.ammo}")
+        log.info("|  Javelins: %s", javs.ammo)
 
     ##########################################################################
     def shortrepr(self) -> str:  # pragma: no cover
@@ -228,7 +229,7 @@ class TestBarbarianRage(unittest.TestCase):
         assert axe is not None
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 19  # Hit target
-            with patch.object(dice, "roll") as mock_dice:
+            with patch.object(Rng, "roll") as mock_dice:
                 mock_dice.return_value = 3
                 self.barb.target = self.orc
                 axe.perform_action()
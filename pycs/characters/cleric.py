@@ -26,6 +26,7 @@ from pycs.spells import SacredFlame
 from pycs.spells import ShieldOfFaith
 from pycs.spells import SpiritGuardians
 from pycs.spells import SpiritualWeapon
+from pycs.log import log
 
 
 ##############################################################################
@@ -101,7 +102,7 @@ class Cleric(Character):
     def report(self) -> None:
         """Character report"""
         super().report()
-        print(f"|  Spells: {self.spell_slots}")
+        log.info("|  Spells: %s", self.spell_slots)
 
     ##########################################################################
     def spell_available(self, spell: SpellAction) -> bool:
@@ -164,7 +165,7 @@ class TurnUndead(Action):
     def heuristic(self) -> int:
         """Should we do this"""
         heur = 0
-        undead = self.owner.arena.remaining_type(self.owner, MonsterType.UNDEAD)
+        undead = self.owner.arena.roster.remaining_type(self.owner, MonsterType.UNDEAD)
         for und in undead:
             if self.owner.arena.distance(self.owner, und) <= 30 / 5:
                 heur += und.hp
@@ -173,19 +174,19 @@ class TurnUndead(Action):
     ##########################################################################
     def perform_action(self) -> bool:
         """Do the action"""
-        undead = self.owner.arena.remaining_type(self.owner, MonsterType.UNDEAD)
+        undead = self.owner.arena.roster.remaining_type(self.owner, MonsterType.UNDEAD)
         self.owner.channel_divinity -= 1
         for und in undead:
             if self.owner.arena.distance(self.owner, und) <= 30 / 5:
                 if not und.saving_throw(Stat.WIS, self.owner.spellcast_save):
                     if und.challenge is None:
-                        print(f"ERROR: Need to specify challenge rating of {und}")
+                        log.error("Need to specify challenge rating of %s", und)
                         continue
                     if und.challenge <= self.owner.destroy_undead:
-                        print(f"{und} has been destroyed by {self.owner}")
+                        log.info("%s has been destroyed by %s", und, self.owner)
                         und.hit(Damage(und.hp, DamageType.RADIANT), self.owner, False, "Turn Undead")
                     else:
-                        print(f"{und} has been turned by {self.owner}")
+                        log.info("%s has been turned by %s", und, self.owner)
                         und.add_effect(TurnedUndeadEffect(cause=self.owner))
         return True
 
@@ -3,7 +3,6 @@ from typing import Any
 import unittest
 from unittest.mock import patch
 import colors
-import dice
 from pycs.action import Action
 from pycs.arena import Arena
 from pycs.damageroll import DamageRoll
@@ -17,6 +16,7 @@ from pycs.effect import Effect
 from pycs.gear import LightCrossbow
 from pycs.gear import Mace
 from pycs.monsters import Orc
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -185,7 +185,7 @@ class TestDuelingFightingStyle(unittest.TestCase):
         self.fighter.target = self.orc
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 19
-            with patch.object(dice, "roll") as mock_dice:  # damage roll
+            with patch.object(Rng, "roll") as mock_dice:  # damage roll
                 mock_dice.return_value = 1
                 act.perform_action()
         # 1 for mace, 3 for str, 2 for fighting style
@@ -200,7 +200,7 @@ class TestDuelingFightingStyle(unittest.TestCase):
         self.fighter.target = self.orc
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 19
-            with patch.object(dice, "roll") as mock_dice:  # damage roll
+            with patch.object(Rng, "roll") as mock_dice:  # damage roll
                 mock_dice.return_value = 1
                 act.perform_action()
         # 1 for weap, 2 for dex
@@ -231,7 +231,7 @@ class TestSecondWind(unittest.TestCase):
         self.fighter.hp = 10
         after = act.heuristic()
         self.assertGreater(after, 0)
-        with patch.object(dice, "roll") as mock_dice:  # healing roll
+        with patch.object(Rng, "roll") as mock_dice:  # healing roll
             mock_dice.return_value = 4
             act.perform_action()
         # Original 10 + 4 for healing + 5 for level
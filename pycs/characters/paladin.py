@@ -17,6 +17,7 @@ from pycs.spells import CureWounds
 from pycs.spells import LesserRestoration
 from pycs.spells import Sanctuary
 from pycs.spells import ShieldOfFaith
+from pycs.log import log
 
 # from pycs.spells.protection_from_poison import Protection_From_Poison
 
@@ -120,8 +121,8 @@ class Paladin(Character):
     def report(self) -> None:
         """Character report"""
         super().report()
-        print(f"|  Lay On Hands: {self.lay_on_hands}")
-        print(f"|  Spells: {self.spell_slots}")
+        log.info("|  Lay On Hands: %s", self.lay_on_hands)
+        log.info("|  Spells: %s", self.spell_slots)
 
     ########################################################################
     def shortrepr(self) -> str:  # pragma: no cover
@@ -149,10 +150,10 @@ class LayOnHands(Action):
     def perform_action(self) -> bool:
         """Do the action"""
         if self.owner.lay_on_hands >= 5 and self.owner.target.has_condition(Condition.POISONED):
-            print(f"{self.owner} lays on hands to {self.owner.target} and cures them of poison")
+            log.info("%s lays on hands to %s and cures them of poison", self.owner, self.owner.target)
             self.owner.lay_on_hands -= 5
             self.owner.target.remove_condition(Condition.POISONED)
-        print(f"{self.owner} lays on hands to {self.owner.target} to heal them")
+        log.info("%s lays on hands to %s to heal them", self.owner, self.owner.target)
         chp = min(self.owner.lay_on_hands, self.owner.target.max_hp - self.owner.target.hp)
         self.owner.lay_on_hands -= self.owner.target.heal("", chp)
         return True
@@ -162,7 +163,7 @@ class LayOnHands(Action):
         """Should we do this action"""
         if self.owner.lay_on_hands == 0:
             return 0
-        friends = self.owner.pick_closest_friends()
+        friends = self.owner.pick_closest_friends(count=1)
         if not friends:
             return 0
         friend = friends[0]
@@ -173,7 +174,7 @@ class LayOnHands(Action):
     ########################################################################
     def pick_target(self) -> Optional[Creature]:
         """Who are we doing the action to"""
-        friends = self.owner.pick_closest_friends()
+        friends = self.owner.pick_closest_friends(count=1)
         if friends:
             return friends[0]
         return None
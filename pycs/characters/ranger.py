@@ -4,7 +4,6 @@ import unittest
 from collections import namedtuple
 from unittest.mock import patch
 import colors
-import dice
 from pycs.action import Action
 from pycs.arena import Arena
 from pycs.attack import RangedAttack
@@ -22,6 +21,8 @@ from pycs.spell import SpellAction
 from pycs.spells import CureWounds
 from pycs.spells import HuntersMark
 from pycs.spells import LesserRestoration
+from pycs.log import log
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -85,22 +86,22 @@ class Ranger(Character):
         s_range = action.range()[0]
         result = namedtuple("result", "hp id creature")
         combs = [
-            result(_.hp, id(_), _)
-            for _ in self.arena.pick_alive()
+            result(_.hp, _.join_order, _)
+            for _ in self.arena.roster.pick_alive()
             if _.side != self.side and self.distance(_) <= s_range
         ]
         if not combs:
-            print(f"No targets with range ({s_range}) of {action.name}")
+            log.info("No targets with range (%s) of %s", s_range, action.name)
             return None
 
         hmark = [_ for _ in combs if _.creature.has_effect("Hunters Mark")]
         if hmark:
-            print(f"Picking on {hmark[0].creature} as has hunters mark")
+            log.info("Picking on %s as has hunters mark", hmark[0].creature)
             return hmark[0].creature
 
         combs.sort()
         target = combs[0].creature
-        print(f"Picking on {target} as has fewest hp")
+        log.info("Picking on %s as has fewest hp", target)
         return target
 
     ##########################################################################
@@ -126,7 +127,7 @@ class Ranger(Character):
     def report(self) -> None:
         """Character report"""
         super().report()
-        print(f"|  Spells: {self.spell_slots}")
+        log.info("|  Spells: %s", self.spell_slots)
 
     ##########################################################################
     def shortrepr(self) -> str:  # pragma: no cover
@@ -152,10 +153,10 @@ class RangersRangedAttack(RangedAttack):
         if not self.available:
             return 0
         hmark = [_ for _ in enemies if _.has_effect("Hunters Mark")]
-        dist = self.owner.distance(enemies[0])
+        dist = self.owner.decision.distance(enemies[0])
         if dist <= 1:
             return 0
-        return int(self.max_dmg()) + 4 * len(hmark)
+        return int(self.owner.decision.max_dmg(self)) + 4 * len(hmark)
 
     ########################################################################
     def pick_target(self) -> Optional[Creature]:
@@ -280,12 +281,12 @@ class TestColussusSlayer(unittest.TestCase):
         self.assertTrue(self.ranger.has_effect("Colossus Slayer"))
         act = self.ranger.pick_action_by_name("Shortbow")
         assert act is not None
-        with patch.object(dice, "roll") as mock:
+        with patch.object(Rng, "roll") as mock:
             mock.return_value = 2
             act.buff_attack_damage(self.skel)
         self.assertEqual(self.skel.hp, self.skel.max_hp - 2)
         # Shouldn't happen twice in a turn
-        with patch.object(dice, "roll") as mock:
+        with patch.object(Rng, "roll") as mock:
             mock.return_value = 2
             act.buff_attack_damage(self.skel)
         self.assertEqual(self.skel.hp, self.skel.max_hp - 2)
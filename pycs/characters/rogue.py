@@ -3,7 +3,6 @@ from typing import Any
 import unittest
 from unittest.mock import patch
 import colors
-import dice
 from pycs.action import Action
 from pycs.arena import Arena
 from pycs.character import Character
@@ -16,6 +15,8 @@ from pycs.creature import Creature
 from pycs.effect import Effect
 from pycs.gear import Shortsword
 from pycs.monsters import Orc
+from pycs.log import log
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -92,7 +93,7 @@ class UncannyDodge(Action):
     ##########################################################################
     def hook_predmg(self, dmg: Damage, source: Creature, critical: bool) -> Damage:
         """Half damage"""
-        print("Using uncanny dodge to reduce damage")
+        log.info("Using uncanny dodge to reduce damage")
         dmg //= 2
         return dmg
 
@@ -168,17 +169,17 @@ class SneakAttack(Effect):
         if allies:
             if allies[0].distance(target) <= 1:
                 allies_adjacent = True
-                print(f"Ally {allies[0]} adjacent to {target}")
+                log.info("Ally %s adjacent to %s", allies[0], target)
 
         rnge = source.distance(target)
         if allies_adjacent and attack.has_disadvantage(target, rnge):
-            print("but it doesn't matter as we have disadvantage")
+            log.info("but it doesn't matter as we have disadvantage")
             allies_adjacent = False
 
         if not allies_adjacent:
             if not attack.has_advantage(target, rnge):
                 return DamageRoll()
-            print("We have advantage on attack")
+            log.info("We have advantage on attack")
         self._used_this_turn = True
         return DamageRoll(self.owner.sneak_attack_dmg, 0)  # type: ignore
 
@@ -206,7 +207,7 @@ class TestSneakAttack(unittest.TestCase):
         self.rogue.target = self.orc
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 19  # Hit target
-            with patch.object(dice, "roll") as mock_dice:
+            with patch.object(Rng, "roll") as mock_dice:
                 mock_dice.return_value = 3
                 act.perform_action()
         self.assertEqual(self.orc.hp, self.orc.max_hp - 6)  # 3 for dmg, 3 for stat
@@ -222,7 +223,7 @@ class TestSneakAttack(unittest.TestCase):
         self.rogue.target = self.orc
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 19  # Hit target
-            with patch.object(dice, "roll") as mock_dice:
+            with patch.object(Rng, "roll") as mock_dice:
                 mock_dice.return_value = 3
                 act.perform_action()
         self.assertEqual(self.orc.hp, self.orc.max_hp - 6 - 3)  # Additional 3 dmg
@@ -230,7 +231,7 @@ class TestSneakAttack(unittest.TestCase):
         # Attack again - should not be another sneak
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 19  # Hit target
-            with patch.object(dice, "roll") as mock_dice:
+            with patch.object(Rng, "roll") as mock_dice:
                 mock_dice.return_value = 3
                 act.perform_action()
         self.assertEqual(self.orc.hp, self.orc.max_hp - 6 - 3 - 6)
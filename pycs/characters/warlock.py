@@ -17,6 +17,7 @@ from pycs.spells import PoisonSpray
 from pycs.spells import ScorchingRay
 from pycs.spells import Shatter
 from pycs.spells import Thunderclap
+from pycs.log import log
 
 
 ##############################################################################
@@ -85,7 +86,7 @@ class Warlock(Character):
     ##########################################################################
     def report(self) -> None:
         super().report()
-        print(f"|  Spells: {self.spell_slots}")
+        log.info("|  Spells: %s", self.spell_slots)
 
     ########################################################################
     def spell_available(self, spell: SpellAction) -> bool:
@@ -1,21 +1,67 @@
 #!/usr/bin/env python3
 """Console script for pycs."""
 import sys
+from typing import Optional
 import click
 import pycs
+from pycs.cache import ResultCache
+from pycs.log import set_level, QUIET, NORMAL, VERBOSE
+
+# Most combats to run with --target-ci when --rounds isn't given
+MAX_ROUNDS = 10000
 
 
 ##############################################################################
 @click.command()
-@click.option("--rounds", help="Number of rounds to run", default=1)
-def main(rounds: int) -> int:
-    """Console script for pycs."""
-    pycs.start(rounds)
+@click.option(
+    "--rounds", type=int, default=None, help=f"Number of rounds to run [default: 1, or {MAX_ROUNDS} with --target-ci]"
+)
+@click.option("--workers", help="Number of processes to run the rounds across", default=1)
+@click.option("--seed", help="Seed the dice so runs can be repeated", default=None)
+@click.option(
+    "--target-ci",
+    type=float,
+    default=None,
+    help="Run until each side's 95% win rate interval is narrower than this - with --rounds as the most to run",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(sorted(pycs.ENGINES)),
+    default="grid",
+    show_default=True,
+    help="Fight on a grid, or in range bands for quicker but rougher results",
+)
+@click.option("--quiet", is_flag=True, help="Only report the overall results")
+@click.option("--no-cache", is_flag=True, help="Fight every combat even if the results are already known")
+@click.option("--verbose", is_flag=True, help="Also report how each action was chosen")
+def main(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    rounds: Optional[int],
+    workers: int,
+    seed: str,
+    target_ci: Optional[float],
+    engine: str,
+    quiet: bool,
+    no_cache: bool,
+    verbose: bool,
+) -> int:
+    """Console script for pycs.
+    Quiet, seeded runs keep their results in a cache - the combats aren't
+    reported so there is nothing lost by not fighting them again"""
+    if quiet:
+        set_level(QUIET)
+    elif verbose:
+        set_level(VERBOSE)
+    else:
+        set_level(NORMAL)
+    if rounds is None:
+        rounds = 1 if target_ci is None else MAX_ROUNDS
+    cache = ResultCache() if quiet and seed is not None and not no_cache else None
+    pycs.start(rounds, workers, seed, target_ci, cache, engine)
     return 0
 
 
 ##############################################################################
 if __name__ == "__main__":
-    sys.exit(main(1))  # pragma: no cover
+    sys.exit(main())  # pragma: no cover  # pylint: disable=no-value-for-parameter
 
 # EOF
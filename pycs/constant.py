@@ -1,5 +1,5 @@
 """ Constants used everywhere """
-from enum import Enum
+from enum import Enum, IntFlag, auto
 
 
 ##############################################################################
@@ -27,26 +27,44 @@ class DamageType(Enum):
 ##############################################################################
 ##############################################################################
 ##############################################################################
-class Condition(Enum):
-    """Conditions"""
+class Condition(IntFlag):
+    """Conditions - a creature keeps all of its conditions as one bitmask"""
 
-    BLINDED = "blinded"
-    CHARMED = "charmed"
-    DEAD = "dead"
-    DEAFENED = "deafened"
-    EXHAUSTION = "exhaustion"
-    FRIGHTENED = "frightened"
-    GRAPPLED = "grappled"
-    INCAPACITATED = "incapacitated"
-    INVISIBLE = "invisible"
-    OK = "ok"
-    PARALYZED = "paralyzed"
-    PETRIFIED = "petrified"
-    POISONED = "poisoned"
-    PRONE = "prone"
-    RESTRAINED = "restrained"
-    STUNNED = "stunned"
-    UNCONSCIOUS = "unconscious"
+    BLINDED = auto()
+    CHARMED = auto()
+    DEAD = auto()
+    DEAFENED = auto()
+    EXHAUSTION = auto()
+    FRIGHTENED = auto()
+    GRAPPLED = auto()
+    INCAPACITATED = auto()
+    INVISIBLE = auto()
+    OK = auto()
+    PARALYZED = auto()
+    PETRIFIED = auto()
+    POISONED = auto()
+    PRONE = auto()
+    RESTRAINED = auto()
+    STUNNED = auto()
+    UNCONSCIOUS = auto()
+
+    ##########################################################################
+    def describe(self) -> str:
+        """Lower case name for the log - each of them for a mask such as DOWN"""
+        return ", ".join(name.lower() for name, flag in type(self).__members__.items() if flag & self)
+
+
+# Conditions that take a creature out of the fight
+DOWN = Condition.DEAD | Condition.UNCONSCIOUS
+
+# Conditions of an attacker that give it disadvantage
+HINDERED = Condition.POISONED | Condition.FRIGHTENED | Condition.PRONE
+
+# Conditions of a target that give advantage to any attacker
+EXPOSED = Condition.BLINDED | Condition.RESTRAINED
+
+# Conditions of a target that give advantage to attackers next to it
+EXPOSED_TO_MELEE = Condition.UNCONSCIOUS | Condition.PRONE
 
 
 ##############################################################################
@@ -2,17 +2,15 @@
 # pylint: disable=too-many-public-methods
 from __future__ import annotations
 
-import random
 from collections import defaultdict
 from collections import namedtuple
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Optional, Any, Callable, Union, TYPE_CHECKING
 
-import dice
 from pycs.action import Action
 from pycs.damage import Damage
 from pycs.constant import ActionCategory
 from pycs.constant import ActionType
-from pycs.constant import Condition
+from pycs.constant import Condition, DOWN
 from pycs.constant import DamageType
 from pycs.constant import MonsterSize
 from pycs.constant import MonsterType
@@ -22,12 +20,42 @@ from pycs.equipment import Armour, Equipment
 from pycs.attack import Attack
 from pycs.effects import Effects
 from pycs.spell import SpellAction
+from pycs.log import log, NORMAL, VERBOSE
+from pycs.rng import Rng, Dice, DEFAULT_RNG
+from pycs.decision import DecisionContext
 
 
 if TYPE_CHECKING:
     from pycs.effect import Effect
     from pycs.arena import Arena
 
+# An action in contention in _pick_action() - sorts best first
+ActTuple = namedtuple("ActTuple", "qual rnd heur pref act")
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class Stats(dict):
+    """A creature's stats - changing one makes the creature forget what it
+    worked out from them"""
+
+    ##########################################################################
+    def __init__(self, owner: "Creature", stats: dict[Stat, int]):
+        super().__init__(stats)
+        self._owner = owner
+
+    ##########################################################################
+    def __setitem__(self, stat: Stat, value: int) -> None:
+        super().__setitem__(stat, value)
+        self._owner.forget_derived()
+
+    ##########################################################################
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__() rather than __setitem__() - when copying
+        # or unpickling the owner may not be finished yet
+        return (Stats, (self._owner, dict(self)))
+
 
 ##############################################################################
 ##############################################################################
@@ -35,10 +63,18 @@ if TYPE_CHECKING:
 class Creature:  # pylint: disable=too-many-instance-attributes
     """Parent class for all creatures - monsters and characters"""
 
+    # How close to us hook_see_someone_die() and start_others_turn() need to
+    # happen for us to care - anything not here is heard from anywhere
+    hook_radius: dict[str, int] = {}
+
     ##########################################################################
     def __init__(self, **kwargs: Any):
         check_args(self._valid_args(), self.__class__.__name__, kwargs)
         self.arena: "Arena"  # Set by adding to arena
+        self.join_order = 0  # Set by adding to arena - reproducible tie breaker
+        self._decision: Optional[DecisionContext] = None
+        # Values worked out from stats, gear and effects - see derived()
+        self._derived: dict[Any, Any] = {}
         self.name = kwargs.get("name", self.__class__.__name__)
         self._ac = kwargs.get("ac", None)
         self.speed = int(kwargs.get("speed", 30) / 5)
@@ -48,14 +84,17 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         self.critical = kwargs.get("critical", 20)
         self.prof_bonus = kwargs.get("prof_bonus", 2)
         self.side = kwargs["side"]  # Mandatory
-        self.stats = {
-            Stat.STR: kwargs["str"],
-            Stat.INT: kwargs["int"],
-            Stat.DEX: kwargs["dex"],
-            Stat.WIS: kwargs["wis"],
-            Stat.CON: kwargs["con"],
-            Stat.CHA: kwargs["cha"],
-        }
+        self.stats = Stats(
+            self,
+            {
+                Stat.STR: kwargs["str"],
+                Stat.INT: kwargs["int"],
+                Stat.DEX: kwargs["dex"],
+                Stat.WIS: kwargs["wis"],
+                Stat.CON: kwargs["con"],
+                Stat.CHA: kwargs["cha"],
+            },
+        )
         self.stat_prof = kwargs.get("stat_prof", [])
         self.spellcast_bonus_stat: Stat = kwargs.get("spellcast_bonus_stat", Stat.INT)
         self.action_preference = kwargs.get("action_preference", {ActionType.MELEE: 1, ActionType.RANGED: 4})
@@ -76,7 +115,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         for act in kwargs.get("actions", []):
             self.add_action(act)
 
-        self.conditions = set([Condition.OK])
+        self._conditions = int(Condition.OK)
 
         self.effects = Effects(self)
         for effect in kwargs.get("effects", []):
@@ -129,18 +168,55 @@ class Creature:  # pylint: disable=too-many-instance-attributes
             "gear",
         }
 
+    ##########################################################################
+    @property
+    def rng(self) -> Rng:
+        """Where our dice rolls come from - the arena's if we are in one
+        Streams are by name so creatures with the same name share one"""
+        arena = getattr(self, "arena", None)  # Only set once added to an arena
+        if arena is None:
+            return DEFAULT_RNG
+        return arena.rng.stream(self.name)
+
+    ##########################################################################
+    def roll_hit_points(self) -> None:
+        """Roll for hit points when joining an arena - most creatures have a fixed amount"""
+
     ##########################################################################
     @property
     def spellcast_save(self) -> int:
         """Saving throw DC vs spells from this creature"""
+        return self.derived("spellcast_save", self._spellcast_save)
+
+    ##########################################################################
+    def _spellcast_save(self) -> int:
         if self.spellcast_bonus_stat is None:
             return 0
         return 8 + self.stat_bonus(self.spellcast_bonus_stat) + self.prof_bonus
 
+    ##########################################################################
+    def derived(self, key: Any, work_out: Callable[[], Any]) -> Any:
+        """The value of {key} - only calling {work_out} if it isn't known
+        since the stats, gear or effects last changed"""
+        try:
+            return self._derived[key]
+        except KeyError:
+            self._derived[key] = work_out()
+            return self._derived[key]
+
+    ##########################################################################
+    def forget_derived(self) -> None:
+        """Something the derived values depend on has changed"""
+        self._derived.clear()
+
     ##########################################################################
     @property
     def ac(self) -> int:  # pylint: disable=invalid-name
         """The armour class"""
+        return self.derived("ac", self._armour_class)
+
+    ##########################################################################
+    def _armour_class(self) -> int:
         if self._ac is None:
             tmp = 0
             dbon = True  # Can we apply dex bonus
@@ -168,23 +244,23 @@ class Creature:  # pylint: disable=too-many-instance-attributes
     ##########################################################################
     def stat_bonus(self, stat: Stat) -> int:
         """What's the stat bonus for the stat"""
-        return int((self.stats[stat] - 10) / 2)
+        return self.derived(stat, lambda: int((self.stats[stat] - 10) / 2))
 
     ##########################################################################
-    def heal(self, cure_dice: str, cure_bonus: int) -> int:
+    def heal(self, cure_dice: Union[str, Dice], cure_bonus: int) -> int:
         """Heal ourselves"""
         chp = 0
         if cure_dice:
-            chp = int(dice.roll(cure_dice))
+            chp = self.rng.roll(cure_dice)
         chp += cure_bonus
         chp = min(chp, self.max_hp - self.hp)
         self.hp += chp
-        print(f"{self} cured of {chp} hp")
+        log.info("%s cured of %s hp", self, chp)
         if self.has_condition(Condition.UNCONSCIOUS):
             self.death_saves = 0
             self.add_condition(Condition.OK)
             self.remove_condition(Condition.UNCONSCIOUS)
-            print(f"{self} regained consciousness")
+            log.info("%s regained consciousness", self)
         return chp
 
     ##########################################################################
@@ -202,10 +278,10 @@ class Creature:  # pylint: disable=too-many-instance-attributes
             self.has_grappled = enemy
             enemy.grappled_by = self
             enemy.escape_grapple_dc = escape_dc
-            print(f"{self} has grappled {enemy} ({grap} > {targ})")
+            log.info("%s has grappled %s (%s > %s)", self, enemy, grap, targ)
             enemy.add_condition(Condition.GRAPPLED)
             return True
-        print(f"{self} failed to grapple {enemy} ({grap} < {targ})")
+        log.info("%s failed to grapple %s (%s < %s)", self, enemy, grap, targ)
         return False
 
     ##########################################################################
@@ -218,23 +294,23 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         victim.grappled_by = None
         victim.remove_condition(Condition.GRAPPLED)
         self.has_grappled = None
-        print(f"{self} is no longer grappling {victim}")
+        log.info("%s is no longer grappling %s", self, victim)
 
     ##########################################################################
-    def pick_closest_enemy(self) -> list[Creature]:
+    def pick_closest_enemy(self, count: Optional[int] = None, within: Optional[int] = None) -> list[Creature]:
         """Which enemy is the closest"""
-        return self.arena.pick_closest_enemy(self)
+        return self.decision.closest_enemies(count, within)
 
     ##########################################################################
-    def pick_closest_friends(self) -> list:
+    def pick_closest_friends(self, count: Optional[int] = None, within: Optional[int] = None) -> list:
         """Which friend is the closest"""
-        return self.arena.pick_closest_friends(self)
+        return self.decision.closest_friends(count, within)
 
     ##########################################################################
     def saving_throw(self, stat: Stat, dc: int, **kwargs: Any) -> bool:  # pylint: disable=invalid-name
         """Make a saving throw against a stat"""
         if self.has_condition(Condition.UNCONSCIOUS) and stat in (Stat.STR, Stat.DEX):
-            print(f"{self} automatically failed {stat.value} saving throw as unconscious")
+            log.info("%s automatically failed %s saving throw as unconscious", self, stat.value)
             return False
         effct = {"bonus": 0}
         effct.update(self.effects.hook_saving_throw(stat, **kwargs))
@@ -253,9 +329,9 @@ class Creature:  # pylint: disable=too-many-instance-attributes
 
         save += effct["bonus"] + self.stat_bonus(stat)
         if save >= dc:
-            print(f"{self} made {stat.value} saving throw: {save} vs DC {dc} {msg}")
+            log.info("%s made %s saving throw: %s vs DC %s %s", self, stat.value, save, dc, msg)
             return True
-        print(f"{self} failed {stat.value} saving throw: {save} vs DC {dc} {msg}")
+        log.info("%s failed %s saving throw: %s vs DC %s %s", self, stat.value, save, dc, msg)
         return False
 
     ##########################################################################
@@ -263,35 +339,34 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         """Roll initiative"""
         init = self.rolld20("initiative")
         init += self.stat_bonus(Stat.DEX)
-        print(f"{self} rolled {init} for initiative")
+        log.info("%s rolled %s for initiative", self, init)
         return init
 
     ##########################################################################
     def move_to_target(self, target: Creature, rnge: Optional[int]) -> None:
         """Move closer to the target - until we are in range of our action"""
         if self.has_condition(Condition.GRAPPLED):
-            print(f"{self} is grappled - not moving")
+            log.info("%s is grappled - not moving", self)
             return
         if self.has_grappled:
-            print(f"{self} has grappled {self.has_grappled}- not moving")
+            log.info("%s has grappled %s- not moving", self, self.has_grappled)
             return
-        for _ in range(self.moves):
+        while self.moves > 0:
             # Within range - don't move
             dist = self.distance(target)
             if rnge and dist <= rnge:
-                return
+                break
 
             # Have to check every move if we are in any effect area
-            for partic in self.arena.pick_alive():
-                for comb in self.arena.pick_alive():
-                    partic.effects.hook_start_in_range(comb)
+            self.arena.check_auras()
 
             old_coords = self.coords
             self.coords = self.arena.move_towards(self, target.coords)
             if old_coords == self.coords:
                 break
-            self.moves -= 1
-            print(f"{self} moving towards {target} - moved to {self.coords}: {self.moves} left")
+            self.moves -= self.arena.moves_used(self, old_coords, self.coords)
+            log.info("%s moving towards %s - moved to %s: %s left", self, target, self.coords, self.moves)
+        self.arena.forget_route(self)
 
     ##########################################################################
     def pick_action_by_name(self, name: str) -> Optional[Action]:
@@ -305,7 +380,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         for atk in self.reactions:
             if atk.name == name:
                 return atk
-        print(f"{self}: pick_action_by_name({name=}) - none found")
+        log.info("%s: pick_action_by_name(name=%r) - none found", self, name)
         return None
 
     ##########################################################################
@@ -313,23 +388,23 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         """We've been hit by source - take damage"""
         dmg = self._react_predmg(dmg, source, critical)
         if dmg.type in self.vulnerable:
-            print(f"{self} is vulnerable to {dmg.type.value}")
+            log.info("%s is vulnerable to %s", self, dmg.type.value)
             dmg.hp *= 2
         if dmg.type in self.immunity:
-            print(f"{self} is immune to {dmg.type.value}")
+            log.info("%s is immune to %s", self, dmg.type.value)
             dmg.hp = 0
         if dmg.type in self.resistant:
-            print(f"{self} is resistant to {dmg.type.value}")
+            log.info("%s is resistant to %s", self, dmg.type.value)
             dmg.hp //= 2
         dmg = self.effects.hook_being_hit(dmg)
 
-        print(f"{self} has taken {dmg} from {atkname}")
+        log.info("%s has taken %s from %s", self, dmg, atkname)
         self.hp -= dmg.hp
-        print(f"{self} now has {self.hp} HP")
+        log.info("%s now has %s HP", self, self.hp)
         if dmg and self.concentration:
             svth = self.saving_throw(Stat.CON, max(10, dmg.hp // 2))
             if not svth:
-                print(f"{self} failed concentration save on {self.concentration}")
+                log.info("%s failed concentration save on %s", self, self.concentration)
                 self.remove_concentration()
 
         self.arena.statistics.add(target=self, source=source, hit=True, atkname=atkname, dmg=dmg, critical=critical)
@@ -353,7 +428,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
             return dmg
         react = self._pick_action(typ=ActionCategory.REACTION, target=source, need_hook="hook_predmg")
         if react is not None:
-            print(f"{self} reacts against {source}")
+            log.info("%s reacts against %s", self, source)
             dmg = react.hook_predmg(dmg=dmg, source=source, critical=critical)
             self.options_this_turn.remove(ActionCategory.REACTION)
         return dmg
@@ -365,33 +440,58 @@ class Creature:  # pylint: disable=too-many-instance-attributes
             return
         react = self._pick_action(typ=ActionCategory.REACTION, target=source, need_hook="hook_postdmg")
         if react is not None:
-            print(f"{self} reacts against {source}")
+            log.info("%s reacts against %s", self, source)
             react.hook_postdmg()
             self.options_this_turn.remove(ActionCategory.REACTION)
 
+    ##########################################################################
+    @property
+    def conditions(self) -> Condition:
+        """All of our conditions - iterate over it for each one"""
+        return Condition(self._conditions)
+
     ##########################################################################
     def has_condition(self, *conditions: Condition) -> bool:
-        """Do we have a condition"""
+        """Do we have any of the conditions - each can be a mask such as DOWN"""
+        # Plain ints - int & IntFlag would go through the (slow) Flag operators
+        mask = 0
         for cond in conditions:
-            if cond in self.conditions:
-                return True
-        return False
+            mask |= int(cond)
+        return bool(self._conditions & mask)
 
     ##########################################################################
     def remove_condition(self, cond: Condition) -> None:
         """Remove a condition"""
         if self.has_condition(cond):
-            self.conditions.remove(cond)
+            self._conditions &= ~int(cond)
+            self._arena_changed()
 
     ##########################################################################
     def add_condition(self, cond: Condition, source: Optional[Creature] = None) -> None:
         """Add a condition - inflicted by source"""
         if cond not in self.cond_immunity:
-            if source:
-                print(f"{self} got {cond.value} from {source}")
-            else:
-                print(f"{self} is now {cond.value}")
-            self.conditions.add(cond)
+            if log.isEnabledFor(NORMAL):
+                if source:
+                    log.info("%s got %s from %s", self, cond.describe(), source)
+                else:
+                    log.info("%s is now %s", self, cond.describe())
+            self._conditions |= int(cond)
+            self._arena_changed()
+
+    ##########################################################################
+    def _arena_changed(self) -> None:
+        """Let the arena know something has changed about us"""
+        arena = getattr(self, "arena", None)  # Only set once added to an arena
+        if arena is not None:
+            arena.changed(self)
+
+    ##########################################################################
+    @property
+    def decision(self) -> DecisionContext:
+        """What we know about our situation - only as fresh as the arena"""
+        if self._decision is None or not self._decision.valid():
+            self._decision = DecisionContext(self)
+        return self._decision
 
     ##########################################################################
     def add_gear(self, gear: Equipment) -> None:
@@ -401,6 +501,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         for action in gear.actions:
             action.gear = gear
             self.add_action(action)
+        self.forget_derived()
 
     ##########################################################################
     def add_action(self, action: Action) -> None:
@@ -416,9 +517,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
     ##########################################################################
     def is_alive(self) -> bool:
         """return True if the creature is alive and conscious"""
-        if self.has_condition(Condition.DEAD) or self.has_condition(Condition.UNCONSCIOUS):
-            return False
-        return True
+        return not self.has_condition(DOWN)
 
     ##########################################################################
     def shortrepr(self) -> str:
@@ -433,10 +532,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         self.hp = 0
         if self.has_grappled:
             self.ungrapple()
-        for comb in self.arena.pick_alive():
-            if comb == self:
-                continue
-            comb.hook_see_someone_die(self)
+        self.arena.broadcast("hook_see_someone_die", self)
         self.creature_fallen_unconscious(dmg, critical)
 
     ##########################################################################
@@ -458,7 +554,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         """Are the any effects for the end of the turn"""
         self.effects.removal_end_of_its_turn(self)
         if draw and self.has_condition(Condition.OK):
-            print(self.arena)
+            log.info("%s", self.arena)
 
     ##########################################################################
     def remove_effect(self, effect: Effect | str) -> None:
@@ -478,26 +574,28 @@ class Creature:  # pylint: disable=too-many-instance-attributes
     ##########################################################################
     def report(self) -> None:
         """Short report on the character"""
-        print(f"| {self.name} @ {self.coords}")
-        print(f"|  HP: {self.hp} / {self.max_hp}")
-        print(f"|  AC: {self.ac}")
+        if not log.isEnabledFor(NORMAL):
+            return
+        log.info("| %s @ %s", self.name, self.coords)
+        log.info("|  HP: %s / %s", self.hp, self.max_hp)
+        log.info("|  AC: %s", self.ac)
         if self.concentration:
-            print(f"|  Concentration: {self.concentration}")
+            log.info("|  Concentration: %s", self.concentration)
         if self.conditions:
-            print(f"|  Conditions: {', '.join([_.value for _ in self.conditions])}")
+            log.info("|  Conditions: %s", self.conditions.describe())
         if self.effects:
-            print(f"|  Effects: {str(self.effects)}")
+            log.info("|  Effects: %s", str(self.effects))
         if self.has_grappled:
-            print(f"|  Grappling {self.has_grappled}")
+            log.info("|  Grappling %s", self.has_grappled)
         if self.grappled_by:
-            print(f"|  Grappled by {self.grappled_by}")
+            log.info("|  Grappled by %s", self.grappled_by)
         if self.damage_this_turn:
-            print(f"|  Damage This Turn: {self.damage_summary(self.damage_this_turn)}")
+            log.info("|  Damage This Turn: %s", self.damage_summary(self.damage_this_turn))
         if self.damage_last_turn:
-            print(f"|  Damage Last Turn: {self.damage_summary(self.damage_last_turn)}")
+            log.info("|  Damage Last Turn: %s", self.damage_summary(self.damage_last_turn))
         for act in self.actions + self.bonus_actions + self.reactions:
             if act.ammo is not None:
-                print(f"|  {act} Ammo: {act.ammo}")
+                log.info("|  %s Ammo: %s", act, act.ammo)
 
     ##########################################################################
     def damage_summary(self, dmglist: list[Damage]) -> str:
@@ -555,26 +653,19 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         """
         # The random is added a) as a tie breaker for sort b) for a bit of fun
         actions = []
-        acttuple = namedtuple("acttuple", "qual rnd heur pref act")
         for heur, act in self._possible_actions(typ):
             if need_hook and not hasattr(act, need_hook):
                 continue
-            if act.__class__ in self.action_preference:
-                pref = self.action_preference.get(act.__class__)
-            elif issubclass(act.__class__, SpellAction):
-                pref = self.action_preference.get(act.type, 1)
-            elif issubclass(act.__class__, Attack):
-                pref = self.action_preference.get(act.type, 1)
-            else:
-                pref = self.action_preference.get(act, 1)
+            pref = self._action_pref(act)
             if heur * pref != 0:
-                actions.append(acttuple(heur * pref, random.random(), heur, pref, act))
+                actions.append(ActTuple(heur * pref, self.rng.random(), heur, pref, act))
             else:
-                print(f"\t{typ.value} Not {heur=},  {pref=},  {act=}")
+                log.debug("\t%s Not heur=%r,  pref=%r,  act=%r", typ.value, heur, pref, act)
         actions.sort(reverse=True)
 
-        for act in actions:
-            print(f"\t{act}")
+        if log.isEnabledFor(VERBOSE):
+            for act in actions:
+                log.debug("\t%s", act)
         if not actions:
             return None
 
@@ -585,22 +676,31 @@ class Creature:  # pylint: disable=too-many-instance-attributes
             self.target = target
         return action
 
+    ##########################################################################
+    def _action_pref(self, act: Action) -> int:
+        """How much we like doing {act} - by its class, then by its type"""
+        if act.__class__ in self.action_preference:
+            return self.action_preference[act.__class__]
+        if isinstance(act, (SpellAction, Attack)):
+            return self.action_preference.get(act.type, 1)
+        return self.action_preference.get(act, 1)
+
     ##########################################################################
     def _make_death_save(self) -> None:
         """Death Saves - going to ignore stabilising"""
-        roll = int(dice.roll("d20"))
-        print(f"{self} rolled {roll} on death saving throw")
+        roll = self.rng.d20()
+        log.info("%s rolled %s on death saving throw", self, roll)
         if roll == 1:
             self.death_saves += 2
-            print(f"{self} badly failed a death saving throw - at {self.death_saves}")
+            log.info("%s badly failed a death saving throw - at %s", self, self.death_saves)
         elif roll <= 10:
             self.death_saves += 1
-            print(f"{self} failed a death saving throw - at {self.death_saves}")
+            log.info("%s failed a death saving throw - at %s", self, self.death_saves)
         elif roll == 20:
-            print(f"{self} gasps back to life")
+            log.info("%s gasps back to life", self)
             self.heal("", 1)
         else:
-            print(f"{self} made a death saving throw - at {self.death_saves}")
+            log.info("%s made a death saving throw - at %s", self, self.death_saves)
 
         if self.death_saves >= 3:
             self.died()
@@ -637,22 +737,18 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         if not self.has_condition(Condition.OK):
             self.options_this_turn = []
         if self.has_condition(Condition.PRONE):
-            print(f"{self} gets up from being prone")
+            log.info("%s gets up from being prone", self)
             self.moves = int(self.speed / 2)
             self.remove_condition(Condition.PRONE)
         else:
             self.moves = self.speed
         self.effects.hook_start_turn()
 
-        for part in self.arena.pick_alive():
-            for comb in self.arena.pick_alive():
-                part.effects.hook_start_in_range(comb)
+        self.arena.check_auras()
 
-        for creat in self.arena.pick_alive():
-            if creat == self:
-                creat.hook_start_turn()
-                continue
-            creat.start_others_turn(self)
+        if self.is_alive():
+            self.hook_start_turn()
+        self.arena.broadcast("start_others_turn", self)
 
     ##########################################################################
     def start_others_turn(self, creat: Creature) -> None:
@@ -667,10 +763,13 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         """Move away from the {cause}"""
         if cause.coords is None:  # Cause is dead?
             return
-        for _ in range(self.moves):
+        while self.moves > 0:
+            old_coords = self.coords
             self.coords = self.arena.move_away(self, cause)
-            self.moves -= 1
-            print(f"{self} moved to {self.coords}: {self.moves} left")
+            if old_coords == self.coords:
+                break
+            self.moves -= self.arena.moves_used(self, old_coords, self.coords)
+            log.info("%s moved to %s: %s left", self, self.coords, self.moves)
 
     ##########################################################################
     def move(self, act: Optional[Action]) -> None:
@@ -698,11 +797,11 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         """Do a dash action"""
         # Dash if we aren't in range yet
         if self.target is None:
-            enemies = self.pick_closest_enemy()
+            enemies = self.pick_closest_enemy(count=1)
             if enemies:
                 self.target = enemies[0]
         if self.target is not None:
-            print(f"{self} dashing")
+            log.info("%s dashing", self)
             self.moves = self.speed
             self.options_this_turn.remove(ActionCategory.ACTION)
             self.move_to_target(self.target, None)
@@ -716,7 +815,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         # What are we going to do this turn
         act = self._pick_action(categ)
         if act is None:
-            victims = self.pick_closest_enemy()
+            victims = self.pick_closest_enemy(count=1)
             if victims:
                 self.target = victims[0]
 
@@ -726,11 +825,10 @@ class Creature:  # pylint: disable=too-many-instance-attributes
 
         # Do the action
         if act:
-            msg = f"{self} is going to do {act} to"
             if self.target == self:
-                print(f"{msg} self as {categ.value}")
+                log.info("%s is going to do %s to self as %s", self, act, categ.value)
             else:
-                print(f"{msg} {self.target} as {categ.value}")
+                log.info("%s is going to do %s to %s as %s", self, act, self.target, categ.value)
             did_act = self.do_action(act)
             if did_act and act.action_cost:
                 self.options_this_turn.remove(categ)
@@ -739,7 +837,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
     def add_concentration(self, spell: "SpellAction") -> None:
         """Start a new concentration spell"""
         if self.concentration:
-            print(f"{self} removing {self.concentration} as casting {spell}")
+            log.info("%s removing %s as casting %s", self, self.concentration, spell)
             self.remove_concentration()
         self.concentration = spell
 
@@ -754,7 +852,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
     ##########################################################################
     def rolld20(self, reason: str) -> int:
         """Roll a d20"""
-        d20 = int(dice.roll("d20"))
+        d20 = self.rng.d20()
         d20 = self.effects.hook_d20(d20, reason)
         return d20
 
@@ -769,7 +867,7 @@ class Creature:  # pylint: disable=too-many-instance-attributes
         """Have a go"""
         if self.has_condition(Condition.DEAD):
             return
-        print()
+        log.info("")
         self.report()
         self.start_turn()
         if not self.flee():
@@ -816,10 +914,10 @@ class BreakGrapple(Action):
             escape += enemy.stat_bonus(Stat.STR)
 
         if targ > escape:
-            print(f"{self.owner} has broken grapple of {enemy} ({targ} > {escape})")
+            log.info("%s has broken grapple of %s (%s > %s)", self.owner, enemy, targ, escape)
             self.owner.grappled_by.ungrapple()
         else:
-            print(f"{self.owner} failed to break grapple of {enemy} ({targ} < {escape})")
+            log.info("%s failed to break grapple of %s (%s < %s)", self.owner, enemy, targ, escape)
         return True
 
 
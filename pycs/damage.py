@@ -4,7 +4,11 @@ from pycs.constant import DamageType
 
 
 class Damage:
-    """Represents damage"""
+    """Represents damage
+    One is made for every hit, bonus and modifier so it is slotted - no
+    per-instance __dict__"""
+
+    __slots__ = ("hp", "type")
 
     def __init__(self, hp: int = 0, type_: DamageType = DamageType.NONE):
         self.hp = hp
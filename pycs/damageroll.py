@@ -1,34 +1,37 @@
 """ Damage Roll"""
-
-import dice
+from typing import Optional
 from pycs.constant import DamageType
 from pycs.damage import Damage
+from pycs.rng import Rng, DEFAULT_RNG, compile_dice
 
 
 class DamageRoll:
     """Basic Damage Roll"""
 
+    __slots__ = ("diceroll", "dice", "bonus", "type")
+
     def __init__(self, roll: str = "", bonus: int = 0, type_: DamageType = DamageType.NONE):
         self.diceroll: str = roll
+        self.dice = compile_dice(roll) if roll else None
         self.bonus: int = bonus
         self.type: DamageType = type_
 
     def __repr__(self) -> str:
         return f"<DamageRoll {self.diceroll}+{self.bonus} of {self.type}>"
 
-    def roll(self) -> Damage:
-        """Roll for damage"""
+    def roll(self, rng: Optional[Rng] = None) -> Damage:
+        """Roll for damage - using the arena's {rng} when there is one"""
         dmg: int = 0
-        if self.diceroll:
-            dmg += int(dice.roll(self.diceroll))
+        if self.dice:
+            dmg += (rng or DEFAULT_RNG).roll(self.dice)
         dmg += self.bonus
         return Damage(dmg, self.type)
 
     def roll_max(self) -> Damage:
         """Maximum damage"""
         dmg: int = 0
-        if self.diceroll:
-            dmg += int(dice.roll_max(self.diceroll))
+        if self.dice:
+            dmg += self.dice.max
         dmg += self.bonus
         return Damage(dmg, self.type)
 
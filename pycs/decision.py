@@ -0,0 +1,71 @@
+""" Memoized inputs for deciding what to do """
+from typing import Any, Optional, TYPE_CHECKING
+from pycs.damage import Damage
+
+if TYPE_CHECKING:
+    from pycs.action import Action
+    from pycs.creature import Creature
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class DecisionContext:
+    """What an action's heuristic wants to know about {owner}'s situation
+    Each answer is worked out once and kept until the arena changes - see
+    Arena.version"""
+
+    ##########################################################################
+    def __init__(self, owner: "Creature"):
+        self.owner = owner
+        self.version = owner.arena.version
+        self._cache: dict[Any, Any] = {}
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        return f"<DecisionContext {self.owner} @ {self.version}>"
+
+    ##########################################################################
+    def valid(self) -> bool:
+        """Has nothing changed since we were created"""
+        return self.owner.arena.version == self.version
+
+    ##########################################################################
+    def closest_enemies(self, count: Optional[int] = None, within: Optional[int] = None) -> list["Creature"]:
+        """Memoized Arena.pick_closest_enemy()"""
+        key = ("enemies", count, within)
+        if key not in self._cache:
+            self._cache[key] = self.owner.arena.pick_closest_enemy(self.owner, count, within)
+        return list(self._cache[key])
+
+    ##########################################################################
+    def closest_friends(self, count: Optional[int] = None, within: Optional[int] = None) -> list["Creature"]:
+        """Memoized Arena.pick_closest_friends()"""
+        key = ("friends", count, within)
+        if key not in self._cache:
+            self._cache[key] = self.owner.arena.pick_closest_friends(self.owner, count, within)
+        return list(self._cache[key])
+
+    ##########################################################################
+    def my_side(self) -> list["Creature"]:
+        """Memoized Roster.my_side() - who is still standing on our side"""
+        if "my_side" not in self._cache:
+            self._cache["my_side"] = self.owner.arena.roster.my_side(self.owner.side)
+        return list(self._cache["my_side"])
+
+    ##########################################################################
+    def distance(self, other: "Creature") -> int:
+        """Memoized distance from the owner to {other}"""
+        key = ("distance", other)
+        if key not in self._cache:
+            self._cache[key] = self.owner.arena.distance(self.owner, other)
+        return self._cache[key]
+
+    ##########################################################################
+    def max_dmg(self, action: "Action") -> Damage:
+        """Memoized {action}.max_dmg() - it depends on the owner's stats and gear
+        rather than the arena so it is kept with the other Creature.derived() values"""
+        return self.owner.derived(("max_dmg", action), action.max_dmg)
+
+
+# EOF
@@ -14,7 +14,11 @@ if TYPE_CHECKING:
 ##############################################################################
 ##############################################################################
 class Effect:
-    """A single effect"""
+    """A single effect
+    Effects with an {aura_radius} get hook_start_in_range() called for
+    everyone within that many squares of the owner"""
+
+    aura_radius: Optional[int] = None
 
     ##########################################################################
     def __init__(self, name: str, **kwargs: Any):
@@ -5,12 +5,17 @@ from pycs.effect import Effect
 from pycs.constant import Stat
 from pycs.damage import Damage
 from pycs.action import Action
+from pycs.log import log, NORMAL
 
 
 if TYPE_CHECKING:
+    from pycs.arena import Arena
     from pycs.creature import Creature
     from pycs.damageroll import DamageRoll
 
+# Effect methods that are only dispatched to the effects that override them
+HOOKS = tuple(_ for _ in dir(Effect) if _.startswith(("hook_", "removal_")))
+
 
 ##############################################################################
 ##############################################################################
@@ -22,6 +27,8 @@ class Effects:
         self._owner = owner
         self._effects: dict[str, Effect] = {}
         self._iter_index: list[str] = []
+        # hook name -> (effect name, effect) for the effects that implement it
+        self._hooked: dict[str, list[tuple[str, Effect]]] = {}
 
     ##########################################################################
     def __str__(self) -> str:
@@ -46,12 +53,33 @@ class Effects:
     def add_effect(self, source: "Creature", effect: Effect) -> None:
         """Add an effect"""
         assert isinstance(effect, Effect)
+        replaced = self._effects.get(effect.name)
+        if replaced is not None and replaced.aura_radius is not None:
+            self._aura_changed("remove_aura", replaced)
         self._effects[effect.name] = effect
-        print(f"{effect.name} added to {self._owner}")
+        log.info("%s added to %s", effect.name, self._owner)
         effect.owner = self._owner
         effect.cause = source
+        self._rebuild_hooks()
+        if effect.aura_radius is not None:
+            self._aura_changed("add_aura", effect)
         effect.initial(self._owner)
 
+    ##########################################################################
+    def join_arena(self, arena: "Arena") -> None:
+        """Our owner has been added to {arena} - any auras we already have start working"""
+        for eff in self._effects.values():
+            if eff.aura_radius is not None:
+                arena.roster.add_aura(eff)
+
+    ##########################################################################
+    def _aura_changed(self, how: str, effect: Effect) -> None:
+        """Let the arena know about {effect} - if our owner isn't in one yet
+        join_arena() catches up"""
+        arena = getattr(self._owner, "arena", None)  # Only set once added to an arena
+        if arena is not None:
+            getattr(arena.roster, how)(effect)
+
     ##########################################################################
     def remove_effect(self, effect: Effect | str) -> None:
         """Add an effect"""
@@ -59,11 +87,31 @@ class Effects:
             try:
                 effect = self._effects[effect]
             except KeyError:
-                print(f"Warning: Removal of non-existant effect {effect} from {str(self)}")
+                log.warning("Warning: Removal of non-existant effect %s from %s", effect, self)
                 return
         self._effects[effect.name].finish(self._owner)
-        print(f"{effect.name} removed from {self._owner}")
+        log.info("%s removed from %s", effect.name, self._owner)
+        if self._effects[effect.name].aura_radius is not None:
+            self._aura_changed("remove_aura", self._effects[effect.name])
         del self._effects[effect.name]
+        self._rebuild_hooks()
+
+    ##########################################################################
+    def _rebuild_hooks(self) -> None:
+        """Work out which effects need calling for each hook
+        Always new lists so a hook can safely remove effects as it goes"""
+        hooked: dict[str, list[tuple[str, Effect]]] = {}
+        for name, eff in self._effects.items():
+            for hook in HOOKS:
+                if hook in vars(eff) or getattr(type(eff), hook) is not getattr(Effect, hook):
+                    hooked.setdefault(hook, []).append((name, eff))
+        self._hooked = hooked
+        self._owner.forget_derived()
+
+    ##########################################################################
+    def _implementing(self, hook: str) -> list[tuple[str, Effect]]:
+        """The effects (and their names) that do something for {hook}"""
+        return self._hooked.get(hook, [])
 
     ##########################################################################
     def remove_all_effects(self) -> None:
@@ -84,7 +132,7 @@ class Effects:
     def hook_ac_modifier(self) -> int:
         """Modification of AC"""
         tmp = 0
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_ac_modifier"):
             mod = eff.hook_ac_modifier()
             tmp += mod
         return tmp
@@ -93,7 +141,7 @@ class Effects:
     def hook_saving_throw(self, stat: Stat, **kwargs: Any) -> dict[str, int]:
         """Saving throw been made"""
         result = {}
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_saving_throw"):
             result.update(eff.hook_saving_throw(stat, **kwargs))
         return result
 
@@ -103,7 +151,7 @@ class Effects:
         Return True is creature still falls unconscious after hook
         """
         result = True
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_fallen_unconscious"):
             if not eff.hook_fallen_unconscious(dmg, critical):
                 result = False
         return result
@@ -113,14 +161,14 @@ class Effects:
         """Owner of effect has suffered damage
         The order here is important but unimplemented!
         """
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_being_hit"):
             dmg = eff.hook_being_hit(dmg)
         return dmg
 
     ##########################################################################
     def hook_gives_advantage_against(self) -> bool:
         """Gives advantage against creature who has effect"""
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_gives_advantage_against"):
             if eff.hook_gives_advantage_against():
                 return True
         return False
@@ -128,7 +176,7 @@ class Effects:
     ##########################################################################
     def hook_gives_disadvantage_against(self) -> bool:
         """Gives disadvantage against creature who has effect"""
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_gives_disadvantage_against"):
             if eff.hook_gives_disadvantage_against():
                 return True
         return False
@@ -136,7 +184,7 @@ class Effects:
     ##########################################################################
     def hook_gives_advantage(self, target: "Creature") -> bool:
         """Gives advantage for creature doing the attack"""
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_gives_advantage"):
             if eff.hook_gives_advantage(target):
                 return True
         return False
@@ -144,7 +192,7 @@ class Effects:
     ##########################################################################
     def hook_gives_disadvantage(self, target: "Creature") -> bool:
         """Gives disadvantage for creature doing the attack"""
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_gives_disadvantage"):
             if eff.hook_gives_disadvantage(target):
                 return True
         return False
@@ -153,7 +201,7 @@ class Effects:
     def hook_heuristic_mod(self, action: Action, actor: "Creature") -> int:
         """Modification to the actions {action} heuristic"""
         tmp = 0
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_heuristic_mod"):
             mod = eff.hook_heuristic_mod(action, actor)
             tmp += mod
         return tmp
@@ -161,25 +209,27 @@ class Effects:
     ##########################################################################
     def removal_after_being_attacked(self) -> None:
         """Do we remove the effect after being turned"""
-        for _, eff in self._effects.copy().items():
+        for _, eff in self._implementing("removal_after_being_attacked"):
             if eff.removal_after_being_attacked():
                 self.remove_effect(eff)
 
     ##########################################################################
     def hook_source_additional_damage(self, attack: Action, source: "Creature", target: "Creature") -> None:
         """Addition damage from melee weapons based on the owner of the effect"""
-        for atkname, eff in self._effects.copy().items():
+        for atkname, eff in self._implementing("hook_source_additional_damage"):
             o_dmgroll: DamageRoll = eff.hook_source_additional_damage(attack, source, target)
             if o_dmgroll:
-                dmg = o_dmgroll.roll()
+                dmg = o_dmgroll.roll(self._owner.rng)
                 target.hit(dmg, self._owner, critical=False, atkname=atkname)
 
     ##########################################################################
     def hook_target_additional_damage(self, attack: Action, source: "Creature", target: "Creature") -> None:
         """Addition damage from melee weapons based on the owner of the effect"""
-        for atkname, eff in self._effects.copy().items():
+        for atkname, eff in self._implementing("hook_target_additional_damage"):
             t_dmgroll: DamageRoll = eff.hook_target_additional_damage(attack, source, target)
-            dmg = t_dmgroll.roll()
+            if not t_dmgroll:
+                continue
+            dmg = t_dmgroll.roll(self._owner.rng)
             if dmg:
                 target.hit(dmg, self._owner, critical=False, atkname=atkname)
 
@@ -188,37 +238,38 @@ class Effects:
         """Modify the roll to hit on attacks"""
         msg: list[str] = []
         to_hit: int = 0
-        for name, eff in self._effects.items():
+        for name, eff in self._implementing("hook_attack_to_hit"):
             mod = eff.hook_attack_to_hit(target=target, range=range_, action=action)
             if mod:
                 to_hit += mod
-                msg.append(f"+{mod} from {name}")
+                if log.isEnabledFor(NORMAL):
+                    msg.append(f"+{mod} from {name}")
         return to_hit, msg
 
     ##########################################################################
     def hook_start_turn(self) -> None:
         """We start the turn with an effect"""
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_start_turn"):
             eff.hook_start_turn()
 
     ##########################################################################
     def removal_end_of_its_turn(self, victim: "Creature") -> None:
         """Do we remove this effect and the end of the victims turn"""
-        for _, eff in self._effects.copy().items():
+        for _, eff in self._implementing("removal_end_of_its_turn"):
             if eff.removal_end_of_its_turn(victim):
                 self.remove_effect(eff)
 
     ##########################################################################
     def hook_start_in_range(self, creat: "Creature") -> None:
         """Did we start our turn in range of any effect"""
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_start_in_range"):
             eff.hook_start_in_range(creat)
 
     ##########################################################################
     def hook_d20(self, val: int, reason: str) -> int:
         """We have rolled {val} on a d20 for {reason}"""
         newval = val
-        for _, eff in self._effects.items():
+        for _, eff in self._implementing("hook_d20"):
             newval = eff.hook_d20(newval, reason)
         return newval
 
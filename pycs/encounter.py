@@ -0,0 +1,59 @@
+""" Armies described once and copied into each combat """
+import pickle
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pycs.arena import Arena
+    from pycs.creature import Creature
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class Encounter:
+    """The combatants for a fight - built once as prototypes
+    The prototypes are pickled together and every arena gets its own copies
+    by unpickling - much cheaper than running all the constructors again.
+    Hit points and placement are rolled by the arena as the copies join it"""
+
+    ##########################################################################
+    def __init__(self, *armies: Callable[[Any], None]):
+        """Each of {armies} is called with the encounter to add its prototypes"""
+        # What the combatants are - for caching results. Only known if they
+        # come from the army functions, otherwise whoever adds them can set it
+        self.scenario: Optional[str] = ",".join(f"{_.__module__}.{_.__qualname__}" for _ in armies) or None
+        self._prototypes: list["Creature"] = []
+        self._coords: list[Optional[tuple[int, int]]] = []
+        self._pickled: Optional[bytes] = None
+        for army in armies:
+            army(self)
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        return f"<Encounter {len(self)} combatants>"
+
+    ##########################################################################
+    def __len__(self) -> int:
+        return len(self._prototypes)
+
+    ##########################################################################
+    def add_combatant(self, comb: "Creature", coords: Optional[tuple[int, int]] = None) -> None:
+        """Add a prototype - same arguments as Arena.add_combatant() so the
+        army functions can fill either"""
+        self._prototypes.append(comb)
+        self._coords.append(coords)
+        self._pickled = None
+
+    ##########################################################################
+    def populate(self, arena: "Arena") -> list["Creature"]:
+        """Add fresh copies of all of the prototypes to {arena}"""
+        if self._pickled is None:
+            # All in one go so shared objects (classes, enums) are only stored once
+            self._pickled = pickle.dumps(self._prototypes, pickle.HIGHEST_PROTOCOL)
+        combatants = pickle.loads(self._pickled)
+        for comb, coords in zip(combatants, self._coords):
+            arena.add_combatant(comb, coords)
+        return combatants
+
+
+# EOF
@@ -1,6 +1,5 @@
 """ All sorts of equipment """
 from typing import Any, TYPE_CHECKING, cast
-import dice
 from pycs.action import Action
 from pycs.attack import MeleeAttack
 from pycs.attack import RangedAttack
@@ -8,6 +7,7 @@ from pycs.constant import ActionCategory
 from pycs.constant import ActionType
 from pycs.constant import Stat
 from pycs.damageroll import DamageRoll
+from pycs.rng import compile_dice
 from pycs.util import check_args
 
 if TYPE_CHECKING:
@@ -238,6 +238,7 @@ class HealingPotion(Potion):
     def __init__(self, name: str, **kwargs: Any):
         """init"""
         self.cure_dice = cast(str, kwargs.get("cure_dice"))
+        self.cure = compile_dice(self.cure_dice)
         self.cure_bonus = cast(int, kwargs.get("cure_bonus"))
         super().__init__(name, **kwargs)
         self.act.type = ActionType.HEALING
@@ -245,12 +246,12 @@ class HealingPotion(Potion):
     ##########################################################################
     def perform_action(self) -> None:
         """Drink the healing potion"""
-        self.owner.heal(self.cure_dice, self.cure_bonus)
+        self.owner.heal(self.cure, self.cure_bonus)
 
     ##########################################################################
     def heuristic(self) -> int:
         """Should we drink the potion"""
-        maxcure = int(dice.roll_max(self.cure_dice)) + self.cure_bonus
+        maxcure = self.cure.max + self.cure_bonus
         return min(self.owner.max_hp - self.owner.hp, maxcure)
 
     ##########################################################################
@@ -0,0 +1,42 @@
+""" Combat event logging """
+import logging
+
+# Output levels - QUIET only lets the final reports through
+QUIET = logging.WARNING
+NORMAL = logging.INFO
+VERBOSE = logging.DEBUG
+
+log = logging.getLogger("pycs")
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class ConsoleHandler(logging.Handler):
+    """Write messages to wherever stdout currently points - like print()"""
+
+    ##########################################################################
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            print(self.format(record))
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+##############################################################################
+def set_level(level: int) -> None:
+    """Set how much of the combat is reported"""
+    log.setLevel(level)
+
+
+##############################################################################
+def get_level() -> int:
+    """Return the current reporting level"""
+    return log.level
+
+
+log.addHandler(ConsoleHandler())
+log.propagate = False
+set_level(NORMAL)
+
+# EOF
@@ -1,8 +1,8 @@
 """ Base Monster Class """
 from typing import Any
-import dice
 from pycs.creature import Creature
 from pycs.damage import Damage
+from pycs.rng import compile_dice
 from pycs.util import check_args
 
 
@@ -17,11 +17,20 @@ class Monster(Creature):
         self.challenge = kwargs.get("challenge")
         hitdice = kwargs.get("hitdice")
         hitpoints = kwargs.get("hp")
-        if hitpoints is None and hitdice is not None:
-            kwargs["hp"] = max(1, int(dice.roll(hitdice)))
+        # Only roll for hit points if we weren't told how many we have. They
+        # are rolled as we join an arena - until then we have the average
+        self.hitdice = hitdice if hitpoints is None else None
+        if self.hitdice is not None:
+            kwargs["hp"] = max(1, int(compile_dice(self.hitdice).mean))
 
         super().__init__(**kwargs)
 
+    ##########################################################################
+    def roll_hit_points(self) -> None:
+        """Reroll the hit dice using the arena's dice"""
+        if self.hitdice is not None:
+            self.hp = self.max_hp = max(1, self.rng.roll(self.hitdice))
+
     ##########################################################################
     def _valid_args(self) -> set[str]:
         """What is valid in this class for kwargs"""
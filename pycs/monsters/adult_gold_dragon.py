@@ -2,7 +2,6 @@
 from collections import namedtuple
 from typing import Any, Optional
 import colors
-import dice
 from pycs.action import Action
 from pycs.attack import Attack
 from pycs.attack import MeleeAttack
@@ -14,6 +13,7 @@ from pycs.creature import Creature
 from pycs.damageroll import DamageRoll
 from pycs.effect import Effect
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -48,15 +48,15 @@ class AdultGoldDragon(Monster):
     def hook_start_turn(self) -> None:
         """Recharge breath weapon on 5/6"""
         if not self.breath:
-            if int(dice.roll("d6")) in (5, 6):
-                print(f"{self} regains breath weapon")
+            if self.rng.roll("d6") in (5, 6):
+                log.info("%s regains breath weapon", self)
                 self.breath = True
 
     ##########################################################################
     def report(self) -> None:
         """Creature Report"""
         super().report()
-        print(f"|  Breath Weapon: {self.breath}")
+        log.info("|  Breath Weapon: %s", self.breath)
 
     ##########################################################################
     def shortrepr(self) -> str:
@@ -171,7 +171,7 @@ class DragonFireBreath(Attack):
         """Pick on the strongest enemy"""
         result = namedtuple("result", "health id target")
         targets = [
-            result(_.hp, id(_), _)
+            result(_.hp, _.join_order, _)
             for _ in self.owner.pick_closest_enemy()
             if self.owner.distance(_) < 60 / 5 and DamageType.FIRE not in _.immunity
         ]
@@ -186,7 +186,7 @@ class DragonFireBreath(Attack):
         target = self.pick_target()
         if target is None:
             return False
-        dmg = DamageRoll("12d10", 0, DamageType.FIRE).roll()
+        dmg = DamageRoll("12d10", 0, DamageType.FIRE).roll(self.rng)
         svth = target.saving_throw(Stat.DEX, 21)
         if svth:
             dmg //= 2
@@ -66,7 +66,7 @@ class BDMeleeAttack(MeleeAttack):
     ##########################################################################
     def heuristic(self) -> int:
         """Should we do the action"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if enemy and self.owner.distance(enemy[0]) <= 1:
             return 10
         return 0
@@ -74,7 +74,7 @@ class BDMeleeAttack(MeleeAttack):
     ##########################################################################
     def pick_target(self) -> Optional[Creature]:
         """Who we should do the action against"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if not enemy:
             return None
         return enemy[0]
@@ -104,7 +104,7 @@ class BDRangedAttack(RangedAttack):
     ##########################################################################
     def heuristic(self) -> int:
         """Should we do the action"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if not enemy:
             return 0
         if self.owner.distance(enemy[0]) <= 1:
@@ -114,7 +114,7 @@ class BDRangedAttack(RangedAttack):
     ##########################################################################
     def pick_target(self) -> Optional[Creature]:
         """Who we should attack"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if not enemy:
             return None
         return enemy[0]
@@ -14,6 +14,7 @@ from pycs.creature import Creature
 from pycs.damageroll import DamageRoll
 from pycs.effect import Effect
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -22,6 +23,8 @@ from pycs.monster import Monster
 class Ghast(Monster):
     """Ghast Monster Class"""
 
+    hook_radius = {"start_others_turn": 1}
+
     ##########################################################################
     def __init__(self, **kwargs: Any):
         kwargs.update(
@@ -114,14 +117,14 @@ class GhastStenchEffect(Effect):
         """Use the effect to store the immunity"""
         self.target = target
         if self.immune:
-            print(f"{target} is immune to the stench")
+            log.info("%s is immune to the stench", target)
             return
         svth = target.saving_throw(Stat.CON, 10, effect=Condition.POISONED)
         if not svth:
-            print(f"{target} got poisoned by Ghast stench")
+            log.info("%s got poisoned by Ghast stench", target)
             target.add_condition(Condition.POISONED)
         else:
-            print(f"{target} resisted Ghast stench")
+            log.info("%s resisted Ghast stench", target)
             self.immune = True
 
     ##########################################################################
@@ -132,7 +135,7 @@ class GhastStenchEffect(Effect):
         if not self.immune:
             svth = self.target.saving_throw(Stat.CON, 10, effect=Condition.POISONED)
             if svth:
-                print("Made saving throw - immune to Ghast stench")
+                log.info("Made saving throw - immune to Ghast stench")
                 self.target.remove_condition(Condition.POISONED)
                 self.immune = True
 
@@ -157,14 +160,14 @@ class GhastClawEffect(Effect):
         svth = target.saving_throw(Stat.CON, 10, effect=Condition.PARALYZED)
         if not svth:
             target.add_condition(Condition.PARALYZED)
-            print(f"{target} paralyzed by Ghast Claws")
+            log.info("%s paralyzed by Ghast Claws", target)
 
     ##########################################################################
     def removal_end_of_its_turn(self, victim: Creature) -> bool:
         """Check to see if victim can recover from claws"""
         svth = victim.saving_throw(Stat.CON, 10, effect=Condition.PARALYZED)
         if svth:
-            print(f"{victim} no longer paralyzed")
+            log.info("%s no longer paralyzed", victim)
             victim.remove_condition(Condition.PARALYZED)
             return True
         return False
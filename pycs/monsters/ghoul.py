@@ -13,6 +13,7 @@ from pycs.creature import Creature
 from pycs.damageroll import DamageRoll
 from pycs.effect import Effect
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -61,10 +62,10 @@ class Ghoul(Monster):
         """Implement Side Effect of Ghoul Claws"""
         svth = target.saving_throw(Stat.CON, 10, effect=Condition.PARALYZED)
         if not svth:
-            print(f"{target} got paralysed by {source} (+{dmg} dmg)")
+            log.info("%s got paralysed by %s (+%s dmg)", target, source, dmg)
             target.add_effect(GhoulClawEffect())
         else:
-            print(f"{target} resisted Ghoul claws")
+            log.info("%s resisted Ghoul claws", target)
 
     ##########################################################################
     def heuristic_ghoul_bite(self) -> int:
@@ -112,7 +113,7 @@ class GhoulClawEffect(Effect):
         """Do we rmove the effect"""
         svth = victim.saving_throw(Stat.CON, 10, effect=Condition.PARALYZED)
         if svth:
-            print(f"{victim} resisted Ghoul claws")
+            log.info("%s resisted Ghoul claws", victim)
             victim.remove_condition(Condition.PARALYZED)
             return True
         return False
@@ -13,6 +13,7 @@ from pycs.damage import Damage
 from pycs.damageroll import DamageRoll
 from pycs.effect import Effect
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -58,7 +59,7 @@ class GiantFrog(Monster):
         no longer restrained by it and can escape from the corpse using 5 feet
         of movement, exiting prone."""
         if self.has_grappled == target and self._swallowed is None:
-            print(f"{self} swallowed {target}")
+            log.info("%s swallowed %s", self, target)
             target.add_effect(GiantFrogSwallowEffect(source=self))
             self.ungrapple()
             self._swallowed = target
@@ -71,7 +72,7 @@ class GiantFrog(Monster):
         """Additional reporting"""
         super().report()
         if self._swallowed:
-            print(f"| Swallowed: {self._swallowed}")
+            log.info("| Swallowed: %s", self._swallowed)
 
     ##########################################################################
     def frog_bite(self) -> int:
@@ -85,7 +86,7 @@ class GiantFrog(Monster):
             self._swallowed.remove_condition(Condition.RESTRAINED)
             self._swallowed.remove_condition(Condition.BLINDED)
             self._swallowed.remove_effect("Giant Frog Swallow")
-            print(f"{self._swallowed} escapes from being swallowed by {self.name}")
+            log.info("%s escapes from being swallowed by %s", self._swallowed, self.name)
             self._swallowed = None
         super().fallen_unconscious(dmg, critical)
 
@@ -124,15 +125,15 @@ class GiantFrogSwallowEffect(Effect):
 
     ##########################################################################
     def hook_start_turn(self) -> None:
-        dmg = DamageRoll("2d4", 0, DamageType.ACID).roll()
         assert self.target is not None
+        dmg = DamageRoll("2d4", 0, DamageType.ACID).roll(self.target.rng)
         self.target.hit(
             dmg=dmg,
             source=self.owner,
             critical=False,
             atkname="Frog Acid",
         )
-        print(f"{self.target} hurt by {dmg} acid from being swallowed by Giant Frog")
+        log.info("%s hurt by %s acid from being swallowed by Giant Frog", self.target, dmg)
 
 
 ##############################################################################
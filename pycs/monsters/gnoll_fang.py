@@ -82,7 +82,7 @@ class FangMultiAttack(Action):
     ##########################################################################
     def heuristic(self) -> int:
         """Should we do the attack"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if enemy and self.owner.distance(enemy[0]) <= 1:
             return 1
         return 0
@@ -92,7 +92,7 @@ class FangMultiAttack(Action):
         """Gnoll bites can be pretty nasty"""
         svth = target.saving_throw(Stat.CON, 12)
         if not svth:
-            dmg = DamageRoll("2d6", 0, DamageType.POISON).roll()
+            dmg = DamageRoll("2d6", 0, DamageType.POISON).roll(source.rng)
             target.hit(dmg, source, False, "Gnoll Fang Bite Poison")
 
 
@@ -12,6 +12,7 @@ from pycs.constant import MonsterType
 from pycs.creature import Creature
 from pycs.damageroll import DamageRoll
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -20,6 +21,8 @@ from pycs.monster import Monster
 class GnollWitherling(Monster):
     """Gnoll Witherling"""
 
+    hook_radius = {"hook_see_someone_die": 30 // 5}
+
     ##########################################################################
     def __init__(self, **kwargs: Any):
         kwargs.update(
@@ -58,7 +61,7 @@ class GnollWitherling(Monster):
             return
         if ActionCategory.REACTION not in self.options_this_turn:
             return
-        print(f"{self} saw {creat} die so doing Vengeful Strike")
+        log.info("%s saw %s die so doing Vengeful Strike", self, creat)
         act = self.pick_action_by_name("Vengeful Strike")
         assert act is not None
         if not self.target:
@@ -67,7 +70,7 @@ class GnollWitherling(Monster):
             act.perform_action()
             self.options_this_turn.remove(ActionCategory.REACTION)
         else:
-            print(f"{self} doesn't have a target")
+            log.info("%s doesn't have a target", self)
 
 
 ##############################################################################
@@ -131,7 +134,7 @@ class WitherlingMultiAttack(Action):
     ##########################################################################
     def heuristic(self) -> int:
         """Should we do the attack"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if enemy and self.owner.distance(enemy[0]) <= 1:
             return 1
         return 0
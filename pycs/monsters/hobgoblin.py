@@ -3,7 +3,6 @@ from typing import Any
 import unittest
 from unittest.mock import patch
 import colors
-import dice
 from pycs.action import Action
 from pycs.arena import Arena
 from pycs.effect import Effect
@@ -15,6 +14,7 @@ from pycs.gear import Shield
 from pycs.constant import MonsterType
 from pycs.creature import Creature
 from pycs.monster import Monster
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -108,7 +108,7 @@ class TestHobgoblin(unittest.TestCase):
         self.assertFalse(eff.used_this_turn)
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 19
-            with patch.object(dice, "roll") as mock_dice:
+            with patch.object(Rng, "roll") as mock_dice:
                 mock_dice.return_value = 1  # Sword and MartAdv damage
                 sword.perform_action()
                 self.assertEqual(self.victim.hp, 47)  # 2 for sword, 1 for MA
@@ -125,7 +125,7 @@ class TestHobgoblin(unittest.TestCase):
         self.assertFalse(self.beast.effects["Martial Advantage"].used_this_turn)
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 19
-            with patch.object(dice, "roll") as mock_dice:
+            with patch.object(Rng, "roll") as mock_dice:
                 mock_dice.return_value = 1  # Sword and MartAdv damage
                 sword.perform_action()
                 self.assertEqual(self.victim.hp, 48)  # 2 for sword
@@ -13,6 +13,7 @@ from pycs.creature import Creature
 from pycs.damage import Damage
 from pycs.damageroll import DamageRoll
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -56,7 +57,7 @@ class OgreZombie(Monster):
             save = self.saving_throw(Stat.CON, 5 + dmg.hp)
             if save:
                 self.hp = 1
-                print(f"{self} uses Undead Fortitude and stays conscious")
+                log.info("%s uses Undead Fortitude and stays conscious", self)
                 return
         super().fallen_unconscious(dmg, critical)
 
@@ -11,6 +11,7 @@ from pycs.constant import MonsterType
 from pycs.damage import Damage
 from pycs.damageroll import DamageRoll
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -49,15 +50,15 @@ class Troll(Monster):
         if it starts its turn with 0 hit points and doesn't regenerate."""
         for hit in self.damage_last_turn:
             if hit.type in (DamageType.ACID, DamageType.FIRE):
-                print(f"Not regenerating as took {hit.type.value} damage last turn")
+                log.info("Not regenerating as took %s damage last turn", hit.type.value)
                 return
         # Don't come back from unconsciousness forever - can lead to loops
         if self.hp <= 0:
             self._regen -= 1
         if self._regen <= 0:
-            print("Not regening as getting ridiculous")
+            log.info("Not regening as getting ridiculous")
             return
-        print(f"{self._regen} regens left")
+        log.info("%s regens left", self._regen)
         if self.hp < self.max_hp:
             self.heal("", 10)
 
@@ -82,7 +83,7 @@ class TrollMultiAttack(Action):
     ##########################################################################
     def heuristic(self) -> int:
         """Should we do the action"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if enemy and self.owner.distance(enemy[0]) <= 1:
             return 1
         return 0
@@ -13,6 +13,7 @@ from pycs.creature import Creature
 from pycs.damage import Damage
 from pycs.damageroll import DamageRoll
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -56,13 +57,13 @@ class VampireSpawn(Monster):
         at the start of the vampire's next turn."""
         for hit in self.damage_last_turn:
             if hit.type == DamageType.RADIANT:
-                print(f"Not regenerating as took {hit.type.value} damage last turn")
+                log.info("Not regenerating as took %s damage last turn", hit.type.value)
                 return
         # Don't come back from unconsciousness forever - can lead to loops
         if self.hp <= 0:
             self._regen -= 1
         if self._regen <= 0:
-            print("Not regening as getting ridiculous")
+            log.info("Not regening as getting ridiculous")
             return
         if self.hp < self.max_hp:
             self.heal("", 10)
@@ -90,7 +91,7 @@ class VSMultiAttack(Action):
     ##########################################################################
     def heuristic(self) -> int:
         """Should we do the attack"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if enemy and self.owner.distance(enemy[0]) <= 1:
             return 1
         return 0
@@ -143,9 +144,9 @@ class BiteAttack(MeleeAttack):
         self, source: Creature, target: Creature, dmg: Damage  # pylint: disable=unused-argument
     ) -> None:
         """Do the side_effect"""
-        necro_dmg = DamageRoll("2d6", 0, DamageType.NECROTIC).roll()
+        necro_dmg = DamageRoll("2d6", 0, DamageType.NECROTIC).roll(source.rng)
         target.hit(necro_dmg, source, False, "Vampire Spawn Bite")
-        print(f"Inflicted {necro_dmg} from the bite")
+        log.info("Inflicted %s from the bite", necro_dmg)
         source.heal("", necro_dmg.hp)
         target.max_hp -= necro_dmg.hp
         if target.max_hp <= 0:
@@ -168,7 +169,7 @@ class ClawAttack(MeleeAttack):
     ##########################################################################
     def heuristic(self) -> int:
         """Should we do the attack"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if enemy and self.owner.distance(enemy[0]) <= 1:
             return 1
         return 0
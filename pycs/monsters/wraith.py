@@ -13,6 +13,7 @@ from pycs.constant import Stat
 from pycs.creature import Creature
 from pycs.damageroll import DamageRoll
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -77,9 +78,9 @@ class Wraith(Monster):
         The target dies if this effect reduces its hit point maximum to 0."""
         svth = target.saving_throw(Stat.CON, 14)
         if svth:
-            print(f"{target} resisted Wraith life drain")
+            log.info("%s resisted Wraith life drain", target)
         else:
-            print(f"Wraith life drain's {target} of {dmg} hit points")
+            log.info("Wraith life drain's %s of %s hit points", target, dmg)
             target.max_hp = max(target.max_hp - dmg.hp, 0)
 
     ##########################################################################
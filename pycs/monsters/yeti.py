@@ -15,6 +15,7 @@ from pycs.constant import Stat
 from pycs.creature import Creature
 from pycs.effect import Effect
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -63,7 +64,7 @@ class YetiMultiAttack(Action):
     ##########################################################################
     def heuristic(self) -> int:
         """Should we do the attack"""
-        enemy = self.owner.pick_closest_enemy()
+        enemy = self.owner.pick_closest_enemy(count=1)
         if enemy and self.owner.distance(enemy[0]) <= 6:
             return 1
         return 0
@@ -86,7 +87,7 @@ class YetiMultiAttack(Action):
     ##########################################################################
     def cold_claw(self, source: Creature, target: Creature, dmg: Damage) -> None:
         """Additional 1d6 Cold damage to claw"""
-        dmg = DamageRoll("1d6", 0, DamageType.COLD).roll()
+        dmg = DamageRoll("1d6", 0, DamageType.COLD).roll(source.rng)
         target.hit(dmg, source, False, "Yeti Cold Claws")
 
     ##########################################################################
@@ -104,28 +105,28 @@ class YetiMultiAttack(Action):
         target = self.pick_chill_target()
         if not target:
             return
-        dmg = DamageRoll("3d6", 0, DamageType.COLD).roll()
+        dmg = DamageRoll("3d6", 0, DamageType.COLD).roll(self.rng)
         svth = target.saving_throw(Stat.CON, 13)
         if not svth:
-            print(f"{self.owner} doing Chilling Glaze at {target}")
+            log.info("%s doing Chilling Glaze at %s", self.owner, target)
             target.add_effect(ChillGlazeEffect(cause=self))
             target.hit(dmg, self.owner, False, "Chilling Glaze")
         else:
-            print(f"{target} saved against Chilling Glaze - no effect")
+            log.info("%s saved against Chilling Glaze - no effect", target)
 
     ##########################################################################
     def pick_chill_target(self) -> Optional[Creature]:
         """Who to attack"""
         result = namedtuple("result", "health id target")
         targets = [
-            result(_.hp, id(_), _)
+            result(_.hp, _.join_order, _)
             for _ in self.owner.pick_closest_enemy()
             if self.owner.distance(_) <= 30 / 5 and DamageType.COLD not in _.immunity
         ]
         if not targets:
             return None
         targets.sort()
-        print(f"Yeti chill glazes {targets=}")
+        log.info("Yeti chill glazes targets=%r", targets)
         return targets[-1].target
 
 
@@ -148,7 +149,7 @@ class ChillGlazeEffect(Effect):
         """Do we recover from paralysis"""
         svth = victim.saving_throw(Stat.CON, 13)
         if svth:
-            print(f"{victim} no longer paralyzed from Yeti's Chill Touch")
+            log.info("%s no longer paralyzed from Yeti's Chill Touch", victim)
             victim.remove_condition(Condition.PARALYZED)
             return True
         return False
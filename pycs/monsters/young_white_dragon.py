@@ -2,7 +2,6 @@
 from collections import namedtuple
 from typing import Any, Optional
 import colors
-import dice
 from pycs.action import Action
 from pycs.attack import Attack
 from pycs.attack import MeleeAttack
@@ -12,6 +11,7 @@ from pycs.constant import MonsterType
 from pycs.constant import Stat
 from pycs.creature import Creature
 from pycs.monster import Monster
+from pycs.log import log
 
 
 ##############################################################################
@@ -46,15 +46,15 @@ class YoungWhiteDragon(Monster):
     def hook_start_turn(self) -> None:
         """Recharge breath weapon on 5/6"""
         if not self.breath:
-            if int(dice.roll("d6")) in (5, 6):
-                print(f"{self} regains breath weapon")
+            if self.rng.roll("d6") in (5, 6):
+                log.info("%s regains breath weapon", self)
                 self.breath = True
 
     ##########################################################################
     def report(self) -> None:
         """Creature Report"""
         super().report()
-        print(f"|  Breath Weapon: {self.breath}")
+        log.info("|  Breath Weapon: %s", self.breath)
 
     ##########################################################################
     def shortrepr(self) -> str:
@@ -99,7 +99,7 @@ class DragonBreath(Attack):
         """Pick on the strongest enemy"""
         result = namedtuple("result", "health id target")
         targets = [
-            result(_.hp, id(_), _)
+            result(_.hp, _.join_order, _)
             for _ in self.owner.pick_closest_enemy()
             if self.owner.distance(_) < 60 / 5 and DamageType.FIRE not in _.immunity
         ]
@@ -114,7 +114,7 @@ class DragonBreath(Attack):
         target = self.pick_target()
         if target is None:
             return False
-        dmg = DamageRoll("10d8", 0, DamageType.COLD).roll()
+        dmg = DamageRoll("10d8", 0, DamageType.COLD).roll(self.rng)
         svth = target.saving_throw(Stat.CON, 15)
         if svth:
             dmg //= 2
@@ -10,6 +10,7 @@ from pycs.creature import Creature
 from pycs.damage import Damage
 from pycs.effect import Effect
 from pycs.race import Race
+from pycs.log import log
 
 
 ##############################################################################
@@ -43,7 +44,7 @@ class RelentlessEndurance(Effect):
         """Engage Relentless Attack"""
         if self._relentless_used:
             return True
-        print(f"{self.owner}'s Relentless Endurance kicks in")
+        log.info("%s's Relentless Endurance kicks in", self.owner)
         assert self.owner is not None
         self.owner.hp = 1
         self._relentless_used = True
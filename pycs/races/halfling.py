@@ -3,12 +3,13 @@ import io
 from typing import Any
 import unittest
 from unittest.mock import patch
-import dice
 from pycs.constant import Condition
 from pycs.constant import Stat
 from pycs.creature import Creature
 from pycs.effect import Effect
 from pycs.race import Race
+from pycs.log import log
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -39,8 +40,9 @@ class Lucky(Effect):
         """Reroll ones"""
         if reason in ("attack", "ability", "save"):
             if val == 1:
-                val = int(dice.roll("d20"))
-                print(f"Lucky - reroll 1 to {val}")
+                assert self.owner is not None
+                val = self.owner.rng.d20()
+                log.info("Lucky - reroll 1 to %s", val)
         return val
 
 
@@ -89,7 +91,7 @@ class TestLucky(unittest.TestCase):
     ########################################################################
     def test_not_lucky(self) -> None:
         """Test what happens when we roll a 1 - but doesn't apply"""
-        with patch.object(dice, "roll") as mock:
+        with patch.object(Rng, "d20") as mock:
             mock.return_value = 1
             init = self.hobbit.roll_initiative()
             self.assertEqual(init, 1)
@@ -97,7 +99,7 @@ class TestLucky(unittest.TestCase):
     ########################################################################
     def test_lucky(self) -> None:
         """Test what happens when we roll a 1 - but does apply"""
-        with patch.object(dice, "roll") as mock:
+        with patch.object(Rng, "d20") as mock:
             mock.side_effect = [1, 10]
             svth = self.hobbit.saving_throw(Stat.STR, dc=5)
             self.assertTrue(svth)
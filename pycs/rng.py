@@ -0,0 +1,144 @@
+""" Seedable random numbers - every roll in a combat goes through here """
+import random
+import re
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+Seed = Optional[Union[int, str]]
+
+DICE_RE = re.compile(r"^\s*(\d*)\s*d\s*(\d+)\s*(?:([+-])\s*(\d+))?\s*$")
+
+
+##############################################################################
+def parse_dice(expr: str) -> tuple[int, int, int]:
+    """Split a dice expression such as "2d6+3" into (count, sides, bonus)"""
+    match = DICE_RE.match(expr)
+    if match is None:
+        raise ValueError(f"Can't understand dice expression '{expr}'")
+    count = int(match.group(1)) if match.group(1) else 1
+    bonus = int(match.group(4)) if match.group(4) else 0
+    if match.group(3) == "-":
+        bonus = -bonus
+    return count, int(match.group(2)), bonus
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class Dice:
+    """A dice expression parsed once - rolling it is only the RNG draws"""
+
+    __slots__ = ("expr", "count", "sides", "bonus", "max", "min", "mean")
+
+    ##########################################################################
+    def __init__(self, expr: str):
+        self.expr = expr
+        self.count, self.sides, self.bonus = parse_dice(expr)
+        self.max = self.count * self.sides + self.bonus
+        self.min = self.count + self.bonus
+        self.mean = self.count * (self.sides + 1) / 2 + self.bonus
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        return f"<Dice {self.expr}>"
+
+    ##########################################################################
+    def __str__(self) -> str:
+        return self.expr
+
+    ##########################################################################
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Never changes once compiled so copies can share the cached one
+        return (compile_dice, (self.expr,))
+
+
+##############################################################################
+@lru_cache(maxsize=None)
+def compile_dice(expr: str) -> Dice:
+    """The compiled form of {expr} - each expression is only parsed once"""
+    return Dice(expr)
+
+
+##############################################################################
+def roll_max(expr: str) -> int:
+    """Maximum possible result of a dice expression"""
+    return compile_dice(expr).max
+
+
+##############################################################################
+def combat_seed(seed: Seed, index: int) -> Seed:
+    """The seed for the {index}th combat of a run started with {seed}
+    Derived from the index alone so it doesn't matter which worker runs it"""
+    if seed is None:
+        return None
+    return f"{seed}/{index}"
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class Rng:
+    """Source of all the randomness for an arena
+    With {streams} each creature rolls from its own stream (see stream()) so
+    a change to one creature doesn't shift everyone else's rolls. With
+    {antithetic} every d20 is flipped (21 - roll) to pair with an unflipped run"""
+
+    ##########################################################################
+    def __init__(self, seed: Seed = None, antithetic: bool = False, streams: bool = False):
+        self.seed = seed
+        self.antithetic = antithetic
+        self._random = random.Random(seed)
+        self._streams: Optional[dict[str, Rng]] = {} if streams else None
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        return f"<Rng {self.seed}>"
+
+    ##########################################################################
+    def spawn(self, key: str) -> "Rng":
+        """An independent Rng derived from this one's seed and {key}"""
+        seed = f"{self.seed}/{key}" if self.seed is not None else self._random.getrandbits(64)
+        return Rng(seed, antithetic=self.antithetic)
+
+    ##########################################################################
+    def stream(self, key: str) -> "Rng":
+        """Where {key}'s rolls come from - its own stream if we have them"""
+        if self._streams is None:
+            return self
+        try:
+            return self._streams[key]
+        except KeyError:
+            self._streams[key] = self.spawn(key)
+            return self._streams[key]
+
+    ##########################################################################
+    def random(self) -> float:
+        """Float in the range [0, 1)"""
+        return self._random.random()
+
+    ##########################################################################
+    def randint(self, low: int, high: int) -> int:
+        """Integer in the range [low, high]"""
+        return self._random.randint(low, high)
+
+    ##########################################################################
+    def d20(self) -> int:
+        """Roll a d20"""
+        if self.antithetic:
+            return 21 - self._random.randint(1, 20)
+        return self._random.randint(1, 20)
+
+    ##########################################################################
+    def roll(self, expr: Union[str, Dice]) -> int:
+        """Roll a dice expression such as "3d8+2" - compiled or not"""
+        dice = expr if isinstance(expr, Dice) else compile_dice(expr)
+        randint = self._random.randint
+        result = dice.bonus
+        for _ in range(dice.count):
+            result += randint(1, dice.sides)
+        return result
+
+
+DEFAULT_RNG = Rng()
+
+# EOF
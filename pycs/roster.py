@@ -0,0 +1,158 @@
+""" Who is in an arena and what they are waiting to hear about """
+from typing import Any, Optional
+from collections import defaultdict
+from collections import namedtuple
+from pycs.constant import Condition, MonsterType
+from pycs.creature import Creature
+
+# Creature hooks that are only called on the combatants that implement them
+EVENTS = ("hook_see_someone_die", "start_others_turn")
+
+# Who is still standing - in initiative order, all of them, by side and by
+# type, and everyone who isn't dead. {state} is what each combatant was
+# (alive, dead) when it was worked out
+Standing = namedtuple("Standing", "state alive by_side by_type not_dead")
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class Roster:
+    """The combatants in an arena (in initiative order once it is rolled),
+    who is still standing, who is listening for which events and which
+    effects have an area"""
+
+    ##########################################################################
+    def __init__(self) -> None:
+        self._combatants: list[Creature] = []
+        # Only worked out again when someone goes down or gets back up
+        self._standing: Optional[Standing] = None
+        # Effects with an area around their owner - used as an ordered set
+        self._auras: dict[Any, None] = {}
+        # event -> combatant that implements it -> how close it has to be (None is anywhere)
+        self._listeners: dict[str, dict[Any, Optional[int]]] = {_: {} for _ in EVENTS}
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        return f"<Roster {len(self._combatants)} combatants>"
+
+    ##########################################################################
+    def add(self, comb: Creature) -> None:
+        """{comb} has joined - and listens for the events it implements"""
+        comb.join_order = len(self._combatants)
+        self._combatants.append(comb)
+        self._standing = None
+        for event in EVENTS:
+            if getattr(type(comb), event, None) not in (None, getattr(Creature, event)):
+                self.subscribe(comb, event, comb.hook_radius.get(event))
+
+    ##########################################################################
+    def reorder(self, combatants: list[Creature]) -> None:
+        """Everyone now acts in the order of {combatants}"""
+        self._combatants = combatants
+        self._standing = None
+
+    ##########################################################################
+    def check(self, comb: Creature) -> None:
+        """Something has happened to {comb} - are they still standing"""
+        if self._standing is not None and self._standing.state.get(comb) != (
+            comb.is_alive(),
+            comb.has_condition(Condition.DEAD),
+        ):
+            self._standing = None
+
+    ##########################################################################
+    def _current(self) -> Standing:
+        """Who is still standing - working it out again if that could have changed"""
+        if self._standing is not None:
+            return self._standing
+        standing = Standing({}, [], {}, {}, [])
+        for comb in self._combatants:
+            alive = comb.is_alive()
+            dead = comb.has_condition(Condition.DEAD)
+            standing.state[comb] = (alive, dead)
+            if not dead:
+                standing.not_dead.append(comb)
+            if alive:
+                standing.alive.append(comb)
+                standing.by_side.setdefault(comb.side, []).append(comb)
+                standing.by_type.setdefault(comb.type, []).append(comb)
+        self._standing = standing
+        return standing
+
+    ##########################################################################
+    def pick_everyone(self) -> list[Creature]:
+        """Return all combatants"""
+        return self._combatants
+
+    ##########################################################################
+    def pick_alive(self) -> list[Creature]:
+        """Return the list of living combatants"""
+        return list(self._current().alive)
+
+    ##########################################################################
+    def not_dead(self) -> list[Creature]:
+        """Everyone who still gets a turn - the unconscious included"""
+        return list(self._current().not_dead)
+
+    ##########################################################################
+    def my_side(self, side: str) -> list[Creature]:
+        """Who is still standing on my side"""
+        return list(self._current().by_side.get(side, []))
+
+    ##########################################################################
+    def remaining_type(self, creat: Creature, typ_: MonsterType) -> list[Creature]:
+        """Return the remaining combatants of the specified type"""
+        return [_ for _ in self._current().by_type.get(typ_, []) if _.side != creat.side]
+
+    ##########################################################################
+    def still_going(self) -> bool:
+        """Do we still have alive combatants on both sides"""
+        return len(self._current().by_side) > 1
+
+    ##########################################################################
+    def remaining_participants_count(self) -> defaultdict[str, int]:
+        """How many are still standing"""
+        sides: defaultdict[str, int] = defaultdict(int)
+        for side, members in self._current().by_side.items():
+            sides[side] = len(members)
+        return sides
+
+    ##########################################################################
+    def winning_side(self) -> str:
+        """Which side won?"""
+        sides = self.remaining_participants_count()
+        return list(sides.keys())[0]
+
+    ##########################################################################
+    def add_aura(self, effect: Any) -> None:
+        """{effect} affects everyone within its aura_radius of its owner"""
+        self._auras[effect] = None
+
+    ##########################################################################
+    def remove_aura(self, effect: Any) -> None:
+        """{effect} no longer has an area"""
+        self._auras.pop(effect, None)
+
+    ##########################################################################
+    def auras(self) -> list[Any]:
+        """The effects that currently have an area"""
+        return list(self._auras)
+
+    ##########################################################################
+    def subscribe(self, comb: Creature, event: str, radius: Optional[int] = None) -> None:
+        """Call {comb}'s {event} method when it happens (within {radius} of it)"""
+        self._listeners[event][comb] = radius
+
+    ##########################################################################
+    def unsubscribe(self, comb: Creature, event: str) -> None:
+        """Stop telling {comb} about {event}"""
+        self._listeners[event].pop(comb, None)
+
+    ##########################################################################
+    def listeners(self, event: str) -> dict[Any, Optional[int]]:
+        """Who is listening for {event} - and how close it has to be to them"""
+        return dict(self._listeners[event])
+
+
+# EOF
@@ -0,0 +1,441 @@
+""" Exact results for small fights - no dice rolled """
+import itertools
+from collections import defaultdict, namedtuple
+from typing import Optional
+
+from pycs.attack import Attack, MeleeAttack, RangedAttack
+from pycs.character import Character
+from pycs.constant import Stat
+from pycs.creature import Creature
+from pycs.damageroll import DamageRoll
+from pycs.monster import Monster
+from pycs.rng import Dice, compile_dice
+
+# More than this and the states (everyone's hit points) get out of hand
+MAX_COMBATANTS = 4
+
+# Creature methods that change how a fight goes if a creature redefines them
+COMBAT_METHODS = (
+    "fallen_unconscious",
+    "flee",
+    "hit",
+    "hook_see_someone_die",
+    "hook_start_turn",
+    "pick_target",
+    "roll_initiative",
+    "rolld20",
+    "start_others_turn",
+    "start_turn",
+    "turn",
+)
+
+# The chance of each side winning and how many rounds it takes on average.
+# Anything that wasn't modelled is listed in unsupported
+DuelResult = namedtuple("DuelResult", "win_probability expected_rounds unsupported")
+
+# Hit points of each combatant, in the order they were given
+State = tuple[int, ...]
+
+# Probability of each amount of damage (0 is a miss)
+Distribution = dict[int, float]
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class UnsupportedError(ValueError):
+    """The fight has something in it that the solver can't model"""
+
+
+##############################################################################
+def dice_distribution(dice: Optional[Dice], bonus: int = 0) -> Distribution:
+    """The chance of each total of {dice} + {bonus}"""
+    dist: Distribution = {bonus: 1.0}
+    if dice is None:
+        return dist
+    dist = {bonus + dice.bonus: 1.0}
+    for _ in range(dice.count):
+        rolled: Distribution = defaultdict(float)
+        for total, prob in dist.items():
+            for face in range(1, dice.sides + 1):
+                rolled[total + face] += prob / dice.sides
+        dist = dict(rolled)
+    return dist
+
+
+##############################################################################
+def _add(dist: Distribution, other: Distribution) -> Distribution:
+    """Distribution of adding {other} to {dist} as Damage does - never below zero"""
+    result: Distribution = defaultdict(float)
+    for one, prob1 in dist.items():
+        for two, prob2 in other.items():
+            result[max(one + two, 0)] += prob1 * prob2
+    return dict(result)
+
+
+##############################################################################
+def unsupported(combatants: list[Creature]) -> list[str]:
+    """What the solver can't model about {combatants}
+    It assumes everyone is in melee with everyone else from the start and
+    just trades attacks - so anything else that could happen is listed"""
+    problems: list[str] = []
+    sides: defaultdict[str, int] = defaultdict(int)
+    for comb in combatants:
+        sides[comb.side] += 1
+    for comb in combatants:
+        found = _unmodelled_extras(comb) + _unmodelled_methods(comb)
+        if not isinstance(comb, Monster) and sides[comb.side] > 1:
+            found.append("death saves")
+        if not melee_attacks(comb):
+            found.append("no melee attack")
+        found.extend(_unmodelled_actions(comb))
+        problems.extend(f"{comb.name}: {_}" for _ in found)
+    return problems
+
+
+##############################################################################
+def _unmodelled_extras(comb: Creature) -> list[str]:
+    """{comb}'s effects, bonus actions and reactions - none are modelled"""
+    extras = [f"effect {_.name}" for _ in comb.effects]
+    extras.extend(f"bonus action {_.name}" for _ in comb.bonus_actions)
+    extras.extend(f"reaction {_.name}" for _ in comb.reactions)
+    return extras
+
+
+##############################################################################
+def _unmodelled_methods(comb: Creature) -> list[str]:
+    """The COMBAT_METHODS {comb}'s class does its own way"""
+    methods = []
+    for method in COMBAT_METHODS:
+        owner = next((_ for _ in type(comb).__mro__ if method in vars(_)), None)
+        if owner not in (None, Creature, Monster, Character):
+            methods.append(f"{owner.__name__}.{method}()")
+    return methods
+
+
+##############################################################################
+def _unmodelled_actions(comb: Creature) -> list[str]:
+    """{comb}'s actions other than plain attacks - and anything extra the attacks do"""
+    actions = []
+    for act in comb.actions:
+        if not act.is_available():
+            continue
+        if type(act) not in (MeleeAttack, RangedAttack):
+            actions.append(f"action {act.name}")
+        elif isinstance(act, MeleeAttack):
+            if act.side_effect:
+                actions.append(f"{act.name} side effect")
+            if act.ammo is not None:
+                actions.append(f"{act.name} ammo")
+            if not isinstance(act.attacks_per_action, int):
+                actions.append(f"{act.name} rolled number of attacks")
+    return actions
+
+
+##############################################################################
+def melee_attacks(comb: Creature) -> list[MeleeAttack]:
+    """The attacks {comb} would pick from when in melee - the best scoring
+    ones, as Creature._pick_action() would score them (ties are picked at random)"""
+    scored = []
+    for act in comb.actions:
+        if not isinstance(act, MeleeAttack) or not act.is_available():
+            continue
+        if act.__class__ in comb.action_preference:
+            pref = comb.action_preference[act.__class__]
+        else:
+            pref = comb.action_preference.get(act.type, 1)
+        score = int(act.max_dmg()) * pref
+        if score:
+            scored.append((score, act))
+    best = max((_[0] for _ in scored), default=0)
+    return [act for score, act in scored if score == best]
+
+
+##############################################################################
+def attack_distribution(act: Attack, target: Creature) -> Distribution:
+    """The chance of {act} doing each amount of damage to {target}
+    Follows Action.do_attack() - a 1 always misses, a critical still has to
+    beat the AC and doubles the dice, then bonuses and resistances"""
+    hits, crits = _hitting_rolls(act, target)
+    rolled, critical = _damage_distributions(act)
+    dist: Distribution = defaultdict(float)
+    dist[0] += (20 - hits - crits) / 20
+    for amounts, rolls in ((rolled, hits), (critical, crits)):
+        if rolls:
+            for amount, prob in amounts.items():
+                dist[_taken(target, act.dmgroll, amount)] += prob * rolls / 20
+    return dict(dist)
+
+
+##############################################################################
+def _hitting_rolls(act: Attack, target: Creature) -> tuple[int, int]:
+    """How many of the d20 rolls for {act} hit {target} - as (hits, criticals)"""
+    owner = act.owner
+    if owner is None:
+        raise UnsupportedError(f"{act.name} doesn't belong to anybody")
+    to_hit = act.atk_modifier(owner) + owner.prof_bonus
+    if act.gear and hasattr(act.gear, "hook_attack_to_hit"):
+        to_hit += act.gear.hook_attack_to_hit(target=target) or 0
+    hits = crits = 0
+    for roll in range(2, 21):
+        if roll + to_hit >= target.ac:
+            if roll >= owner.critical:
+                crits += 1
+            else:
+                hits += 1
+    return hits, crits
+
+
+##############################################################################
+def _damage_distributions(act: Attack) -> tuple[Distribution, Distribution]:
+    """The chance of each amount of damage {act} does on a hit - and on a critical"""
+    rolled = dice_distribution(act.dmgroll.dice, act.dmgroll.bonus)
+    critical = _add({act.dmgroll.roll_max().hp: 1.0}, rolled)
+    for bonus, _ in act.dmg_bonus():
+        if isinstance(bonus, DamageRoll):
+            extra = dice_distribution(bonus.dice, bonus.bonus)
+        else:
+            extra = {bonus.hp: 1.0}
+        rolled = _add(rolled, extra)
+        critical = _add(critical, extra)
+    return rolled, critical
+
+
+##############################################################################
+def _taken(target: Creature, dmgroll: DamageRoll, amount: int) -> int:
+    """How much of {amount} {target} actually takes - see Creature.hit()"""
+    if dmgroll.type in target.vulnerable:
+        amount *= 2
+    if dmgroll.type in target.immunity:
+        amount = 0
+    if dmgroll.type in target.resistant:
+        amount //= 2
+    return max(amount, 0)
+
+
+##############################################################################
+def initiative_orders(combatants: list[Creature]) -> dict[tuple[int, ...], float]:
+    """The chance of each order the combatants could act in
+    Sorted as Arena.do_initiative() does - on the roll, then dexterity, then join order"""
+    orders: defaultdict[tuple[int, ...], float] = defaultdict(float)
+    chance = 1 / 20 ** len(combatants)
+    bonuses = [_.stat_bonus(Stat.DEX) for _ in combatants]
+    for rolls in itertools.product(range(1, 21), repeat=len(combatants)):
+        keys = [
+            (roll + bonus, comb.stats[Stat.DEX], idx)
+            for idx, (roll, bonus, comb) in enumerate(zip(rolls, bonuses, combatants))
+        ]
+        keys.sort(reverse=True)
+        orders[tuple(_[2] for _ in keys)] += chance
+    return dict(orders)
+
+
+##############################################################################
+def starting_hit_points(comb: Creature) -> Distribution:
+    """The chance of each starting hit points - monsters roll theirs as they join an arena"""
+    hitdice = getattr(comb, "hitdice", None)
+    if hitdice is None:
+        return {comb.hp: 1.0}
+    dist: Distribution = defaultdict(float)
+    for hp, prob in dice_distribution(compile_dice(hitdice)).items():
+        dist[max(1, hp)] += prob
+    return dict(dist)
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class Duel:
+    """Exact outcome of a small fight worked out as a Markov chain
+    The state is everyone's hit points and whose turn it is. Hit points only
+    ever go down so the chain is solved from the fewest hit points up - a
+    round where nobody is hurt just comes back to the same state"""
+
+    ##########################################################################
+    def __init__(self, combatants: list[Creature]):
+        self.combatants = combatants
+        self.sides = list(dict.fromkeys(_.side for _ in combatants))
+        self._side_index = [self.sides.index(_.side) for _ in combatants]
+        # attacker -> target -> the turn's choice of attacks
+        self._attacks: dict[tuple[int, int], list[Distribution]] = {}
+        # (state, attacker) -> where their turn could leave it - the same whatever the initiative order
+        self._turns: dict[tuple[State, int], dict[State, float]] = {}
+        for idx, comb in enumerate(combatants):
+            for tgt, target in enumerate(combatants):
+                if comb.side != target.side:
+                    self._attacks[(idx, tgt)] = [attack_distribution(_, target) for _ in melee_attacks(comb)]
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        return f"<Duel {' v '.join(self.sides)}>"
+
+    ##########################################################################
+    def winner(self, state: State) -> Optional[int]:
+        """Index of the only side still standing - None if still going"""
+        standing = {self._side_index[idx] for idx, hp in enumerate(state) if hp > 0}
+        if len(standing) > 1:
+            return None
+        # Nobody standing can't happen - the last attack has to come from someone
+        return standing.pop()
+
+    ##########################################################################
+    def _target(self, state: State, attacker: int) -> Optional[int]:
+        """Who {attacker} goes for - everyone is equally close so the first
+        enemy to join that is still standing (see Arena.pick_nearest())"""
+        for idx, hp in enumerate(state):
+            if hp > 0 and self._side_index[idx] != self._side_index[attacker]:
+                return idx
+        return None
+
+    ##########################################################################
+    def _turn(self, state: State, attacker: int) -> dict[State, float]:
+        """Where {attacker}'s turn could leave {state}"""
+        if (state, attacker) not in self._turns:
+            self._turns[(state, attacker)] = self._work_out_turn(state, attacker)
+        return self._turns[(state, attacker)]
+
+    ##########################################################################
+    def _work_out_turn(self, state: State, attacker: int) -> dict[State, float]:
+        result: dict[State, float] = {state: 1.0}
+        if state[attacker] <= 0:
+            return result
+        for _ in range(self.combatants[attacker].attacks_per_action):
+            after: defaultdict[State, float] = defaultdict(float)
+            for now, prob in result.items():
+                target = self._target(now, attacker)
+                if target is None:
+                    after[now] += prob
+                    continue
+                choices = self._attacks[(attacker, target)]
+                if not choices:
+                    # Nothing to hit them with - so stands there
+                    after[now] += prob
+                for dist in choices:
+                    for dmg, chance in dist.items():
+                        hps = list(now)
+                        hps[target] = max(0, hps[target] - dmg)
+                        after[tuple(hps)] += prob * chance / len(choices)
+            result = dict(after)
+        return result
+
+    ##########################################################################
+    def _values(self, starts: list[State], order: tuple[int, ...]) -> dict[State, list[list[float]]]:
+        """For every state reachable from {starts}, and each turn of a round
+        in {order}, the chance of each side winning followed by the expected
+        number of rounds still to start"""
+        turns = len(order)
+        values: dict[State, list[list[float]]] = {}
+        stack = list(starts)
+        while stack:
+            state = stack[-1]
+            if state in values:
+                stack.pop()
+                continue
+            won = self.winner(state)
+            if won is not None:
+                values[state] = [[1.0 if _ == won else 0.0 for _ in range(len(self.sides))] + [0.0]] * turns
+                stack.pop()
+                continue
+            outcomes = [self._turn(state, _) for _ in order]
+            pending = [nxt for _ in outcomes for nxt in _ if nxt != state and nxt not in values]
+            if pending:
+                stack.extend(pending)
+                continue
+            values[state] = self._cycle(state, outcomes, values)
+            stack.pop()
+        return values
+
+    ##########################################################################
+    def _cycle(
+        self, state: State, outcomes: list[dict[State, float]], values: dict[State, list[list[float]]]
+    ) -> list[list[float]]:
+        """Values of {state} at each turn of the round - given where each turn
+        could lead ({outcomes}) and the values of everywhere else
+        Each turn either leaves the state alone (and passes it to the next
+        turn) or leads somewhere already solved, so the turns form a loop
+        that can be solved directly"""
+        turns = len(outcomes)
+        # Turn k's value is leave[k] + stay[k] * (the next turn's value)
+        stay = [_.get(state, 0.0) for _ in outcomes]
+        leave = [self._leave(state, turn, outcome, values) for turn, outcome in enumerate(outcomes)]
+        loop = 1.0
+        first = [0.0] * len(leave[0])
+        for turn in range(turns):
+            first = [tot + loop * val for tot, val in zip(first, leave[turn])]
+            loop *= stay[turn]
+        if loop >= 1.0:
+            raise ValueError(f"Nobody can hurt anybody from {state} - the fight never ends")
+        result = [[_ / (1 - loop) for _ in first]]
+        following = result[0]
+        for turn in range(turns - 1, 0, -1):
+            following = [lv + stay[turn] * fv for lv, fv in zip(leave[turn], following)]
+            result.insert(1, following)
+        return result
+
+    ##########################################################################
+    def _leave(
+        self, state: State, turn: int, outcome: dict[State, float], values: dict[State, list[list[float]]]
+    ) -> list[float]:
+        """The value of {turn} in the round from the times it leads away from {state}"""
+        value = [0.0] * (len(self.sides) + 1)
+        if turn == 0:
+            value[-1] = 1.0  # A new round starting
+        for nxt, prob in outcome.items():
+            if nxt != state:
+                for idx, val in enumerate(values[nxt][(turn + 1) % len(values[nxt])]):
+                    value[idx] += prob * val
+        return value
+
+    ##########################################################################
+    def _starts(self) -> dict[State, float]:
+        """The chance of each state the fight could start in - from everyone's rolled hit points"""
+        hit_points = [starting_hit_points(_) for _ in self.combatants]
+        starts: dict[State, float] = {}
+        for combo in itertools.product(*(_.items() for _ in hit_points)):
+            prob = 1.0
+            for _, chance in combo:
+                prob *= chance
+            starts[tuple(_[0] for _ in combo)] = prob
+        return starts
+
+    ##########################################################################
+    def solve(self) -> tuple[dict[str, float], float]:
+        """The chance of each side winning and the expected number of rounds"""
+        starts = self._starts()
+        wins = [0.0] * len(self.sides)
+        length = 0.0
+        for order, order_prob in initiative_orders(self.combatants).items():
+            values = self._values(list(starts), order)
+            for state, prob in starts.items():
+                *state_wins, state_length = values[state][0]
+                for side, win in enumerate(state_wins):
+                    wins[side] += order_prob * prob * win
+                length += order_prob * prob * state_length
+        return dict(zip(self.sides, wins)), length
+
+
+##############################################################################
+def solve_duel(*combatants: Creature, strict: bool = True) -> DuelResult:
+    """Exact win probabilities and expected length of a fight between a few {combatants}
+    Everyone starts in melee and trades their best melee attack until one side
+    is down. Anything else a combatant could do (effects, reactions, spells,
+    special actions ...) raises UnsupportedError - unless not {strict}, in
+    which case it is ignored and listed in the result. Someone with no melee
+    attack to use always raises it - their real attacks (e.g. a Multiattack)
+    aren't modelled, so they would stand there and the answer would mean nothing"""
+    sides = {_.side for _ in combatants}
+    if len(sides) != 2:
+        raise ValueError(f"Need exactly two sides - not {len(sides)}")
+    if len(combatants) > MAX_COMBATANTS:
+        raise ValueError(f"Can only solve fights of up to {MAX_COMBATANTS} combatants")
+    problems = unsupported(list(combatants))
+    if problems and strict:
+        raise UnsupportedError(f"Can't model: {', '.join(problems)}")
+    unarmed = [_.name for _ in combatants if not melee_attacks(_)]
+    if unarmed:
+        raise UnsupportedError(f"Can't model any attack for: {', '.join(unarmed)}")
+    wins, length = Duel(list(combatants)).solve()
+    return DuelResult(wins, length, problems)
+
+
+# EOF
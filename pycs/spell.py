@@ -4,6 +4,7 @@ from pycs.action import Action
 from pycs.constant import SpellType, Stat, DamageType
 from pycs.damage import Damage
 from pycs.util import check_args
+from pycs.log import log
 
 if TYPE_CHECKING:
     from pycs.creature import Creature
@@ -81,7 +82,7 @@ class SpellAction(Action):
         if not self.owner.spell_available(self):
             return False
         self.owner.cast(self)
-        print(f"{self.owner} is casting {self.name}")
+        log.info("%s is casting %s", self.owner, self.name)
         self.caster = self.owner
         if self.concentration and self.caster.concentration:
             self.caster.remove_concentration()
@@ -119,7 +120,7 @@ class HealthResult(NamedTuple):
 ##############################################################################
 def health_level_of_peers(doer: "Creature") -> Optional[HealthResult]:
     """Return the health levels (missing hp) of peers"""
-    hurt_peers = [HealthResult(_.max_hp - _.hp, id(_), _) for _ in doer.arena.my_side(doer.side) if _.max_hp != 0]
+    hurt_peers = [HealthResult(_.max_hp - _.hp, _.join_order, _) for _ in doer.decision.my_side() if _.max_hp != 0]
     if not hurt_peers:
         return None
     hurt_peers.sort(reverse=True)
@@ -176,8 +177,8 @@ class AttackSpell(SpellAction):
         """Special spell damage"""
         if self.style == SpellType.TOHIT:
             return super().roll_dmg(victim, critical)
-        dmg = self.dmgroll.roll()
-        print(f"{self.owner} rolled {dmg} on {self.dmgroll} for damage")
+        dmg = self.dmgroll.roll(self.rng)
+        log.info("%s rolled %s on %s for damage", self.owner, dmg, self.dmgroll)
         spell_dc = self.save_dc
         if not spell_dc:
             spell_dc = self.owner.spellcast_save
@@ -197,12 +198,12 @@ class AttackSpell(SpellAction):
         """Should we cast this"""
         if not self.owner.spell_available(self):
             return 0
-        pot_target = self.owner.pick_closest_enemy()
+        pot_target = self.owner.pick_closest_enemy(count=1)
         if not pot_target:
             return 0
-        if self.owner.distance(pot_target[0]) > self.range()[1]:
+        if self.owner.decision.distance(pot_target[0]) > self.range()[1]:
             return 0
-        return int(self.max_dmg())
+        return int(self.owner.decision.max_dmg(self))
 
     ########################################################################
     def roll_to_hit(self, target: "Creature") -> tuple[int, bool, bool]:
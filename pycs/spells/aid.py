@@ -6,6 +6,7 @@ from pycs.constant import SpellType
 from pycs.creature import Creature
 from pycs.effect import Effect
 from pycs.spell import SpellAction
+from pycs.log import log
 from .spelltest import SpellTest
 
 
@@ -33,8 +34,8 @@ class Aid(SpellAction):
         """Should we do the spell
         the more people it can effect the more we should do it"""
         close = 0
-        for targ in self.owner.arena.my_side(self.owner.side):
-            if self.owner.distance(targ) <= 30 / 5:
+        for targ in self.owner.decision.my_side():
+            if self.owner.decision.distance(targ) <= 30 / 5:
                 if targ.has_effect("Aid"):
                     continue
                 close += 5
@@ -51,10 +52,10 @@ class Aid(SpellAction):
     def cast(self) -> bool:
         """Do the spell"""
         targets = 3
-        for targ in self.owner.arena.my_side(self.owner.side):
+        for targ in self.owner.arena.roster.my_side(self.owner.side):
             if self.owner.distance(targ) <= 30 / 5:
                 if not targ.has_effect("Aid"):
-                    print(f"{self.owner} casts Aid on {targ}")
+                    log.info("%s casts Aid on %s", self.owner, targ)
                     targ.add_effect(AidEffect(cause=self.owner))
                     targets -= 1
         return True
@@ -2,7 +2,6 @@
 
 from typing import Any, Optional
 from unittest.mock import patch
-import dice
 from pycs.creature import Creature
 from pycs.constant import SpellType
 from pycs.constant import ActionCategory
@@ -10,6 +9,7 @@ from pycs.constant import Stat
 from pycs.effect import Effect
 from pycs.spell import SpellAction
 from pycs.spells.spelltest import SpellTest
+from pycs.log import log
 
 
 ##############################################################################
@@ -44,8 +44,8 @@ class Bless(SpellAction):
         """Should we do the spell"""
         # The more applicable targets the more likely we should do it
         close = 0
-        for targ in self.owner.arena.my_side(self.owner.side):
-            if self.owner.distance(targ) <= self.range()[0]:
+        for targ in self.owner.decision.my_side():
+            if self.owner.decision.distance(targ) <= self.range()[0]:
                 if self.owner.has_effect("Bless"):
                     continue
                 close += 2
@@ -62,11 +62,11 @@ class Bless(SpellAction):
         """Do the spell"""
         self._affected = []
         targets = 3
-        for friend in self.owner.arena.my_side(self.owner.side):
+        for friend in self.owner.arena.roster.my_side(self.owner.side):
             if friend.has_effect("Bless"):
                 continue
             targets -= 1
-            print(f"{friend} is now Blessed")
+            log.info("%s is now Blessed", friend)
             friend.add_effect(BlessEffect(cause=self.owner))
             self._affected.append(friend)
             if targets <= 0:
@@ -93,14 +93,16 @@ class BlessEffect(Effect):
     def hook_attack_to_hit(self, **kwargs: Any) -> int:
         """Mod attack roll"""
         eff = super().hook_attack_to_hit(**kwargs)
-        eff += int(dice.roll("d4"))
+        assert self.owner is not None
+        eff += self.owner.rng.roll("d4")
         return eff
 
     def hook_saving_throw(self, stat: Stat, **kwargs: Any) -> dict:
         """Mod saving throw"""
         eff = super().hook_saving_throw(stat, **kwargs)
-        eff.update({"bonus": int(dice.roll("d4"))})
-        print(f"Bless adds {eff['bonus']} to saving throw")
+        assert self.owner is not None
+        eff.update({"bonus": self.owner.rng.roll("d4")})
+        log.info("Bless adds %s to saving throw", eff["bonus"])
         return eff
 
 
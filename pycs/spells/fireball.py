@@ -3,7 +3,6 @@
 from collections import defaultdict, namedtuple
 from typing import Any, Optional
 from unittest.mock import patch
-import dice
 from pycs.damageroll import DamageRoll
 from pycs.spell import AttackSpell
 from pycs.creature import Creature
@@ -12,6 +11,7 @@ from pycs.constant import DamageType
 from pycs.constant import SpellType
 from pycs.constant import Stat
 from pycs.spells.spelltest import SpellTest
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -50,7 +50,7 @@ class Fireball(AttackSpell):
     ##########################################################################
     def cast(self) -> bool:
         """Do the spell"""
-        for per in self.owner.arena.pick_alive():
+        for per in self.owner.arena.roster.pick_alive():
             if per.distance(self.owner.target) <= 20 / 5:
                 dmg = self.roll_dmg(victim=per)
                 per.hit(dmg, self.owner, False, self.name)
@@ -69,7 +69,7 @@ class Fireball(AttackSpell):
             selfhit = False
 
             # Who we will hit
-            for per in self.owner.arena.pick_alive():
+            for per in self.owner.arena.roster.pick_alive():
                 if per == self:
                     selfhit = True
                 if per.distance(enemy) <= 20 / 5:  # Radius of blast
@@ -79,7 +79,7 @@ class Fireball(AttackSpell):
                     result(
                         sides[enemy.side],
                         999 - sides[self.owner.side],
-                        id(enemy),
+                        enemy.join_order,
                         enemy,
                     )
                 )
@@ -95,7 +95,8 @@ class Fireball(AttackSpell):
     def heuristic(self) -> int:
         """Should we do the spell"""
         if self.pick_target():
-            val = int(dice.roll_max("8d6")) * self._num_enemy - int(1.5 * int(dice.roll_max("8d6"))) * self._num_friend
+            maxdmg = self.dmgroll.roll_max().hp
+            val = maxdmg * self._num_enemy - int(1.5 * maxdmg) * self._num_friend
             return val
         return 0
 
@@ -115,7 +116,7 @@ class TestFireball(SpellTest):
     def test_cast_saved(self) -> None:
         """test casting where victim makes saving throw"""
         self.assertEqual(self.enemy.hp, self.enemy.max_hp)
-        with patch.object(dice, "roll") as mock_dice:
+        with patch.object(Rng, "roll") as mock_dice:
             mock_dice.return_value = 20
             with patch.object(Creature, "rolld20") as mock:
                 mock.return_value = 19
@@ -127,7 +128,7 @@ class TestFireball(SpellTest):
     def test_cast_hit(self) -> None:
         """test casting where victim fails saving throw"""
         self.assertEqual(self.enemy.hp, self.enemy.max_hp)
-        with patch.object(dice, "roll") as mock_dice:
+        with patch.object(Rng, "roll") as mock_dice:
             mock_dice.return_value = 20
             with patch.object(Creature, "rolld20") as mock:
                 mock.return_value = 1
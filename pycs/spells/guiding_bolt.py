@@ -6,6 +6,7 @@ from pycs.spell import AttackSpell
 from pycs.constant import DamageType
 from pycs.constant import SpellType
 from pycs.effect import Effect
+from pycs.log import log
 
 
 ##############################################################################
@@ -61,7 +62,7 @@ class GuidingBoltEffect(Effect):
     ##########################################################################
     def hook_gives_advantage_against(self) -> bool:
         """Gives advantage against creature who has effect"""
-        print(f"{self.name} gives you advantage")
+        log.info("%s gives you advantage", self.name)
         return True
 
     ##########################################################################
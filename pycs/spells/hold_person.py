@@ -10,6 +10,7 @@ from pycs.constant import SpellType
 from pycs.constant import Stat
 from pycs.effect import Effect
 from pycs.spell import SpellAction
+from pycs.log import log
 from .spelltest import SpellTest
 
 
@@ -70,7 +71,7 @@ class HoldPerson(SpellAction):
         """What happens when we stop concentrating"""
         # They could have saved in the meantime
         if self._victim and self._victim.has_effect("Hold Person"):
-            print(f"Removing Hold Person from {self._victim}")
+            log.info("Removing Hold Person from %s", self._victim)
             self._victim.remove_effect("Hold Person")
         self._victim = None
 
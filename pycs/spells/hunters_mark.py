@@ -2,7 +2,6 @@
 
 from typing import Any, Optional
 from unittest.mock import patch
-import dice
 from pycs.action import Action
 from pycs.constant import ActionCategory
 from pycs.constant import SpellType
@@ -12,6 +11,8 @@ from pycs.gear import Shortbow
 from pycs.spell import SpellAction
 from pycs.damageroll import DamageRoll
 from pycs.spells.spelltest import SpellTest
+from pycs.log import log
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -51,7 +52,7 @@ class HuntersMark(SpellAction):
         """Should we do the spell"""
         if self.pick_target():
             return 6
-        print("Hunter's Mark: No enemy in range")
+        log.info("Hunter's Mark: No enemy in range")
         return 0
 
     ##########################################################################
@@ -69,14 +70,14 @@ class HuntersMark(SpellAction):
     def cast(self) -> bool:
         """Do the spell"""
         self.owner.target.add_effect(HuntersMarkEffect(cause=self.owner))
-        print(f"Cast Hunters Mark on {self.owner.target}")
+        log.info("Cast Hunters Mark on %s", self.owner.target)
         return True
 
     ##########################################################################
     def end_concentration(self) -> None:
         """What happens when we stop concentrating"""
         if self.owner.target and self.owner.target.has_effect("Hunters Mark"):
-            print(f"Removing Hunters Mark from {self.owner.target}")
+            log.info("Removing Hunters Mark from %s", self.owner.target)
             self.owner.target.remove_effect("Hunters Mark")
             self.owner.target = None
 
@@ -132,7 +133,7 @@ class TestHuntersMark(SpellTest):
         self.assertEqual(len(self.enemy.damage_this_turn), 0)
         with patch.object(Creature, "rolld20") as mock:
             mock.return_value = 18
-            with patch.object(dice, "roll") as mock_dice:
+            with patch.object(Rng, "roll") as mock_dice:
                 mock_dice.return_value = 5
                 self.caster.do_stuff(categ=ActionCategory.ACTION, moveto=True)
         self.assertEqual(len(self.enemy.damage_this_turn), 2)
@@ -6,6 +6,7 @@ from pycs.spell import SpellAction
 from pycs.constant import SpellType
 from pycs.constant import Condition
 from pycs.constant import ActionCategory
+from pycs.log import log
 from .spelltest import SpellTest
 
 
@@ -40,7 +41,7 @@ class LesserRestoration(SpellAction):
         ):
             if self.owner.target.has_condition(cond):
                 self.owner.target.remove_condition(cond)
-                print(f"{self.owner} cured {self.owner.target} of {cond.value}")
+                log.info("%s cured %s of %s", self.owner, self.owner.target, cond.describe())
                 break
         return True
 
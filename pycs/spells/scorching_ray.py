@@ -8,6 +8,7 @@ from pycs.damageroll import DamageRoll
 from pycs.constant import SpellType
 from pycs.creature import Creature
 from pycs.spell import AttackSpell
+from pycs.log import log
 from .spelltest import SpellTest
 
 
@@ -50,13 +51,13 @@ class ScorchingRay(AttackSpell):
             if not targets:
                 return False
             target = targets[0]
-            print(f"Targeting {target} with Scorching Ray")
+            log.info("Targeting %s with Scorching Ray", target)
             to_hit, crit_hit, crit_miss = self.roll_to_hit(target)
             if to_hit >= target.ac and not crit_miss:
                 dmg = self.roll_dmg(self.owner, target)
                 target.hit(dmg, self.owner, crit_hit, self.name)
             else:
-                print(f"Scorching Ray missed {target} (Rolled {to_hit} < AC: {target.ac})")
+                log.info("Scorching Ray missed %s (Rolled %s < AC: %s)", target, to_hit, target.ac)
         return True
 
     ##########################################################################
@@ -47,12 +47,12 @@ class ShieldOfFaith(SpellAction):
     def pick_target(self) -> Optional[Creature]:
         """Who gets the spell - person with the lowest AC"""
         targets = []
-        for friend in self.owner.arena.my_side(self.owner.side):
+        for friend in self.owner.arena.roster.my_side(self.owner.side):
             if friend.has_effect(self.name):
                 continue
             if self.owner.distance(friend) > self.range()[0]:
                 continue
-            targets.append((friend.ac, id(friend), friend))
+            targets.append((friend.ac, friend.join_order, friend))
         targets.sort()
         if not targets:
             return None
@@ -102,6 +102,7 @@ class TestShieldOfFaith(SpellTest):
         self.caster.options_this_turn = [ActionCategory.BONUS]
         self.caster.add_action(ShieldOfFaith())
         self.caster._ac = 19  # pylint: disable=protected-access
+        self.caster.forget_derived()
         self.caster.speed = 90  # Ensure we can get to friend
 
     ##########################################################################
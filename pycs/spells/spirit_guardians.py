@@ -79,6 +79,8 @@ class SpiritGuardians(SpellAction):
 class SpiritGuardianEffect(Effect):
     """Spirit Guardian Effect"""
 
+    aura_radius = 15 // 5
+
     ##########################################################################
     def __init__(self, **kwargs: Any):
         """Initialise"""
@@ -101,7 +103,7 @@ class SpiritGuardianEffect(Effect):
         if creat in self._victims:
             return
         self._victims.add(creat)
-        dmg = DamageRoll("3d8", 0, DamageType.RADIANT).roll()
+        dmg = DamageRoll("3d8", 0, DamageType.RADIANT).roll(self.cause.rng)
         if creat.saving_throw(Stat.WIS, self.cause.spellcast_save):
             dmg //= 2
         creat.hit(dmg, self.cause, False, "Spirit Guardian")
@@ -120,11 +122,26 @@ class TestSpiritGuardians(SpellTest):
 
     ##########################################################################
     def test_cast(self) -> None:
-        """Test casting"""
+        """Test casting - enemies in the area are hurt until it ends"""
+        self.arena[self.enemy.coords] = None
+        self.arena[self.caster.coords] = None
+        self.arena[(0, 0)] = self.enemy
+        self.enemy.coords = (0, 0)
+        self.arena[(2, 2)] = self.caster
+        self.caster.coords = (2, 2)
         self.caster.do_stuff(categ=ActionCategory.ACTION, moveto=False)
         self.assertTrue(self.caster.has_effect("Spirit Guardian"))
-        self.caster.remove_concentration()
-        self.assertFalse(self.caster.has_effect("Spirit Guardian"))
+        with patch.object(Creature, "rolld20") as mock:
+            mock.return_value = 1
+            self.arena.check_auras()
+            self.assertLess(self.enemy.hp, self.enemy.max_hp)
+            self.caster.remove_concentration()
+            self.assertFalse(self.caster.has_effect("Spirit Guardian"))
+            stats = {"str": 10, "int": 10, "dex": 10, "wis": 10, "con": 10, "cha": 10, "hp": 30, "ac": 10}
+            latecomer = Creature(name="latecomer", side="b", **stats)
+            self.arena.add_combatant(latecomer, (3, 3))
+            self.arena.check_auras()
+            self.assertEqual(latecomer.hp, latecomer.max_hp)
 
     ##########################################################################
     def test_saved(self) -> None:
@@ -1,90 +1,206 @@
 """ Creature Statistics"""
-from typing import Any, Iterator, List, Self
+from array import array
+from collections import namedtuple
+from typing import Any, Iterator, Optional, Self, Sequence
 from pycs.creature import Creature
 
+# Interned id used when an event has no source or target
+NO_NAME = -1
+
+# Positions in the running totals for each attack
+HITS, MISSES, DAMAGE, CRITS = range(4)
+
+# The columns events are kept in and their array typecodes
+EVENT_COLUMNS = {
+    "atkname": "i",
+    "source": "i",
+    "sourcetype": "i",
+    "target": "i",
+    "targettype": "i",
+    "hit": "b",
+    "critical": "b",
+    "damage": "i",
+}
+
+# The columns holding interned names
+NAME_COLUMNS = ("atkname", "source", "sourcetype", "target", "targettype")
+
+# Running totals - [hits, misses, damage, crits] of each attack:
+#   creature: (source, sourcetype) -> atkname -> totals
+#   type: sourcetype -> atkname -> totals
+Totals = namedtuple("Totals", "creature type")
+
 
 ##############################################################################
 ##############################################################################
 ##############################################################################
 class Statistics:
-    """Creature Statistics"""
+    """Creature Statistics
+    Events are kept column by column - names are interned to ints so each
+    event only costs a few bytes no matter how many rounds are run.
+    Totals per creature and per type are kept up to date as events are
+    added; with {summary_only} only the totals are kept"""
 
-    def __init__(self) -> None:
-        self._data: List = []
+    def __init__(self, summary_only: bool = False) -> None:
+        self.summary_only = summary_only
+        self._names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._totals = Totals({}, {})
+        self._events: dict[str, array] = {}
+        self._clear_events()
 
+    ##########################################################################
+    def _clear_events(self) -> None:
+        """Start the event columns again"""
+        self._events = {name: array(code) for name, code in EVENT_COLUMNS.items()}
+
+    ##########################################################################
+    def _intern(self, name: str) -> int:
+        """Return the id for {name} - adding it if it is new"""
+        try:
+            return self._name_ids[name]
+        except KeyError:
+            self._name_ids[name] = len(self._names)
+            self._names.append(name)
+            return self._name_ids[name]
+
+    ##########################################################################
+    def _lookup(self, name: str) -> Optional[int]:
+        """Return the id for {name} if we have seen it"""
+        return self._name_ids.get(name)
+
+    ##########################################################################
     def add(self, **kwargs: Any) -> None:
         """Add damage to the creature stats"""
-        vals = {
-            "hit": kwargs.get("hit", False),
-            "atkname": kwargs.get("atkname", ""),
-            "critical": kwargs.get("critical", False),
-            "damage": kwargs.get("dmg", 0),
-        }
+        hit = bool(kwargs.get("hit", False))
+        atkname = self._intern(kwargs.get("atkname", ""))
+        critical = bool(kwargs.get("critical", False))
+        damage = int(kwargs.get("dmg", 0))
         target = kwargs.get("target")
         if target:
-            vals["targettype"] = target.__class__.__name__
-            vals["target"] = target.name
+            targettype = self._intern(target.__class__.__name__)
+            targetname = self._intern(target.name)
+        else:
+            targettype = targetname = NO_NAME
         source = kwargs.get("source")
         if source:
-            vals["sourcetype"] = source.__class__.__name__
-            vals["source"] = source.name
+            sourcetype = self._intern(source.__class__.__name__)
+            sourcename = self._intern(source.name)
+        else:
+            sourcetype = sourcename = NO_NAME
 
-        self._data.append(vals)
+        if sourcetype != NO_NAME:
+            counts = (int(hit), int(not hit), damage, int(critical))
+            self._tally(self._totals.creature, (sourcename, sourcetype), atkname, counts)
+            self._tally(self._totals.type, sourcetype, atkname, counts)
+        if self.summary_only:
+            return
+        events = self._events
+        events["hit"].append(hit)
+        events["atkname"].append(atkname)
+        events["critical"].append(critical)
+        events["damage"].append(damage)
+        events["targettype"].append(targettype)
+        events["target"].append(targetname)
+        events["sourcetype"].append(sourcetype)
+        events["source"].append(sourcename)
 
     ##########################################################################
-    def _creature_source(self, creature: Creature) -> Iterator[dict]:
-        """Dump the stats for a specific creature"""
-        for stat in self._data:
-            if stat["source"] == creature.name and stat["sourcetype"] == creature.__class__.__name__:
-                yield stat
+    @staticmethod
+    def _tally(totals: dict, key: Any, atkname: int, counts: Sequence[int]) -> None:
+        """Add {counts} to the running totals of {atkname} under {key}"""
+        attacks = totals.setdefault(key, {})
+        try:
+            running = attacks[atkname]
+        except KeyError:
+            attacks[atkname] = list(counts)
+            return
+        for idx, count in enumerate(counts):
+            running[idx] += count
 
     ##########################################################################
-    def _type_source(self, creaturetype: str) -> Iterator[dict]:
-        """Dump the stats for a specific creature type"""
-        for stat in self._data:
-            if stat["sourcetype"] == stat["sourcetype"] == creaturetype:
-                yield stat
+    def __len__(self) -> int:
+        return len(self._events["hit"])
 
     ##########################################################################
-    def _summary(self, iterator: Iterator) -> dict[str, dict]:
+    def events(self) -> Iterator[dict]:
+        """Yield each event that has been kept"""
+        events = self._events
+        for idx, hit in enumerate(events["hit"]):
+            yield {
+                "hit": bool(hit),
+                "atkname": self._names[events["atkname"][idx]],
+                "critical": bool(events["critical"][idx]),
+                "damage": events["damage"][idx],
+                "source": self._name_or_none(events["source"][idx]),
+                "sourcetype": self._name_or_none(events["sourcetype"][idx]),
+                "target": self._name_or_none(events["target"][idx]),
+                "targettype": self._name_or_none(events["targettype"][idx]),
+            }
+
+    ##########################################################################
+    def _name_or_none(self, name_id: int) -> Optional[str]:
+        """Reverse of _intern()"""
+        return None if name_id == NO_NAME else self._names[name_id]
+
+    ##########################################################################
+    def _summary(self, attacks: dict[int, list[int]]) -> dict[str, dict]:
         """Generic stats summary"""
         stats: dict[str, dict] = {}
-        for stat in iterator:
-            atkname = stat["atkname"]
-            if atkname not in stats:
-                stats[atkname] = {"hits": 0, "misses": 0, "damage": 0, "crits": 0}
-            if stat["hit"]:
-                stats[atkname]["hits"] += 1
-            else:
-                stats[atkname]["misses"] += 1
-            if stat["critical"]:
-                stats[atkname]["crits"] += 1
-            if stat["damage"]:
-                stats[atkname]["damage"] += int(stat["damage"])
+        for atkname, running in attacks.items():
+            stats[self._names[atkname]] = {
+                "hits": running[HITS],
+                "misses": running[MISSES],
+                "damage": running[DAMAGE],
+                "crits": running[CRITS],
+            }
         return stats
 
     ##########################################################################
     def creature_summary(self, creature: Creature) -> dict:
         """Return a summary for attacks from {creature}"""
-        return self._summary(self._creature_source(creature))
+        name = self._lookup(creature.name)
+        typ = self._lookup(creature.__class__.__name__)
+        if name is None or typ is None:
+            return {}
+        return self._summary(self._totals.creature.get((name, typ), {}))
 
     ##########################################################################
     def type_summary(self, type_: str) -> dict:
         """Return the stats for all the creatures of {type}"""
-        return self._summary(self._type_source(type_))
+        typ = self._lookup(type_)
+        if typ is None:
+            return {}
+        return self._summary(self._totals.type.get(typ, {}))
 
     ##########################################################################
     def all_types(self) -> Iterator[str]:
         """Yield every type of creature in the stats"""
-        yielded = set()
-        for stat in self._data:
-            if stat["sourcetype"] not in yielded:
-                yielded.add(stat["sourcetype"])
-                yield stat["sourcetype"]
+        for sourcetype in self._totals.type:
+            yield self._names[sourcetype]
 
     ##########################################################################
     def __add__(self, other: Self) -> Self:
-        self._data.extend(other._data)
+        # Map the other's ids onto ours - the trailing NO_NAME keeps NO_NAME (-1) as is
+        remap = [self._intern(_) for _ in other._names] + [NO_NAME]
+        for (source, sourcetype), attacks in other._totals.creature.items():
+            for atkname, running in attacks.items():
+                self._tally(self._totals.creature, (remap[source], remap[sourcetype]), remap[atkname], running)
+        for sourcetype, attacks in other._totals.type.items():
+            for atkname, running in attacks.items():
+                self._tally(self._totals.type, remap[sourcetype], remap[atkname], running)
+
+        # Can't keep a partial set of events
+        if other.summary_only and not self.summary_only:
+            self._clear_events()
+            self.summary_only = True
+        if self.summary_only:
+            return self
+        for name, column in self._events.items():
+            if name in NAME_COLUMNS:
+                column.extend(array("i", [remap[_] for _ in other._events[name]]))
+            else:
+                column.extend(other._events[name])
         return self
 
 
@@ -0,0 +1,185 @@
+""" Parameter sweeps - the same scenario run over a grid of values """
+import itertools
+import json
+from typing import Any, Iterator, Optional
+from prettytable import PrettyTable
+
+import pycs
+from pycs import characters, gear, monsters, races
+from pycs.cache import DEFAULT_CACHE_PATH, Combats, ResultCache
+from pycs.encounter import Encounter
+from pycs.rng import Seed
+from pycs.statistics import Statistics
+
+# Strings starting with this in a scenario are replaced by the axis value
+PARAM = "$"
+
+# Where the "type" of each combatant and item in a scenario is looked up
+CREATURE_MODULES = (characters, monsters)
+GEAR_MODULES = (gear,)
+
+
+##############################################################################
+def substitute(scenario: Any, values: dict[str, Any]) -> Any:
+    """A copy of {scenario} with every "$name" replaced by values[name]"""
+    if isinstance(scenario, dict):
+        return {key: substitute(val, values) for key, val in scenario.items()}
+    if isinstance(scenario, list):
+        return [substitute(_, values) for _ in scenario]
+    if isinstance(scenario, str) and scenario.startswith(PARAM):
+        return values[scenario.removeprefix(PARAM)]
+    return scenario
+
+
+##############################################################################
+def describe(scenario: dict[str, Any]) -> str:
+    """Canonical text of a (substituted) scenario - the same however it was written"""
+    return json.dumps(scenario, sort_keys=True)
+
+
+##############################################################################
+def _lookup(name: str, modules: tuple[Any, ...]) -> Any:
+    """Find the class called {name}"""
+    for mod in modules:
+        if name in mod.__all__:
+            return getattr(mod, name)
+    raise ValueError(f"Don't know what a '{name}' is")
+
+
+##############################################################################
+def _unique_name(name: str, side: str, taken: set[str]) -> str:
+    """{name} - or, if someone already has it, the same qualified by {side}
+    (and numbered if need be). Every creature rolls from a stream named after
+    it so two with the same name would share one"""
+    unique = name
+    num = 1
+    while unique in taken:
+        num += 1
+        unique = f"{name} ({side})" if num == 2 else f"{name} ({side} {num - 1})"
+    taken.add(unique)
+    return unique
+
+
+##############################################################################
+def build_encounter(scenario: dict[str, Any]) -> Encounter:
+    """Make an encounter from a scenario - side -> list of combatants
+    Each combatant is a dict with a "type" (class name), an optional "count"
+    and the keyword arguments for the class. "race" is a race name and "gear"
+    a list of dicts each with a "type" and its keyword arguments. Names are
+    made unique so nobody shares anybody else's rolls"""
+    enc = Encounter()
+    taken: set[str] = set()
+    enc.scenario = describe(scenario)
+    for side, combatants in scenario.items():
+        for details in combatants:
+            kwargs = dict(details)
+            klass = _lookup(kwargs.pop("type"), CREATURE_MODULES)
+            count = kwargs.pop("count", 1)
+            name = kwargs.pop("name", klass.__name__)
+            if "race" in kwargs:
+                kwargs["race"] = getattr(races, kwargs["race"])
+            items = kwargs.pop("gear", [])
+            for num in range(count):
+                equipment = [
+                    _lookup(_["type"], GEAR_MODULES)(**{k: v for k, v in _.items() if k != "type"}) for _ in items
+                ]
+                if equipment:
+                    kwargs["gear"] = equipment
+                unique = _unique_name(f"{name}{num}" if count > 1 else name, side, taken)
+                enc.add_combatant(klass(name=unique, side=side, **kwargs))
+    return enc
+
+
+##############################################################################
+def run_cell(scenario: dict[str, Any], first: int, rounds: int, seed: Seed) -> tuple[dict[str, int], Statistics]:
+    """Fight (part of) one cell of a sweep - how many times each side won"""
+    wins, stats = pycs.run_batch(first, rounds, seed, encounter=build_encounter(scenario))
+    return dict(wins), stats
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class Sweep:
+    """Run {scenario} for every combination of {axes} values
+    Each axis is a name used as "$name" in the scenario and the values to try.
+    Results are kept in a ResultCache at {cache_path} (only in memory if it
+    is None) so re-running only fights the cells - and rounds - that haven't
+    been seen before"""
+
+    ##########################################################################
+    def __init__(
+        self,
+        scenario: dict[str, Any],
+        axes: dict[str, list[Any]],
+        rounds: int,
+        seed: Seed = 0,
+        cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+    ):
+        self.scenario = scenario
+        self.axes = axes
+        self.rounds = rounds
+        self.seed = seed
+        self.cache = ResultCache(cache_path or ":memory:")
+
+    ##########################################################################
+    def __repr__(self) -> str:
+        return f"<Sweep {len(list(self.cells()))} cells of {self.rounds} rounds>"
+
+    ##########################################################################
+    def cells(self) -> Iterator[dict[str, Any]]:
+        """Every combination of the axis values"""
+        names = list(self.axes)
+        for values in itertools.product(*self.axes.values()):
+            yield dict(zip(names, values))
+
+    ##########################################################################
+    def run(self, workers: int = 1) -> list[tuple[dict[str, Any], dict[str, int]]]:
+        """The wins for each side in every cell - fighting whatever isn't
+        already known across {workers} processes"""
+        cells = list(self.cells())
+        scenarios = [substitute(self.scenario, _) for _ in cells]
+        # Cells with the same content (e.g. a value of 0 for a count) are only fought once
+        todo = {}
+        for scen in scenarios:
+            for first, count in self.cache.missing(describe(scen), self.seed, 0, self.rounds):
+                todo[(describe(scen), first)] = (scen, first, count)
+        jobs = list(todo.values())
+        if workers <= 1:
+            fought = [run_cell(scen, first, count, self.seed) for scen, first, count in jobs]
+        else:
+            with pycs.new_pool(workers) as pool:
+                fought = list(pool.map(run_cell, *zip(*jobs), [self.seed] * len(jobs)))
+        for (scen, first, count), (wins, stats) in zip(jobs, fought):
+            self.cache.store(Combats(describe(scen), self.seed, first, count), wins, stats)
+
+        results = []
+        for cell, scen in zip(cells, scenarios):
+            wins, _ = self.cache.run(
+                describe(scen),
+                self.seed,
+                0,
+                self.rounds,
+                lambda first, count, scen=scen: run_cell(scen, first, count, self.seed),  # type: ignore
+            )
+            results.append((cell, dict(wins)))
+        return results
+
+
+##############################################################################
+def sweep_report(results: list[tuple[dict[str, Any], dict[str, int]]]) -> None:
+    """Print the win percentages for each cell of a sweep"""
+    if not results:
+        return
+    axes = list(results[0][0])
+    sides = sorted({side for _, wins in results for side in wins})
+    tbl = PrettyTable()
+    tbl.field_names = axes + [f"{_} %" for _ in sides]
+    for cell, wins in results:
+        total = sum(wins.values())
+        tbl.add_row([cell[_] for _ in axes] + [100.0 * wins.get(_, 0) / total for _ in sides])
+    tbl.float_format = ".1"
+    print(tbl)
+
+
+# EOF
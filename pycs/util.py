@@ -1,6 +1,7 @@
 """ Utility functions """
 
 
+import math
 from typing import Any
 
 
@@ -10,4 +11,16 @@ def check_args(valid: set[str], cname: str, kwargs: dict[str, Any]) -> None:
         assert arg in valid, f"{cname}: '{arg}' not in {valid}"
 
 
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> tuple[float, float]:
+    """Wilson score interval for a proportion - 95% with the default {z}
+    Unlike the normal approximation it behaves near 0 and 1 and for small {trials}"""
+    if trials == 0:
+        return 0.0, 1.0
+    phat = successes / trials
+    denom = 1 + z * z / trials
+    centre = (phat + z * z / (2 * trials)) / denom
+    spread = z * math.sqrt(phat * (1 - phat) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
 # EOF
@@ -16,6 +16,7 @@ from pycs.constant import Stat
 from pycs.creature import Creature
 from pycs.effect import Effect
 from pycs.equipment import Equipment
+from pycs.log import get_level, set_level, QUIET
 
 
 ##############################################################################
@@ -92,6 +93,13 @@ class TestAction(unittest.TestCase):
         # 5 for DummyAction atk_bonus, 2 for prof bonus, 3 for dummy effect
         self.assertEqual(to_hit, 10 + 5 + 2 + 3)
         self.assertEqual(msg, "+5 (stat modifier), +2 (prof bonus), +3 from Dummy Effect")
+        # Nothing to say if nobody is listening
+        level = get_level()
+        set_level(QUIET)
+        try:
+            self.assertEqual(act.calculate_to_hit(10, self.alpha), (20, ""))
+        finally:
+            set_level(level)
 
     ########################################################################
     def test_buff_attack_damage(self) -> None:
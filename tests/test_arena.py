@@ -6,6 +6,8 @@
 import unittest
 from unittest.mock import Mock
 from pycs.arena import Arena
+from pycs.creature import Creature
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -41,6 +43,30 @@ class TestArena(unittest.TestCase):
         dist = self.arena.distance(self.critter1, self.critter2)
         self.assertEqual(dist, 9)
 
+    ########################################################################
+    def test_seeded_placement(self) -> None:
+        """Test the same seed places combatants in the same spots"""
+        coords = []
+        for _ in range(2):
+            arena = Arena(max_x=21, max_y=21, rng=Rng(5))
+            critters = [Mock(), Mock(), Mock()]
+            for critter in critters:
+                arena.add_combatant(critter)
+            coords.append([_.coords for _ in critters])
+        self.assertEqual(coords[0], coords[1])
+
+    ########################################################################
+    def test_grid(self) -> None:
+        """Test the edges of the grid"""
+        self.assertEqual(self.arena.neighbors((0, 0)), [(0, 1), (1, 0), (1, 1)])
+        self.arena[(1, 1)] = self.critter1
+        self.assertEqual(self.arena.neighbors((0, 0)), [(0, 1), (1, 0)])
+        self.assertEqual(len(self.arena.neighbors((20, 10))), 5)
+        with self.assertRaises(KeyError):
+            self.arena[(21, 0)]  # pylint: disable=pointless-statement
+        with self.assertRaises(KeyError):
+            self.arena[(-1, 3)] = self.critter2
+
     ########################################################################
     def test_closest_friend(self) -> None:
         """Test pick_closest_friends()"""
@@ -69,6 +95,66 @@ class TestArena(unittest.TestCase):
         enemy = self.arena.pick_closest_enemy(self.critter1)
         self.assertEqual(enemy, [self.critter2, self.critter3])
 
+    ########################################################################
+    def test_pick_nearest(self) -> None:
+        """Test limiting the closest by count and range"""
+        arena = Arena(max_x=40, max_y=40)
+        critters = [Mock(side="a") for _ in range(5)]
+        for critter, coords in zip(critters, [(0, 0), (30, 30), (2, 1), (12, 0), (1, 1)]):
+            arena.add_combatant(critter, coords)
+        wanted = lambda _: True  # noqa: E731
+        self.assertEqual(arena.pick_nearest((0, 0), wanted, count=2), [critters[0], critters[4]])
+        self.assertEqual(arena.pick_nearest((0, 0), wanted, within=2), [critters[0], critters[4], critters[2]])
+        self.assertEqual(arena.pick_nearest((29, 29), wanted, count=1), [critters[1]])
+        # Moving and removing keep the index up to date
+        arena[(0, 0)] = None
+        arena[(35, 35)] = critters[3]
+        arena[(12, 0)] = None
+        self.assertEqual(arena.pick_nearest((34, 34), wanted), [critters[3], critters[1], critters[2], critters[4]])
+
+    ########################################################################
+    def test_move_towards(self) -> None:
+        """Test move_towards() around an obstacle"""
+        self.arena.add_combatant(self.critter1, (0, 2))
+        self.arena.add_combatant(self.critter2, (4, 2))
+        for coords in [(1, 1), (1, 2), (1, 3)]:
+            self.arena.add_combatant(Mock(), coords)
+        route = self.arena.find_route((0, 2), (4, 2))
+        self.assertEqual(len(route), 5)
+        self.assertIn(route[-1], [(3, 1), (3, 2), (3, 3)])
+        newloc = self.arena.move_towards(self.critter1, (4, 2))
+        self.assertEqual(newloc, route[1])
+        self.assertEqual(self.arena[newloc], self.critter1)
+        self.assertIsNone(self.arena[(0, 2)])
+
+    ########################################################################
+    def test_move_towards_blocked(self) -> None:
+        """Test move_towards() finds a new route when the old one is blocked"""
+        self.arena.add_combatant(self.critter1, (0, 0))
+        self.arena.add_combatant(self.critter2, (6, 0))
+        self.assertEqual(self.arena.move_towards(self.critter1, (6, 0)), (1, 0))
+        self.critter1.coords = (1, 0)
+        self.arena.add_combatant(self.critter3, (2, 0))
+        newloc = self.arena.move_towards(self.critter1, (6, 0))
+        self.assertIn(newloc, [(2, 1)])
+
+    ########################################################################
+    def test_broadcast(self) -> None:
+        """Test only the interested hear about events"""
+        kwargs = {"str": 10, "int": 10, "dex": 10, "wis": 10, "con": 10, "cha": 10, "hp": 10, "ac": 10, "side": "a"}
+        near = Watcher(**kwargs)
+        far = Watcher(**kwargs)
+        dier = Creature(**kwargs)
+        self.arena.add_combatant(near, (0, 0))
+        self.arena.add_combatant(far, (10, 10))
+        self.arena.add_combatant(dier, (1, 1))
+        self.arena.add_combatant(self.critter1, (5, 5))
+        self.assertEqual(list(self.arena.roster.listeners("hook_see_someone_die")), [near, far])
+        self.assertEqual(list(self.arena.roster.listeners("start_others_turn")), [])
+        self.arena.broadcast("hook_see_someone_die", dier)
+        self.assertEqual(near.seen, [dier])
+        self.assertEqual(far.seen, [])
+
     ########################################################################
     def test_move_away(self) -> None:
         """test move_away()"""
@@ -78,4 +164,20 @@ class TestArena(unittest.TestCase):
         self.assertEqual(newloc, (4, 4))
 
 
+##############################################################################
+class Watcher(Creature):
+    """Creature that notices deaths close by"""
+
+    hook_radius = {"hook_see_someone_die": 2}
+
+    ########################################################################
+    def __init__(self, **kwargs: int | str):
+        super().__init__(**kwargs)
+        self.seen: list[Creature] = []
+
+    ########################################################################
+    def hook_see_someone_die(self, creat: Creature) -> None:
+        self.seen.append(creat)
+
+
 # EOF
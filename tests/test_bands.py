@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+"""Tests for `bands`"""
+
+
+import unittest
+from unittest.mock import Mock, patch
+import pycs
+from pycs.creature import Creature
+from pycs.bands import BandArena, BANDS, BAND_WIDTH, ENGAGED
+from pycs.encounter import Encounter
+from pycs.log import get_level, set_level, QUIET
+from pycs.rng import Rng
+
+
+##############################################################################
+##############################################################################
+class TestBandArena(unittest.TestCase):
+    """Tests for `bands` package."""
+
+    ########################################################################
+    def setUp(self) -> None:
+        """Set up test fixtures, if any."""
+        self.arena = BandArena(rng=Rng(1))
+        self.critter1 = Mock(side="a", join_order=0, moves=6)
+        self.critter2 = Mock(side="b", join_order=1, moves=6)
+
+    ########################################################################
+    def test_distance(self) -> None:
+        """Test engaged, near and far"""
+        self.assertEqual(self.arena.distance_coords((2, 0), (2, 0)), ENGAGED)
+        self.assertEqual(self.arena.distance_coords((2, 0), (3, 0)), BAND_WIDTH)
+        self.assertEqual(self.arena.distance_coords((4, 0), (0, 0)), 4 * BAND_WIDTH)
+
+    ########################################################################
+    def test_placement(self) -> None:
+        """Test each side starts in its own half - sharing the engaged band"""
+        for _ in range(10):
+            self.arena.add_combatant(Mock(side="a"))
+            self.arena.add_combatant(Mock(side="b"))
+        middle = len(BANDS) // 2
+        for comb in self.arena.roster.pick_everyone():
+            self.assertEqual(comb.coords[1], 0)
+            if comb.side == "a":
+                self.assertLessEqual(comb.coords[0], middle)
+            else:
+                self.assertGreaterEqual(comb.coords[0], middle)
+        self.assertIsNone(self.arena[(middle, 0)])
+        with self.assertRaises(KeyError):
+            self.arena[(len(BANDS), 0)] = self.critter1
+
+    ########################################################################
+    def test_seeded_placement(self) -> None:
+        """Test the same seed places combatants in the same bands"""
+        coords = []
+        for _ in range(2):
+            arena = BandArena(rng=Rng(5))
+            critters = [Mock(side="a"), Mock(side="b"), Mock(side="a")]
+            for critter in critters:
+                arena.add_combatant(critter)
+            coords.append([_.coords for _ in critters])
+        self.assertEqual(coords[0], coords[1])
+
+    ########################################################################
+    def test_move_towards(self) -> None:
+        """Test moving is a band at a time and stops once engaged"""
+        self.arena.add_combatant(self.critter1)
+        self.arena.add_combatant(self.critter2)
+        self.critter1.coords = (0, 0)
+        self.critter2.coords = (2, 0)
+        self.assertEqual(self.arena.move_towards(self.critter1, self.critter2.coords), (1, 0))
+        self.assertEqual(self.arena.moves_used(self.critter1, (0, 0), (1, 0)), BAND_WIDTH)
+        self.critter1.coords = (2, 0)
+        self.assertEqual(self.arena.move_towards(self.critter1, self.critter2.coords), (2, 0))
+        self.assertEqual(self.arena.move_towards(self.critter2, (0, 0)), (1, 0))
+        # Not enough moves left to get across a band
+        self.critter2.moves = BAND_WIDTH // 2 - 1
+        self.assertEqual(self.arena.move_towards(self.critter2, (0, 0)), (2, 0))
+
+    ########################################################################
+    def test_move_away(self) -> None:
+        """Test moving away - but not off the end"""
+        self.arena.add_combatant(self.critter1)
+        self.arena.add_combatant(self.critter2)
+        self.critter1.coords = (1, 0)
+        self.critter2.coords = (2, 0)
+        self.assertEqual(self.arena.move_away(self.critter1, self.critter2), (0, 0))
+        self.assertEqual(self.arena.move_away(self.critter2, self.critter1), (3, 0))
+        self.critter1.coords = (0, 0)
+        self.assertEqual(self.arena.move_away(self.critter1, self.critter2), (0, 0))
+        # Engaged - away from the middle
+        self.critter1.coords = (3, 0)
+        self.critter2.coords = (3, 0)
+        self.assertEqual(self.arena.move_away(self.critter1, self.critter2), (4, 0))
+
+    ########################################################################
+    def test_move_to_target(self) -> None:
+        """Test a creature crosses a band in one go and uses up its moves"""
+        kwargs = {"str": 10, "int": 10, "dex": 10, "wis": 10, "con": 10, "cha": 10, "hp": 10, "ac": 10}
+        runner = Creature(name="runner", side="a", speed=60, **kwargs)
+        target = Creature(name="target", side="b", **kwargs)
+        self.arena.add_combatant(runner)
+        self.arena.add_combatant(target)
+        runner.coords = (0, 0)
+        target.coords = (4, 0)
+        with patch.object(self.arena, "check_auras") as auras:
+            runner.move_to_target(target, 1)
+        self.assertEqual(runner.coords, (2, 0))
+        self.assertEqual(runner.moves, 0)
+        self.assertEqual(auras.call_count, 2)
+
+    ########################################################################
+    def test_pick_nearest(self) -> None:
+        """Test the closest by band then join order"""
+        critters = [Mock(side="a", join_order=_) for _ in range(4)]
+        for critter, band in zip(critters, [4, 1, 0, 1]):
+            self.arena.add_combatant(critter)
+            critter.coords = (band, 0)
+        wanted = lambda _: True  # noqa: E731
+        self.assertEqual(self.arena.pick_nearest((1, 0), wanted), [critters[1], critters[3], critters[2], critters[0]])
+        self.assertEqual(self.arena.pick_nearest((1, 0), wanted, count=1), [critters[1]])
+        self.assertEqual(
+            self.arena.pick_nearest((0, 0), wanted, within=BAND_WIDTH), [critters[2], critters[1], critters[3]]
+        )
+
+    ########################################################################
+    def test_combat(self) -> None:
+        """Test a whole seeded combat runs - and is repeatable"""
+        level = get_level()
+        set_level(QUIET)
+        try:
+            winners = [pycs.combat_test("bands", engine="band")[0] for _ in range(2)]
+        finally:
+            set_level(level)
+        self.assertEqual(winners[0], winners[1])
+        self.assertIn(winners[0], ("Humans", "Gnoll"))
+
+    ########################################################################
+    def test_against_grid(self) -> None:
+        """Test the bands pick the same winner as the grid in a one sided fight"""
+        encounter = Encounter(pycs.monster_army, pycs.human_army)
+        level = get_level()
+        set_level(QUIET)
+        try:
+            for engine in pycs.ENGINES:
+                wins, _ = pycs.run_batch(0, 5, "against", encounter, engine=engine)
+                self.assertEqual(dict(wins), {"Monsters": 5}, engine)
+        finally:
+            set_level(level)
+
+
+# EOF
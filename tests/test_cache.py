@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+"""Tests for `cache`"""
+
+
+import unittest
+from unittest.mock import Mock
+from pycs.cache import Combats, ResultCache, code_version
+from pycs.statistics import Statistics
+
+
+##############################################################################
+def fight(first: int, rounds: int) -> tuple[dict[str, int], Statistics]:
+    """Pretend to fight - side "a" wins the even numbered combats"""
+    evens = len([_ for _ in range(first, first + rounds) if _ % 2 == 0])
+    return {"a": evens, "b": rounds - evens}, Statistics(summary_only=True)
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class TestResultCache(unittest.TestCase):
+    """Tests for `ResultCache` class."""
+
+    ########################################################################
+    def setUp(self) -> None:
+        """Set up test fixtures, if any."""
+        self.cache = ResultCache(":memory:")
+
+    ########################################################################
+    def tearDown(self) -> None:
+        """Tear down test fixtures, if any."""
+        self.cache.close()
+
+    ########################################################################
+    def test_code_version(self) -> None:
+        """Test the code version is stable"""
+        self.assertEqual(code_version(), code_version())
+        self.assertEqual(len(code_version()), 64)
+
+    ########################################################################
+    def test_only_missing(self) -> None:
+        """Test only the combats that aren't known are fought"""
+        mock = Mock(side_effect=fight)
+        wins, stats = self.cache.run("scen", 1, 10, 10, mock)
+        self.assertEqual(dict(wins), {"a": 5, "b": 5})
+        self.assertIsInstance(stats, Statistics)
+        self.assertEqual(mock.call_args_list[-1].args, (10, 10))
+
+        self.assertEqual(self.cache.missing("scen", 1, 0, 30), [(0, 10), (20, 10)])
+        wins, _ = self.cache.run("scen", 1, 0, 30, mock)
+        self.assertEqual(dict(wins), {"a": 15, "b": 15})
+        self.assertEqual([_.args for _ in mock.call_args_list[1:]], [(0, 10), (20, 10)])
+
+        wins, _ = self.cache.run("scen", 1, 0, 30, mock)
+        self.assertEqual(mock.call_count, 3)
+        self.assertEqual(dict(wins), {"a": 15, "b": 15})
+
+    ########################################################################
+    def test_keys(self) -> None:
+        """Test different scenarios and seeds don't share results"""
+        self.cache.run("scen", 1, 0, 10, fight)
+        self.assertEqual(self.cache.missing("scen", 2, 0, 10), [(0, 10)])
+        self.assertEqual(self.cache.missing("other", 1, 0, 10), [(0, 10)])
+        self.assertEqual(self.cache.missing("scen", 1, 5, 10), [(5, 10)])
+        self.assertEqual(self.cache.missing("scen", 1, 0, 10), [])
+
+    ########################################################################
+    def test_store(self) -> None:
+        """Test stored results are used rather than fighting"""
+        self.cache.store(Combats("scen", 3, 0, 4), {"a": 4}, Statistics(summary_only=True))
+        self.assertEqual(self.cache.missing("scen", 3, 0, 6), [(4, 2)])
+        wins, _ = self.cache.run("scen", 3, 0, 4, Mock(side_effect=AssertionError))
+        self.assertEqual(dict(wins), {"a": 4})
+
+
+# EOF
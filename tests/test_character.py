@@ -5,7 +5,6 @@
 
 import unittest
 from unittest.mock import Mock, patch
-import dice
 from pycs.arena import Arena
 from pycs.constant import Condition
 from pycs.constant import Stat
@@ -13,6 +12,7 @@ from pycs.character import Character
 from pycs.creature import Creature
 from pycs.creature import DamageType
 from pycs.damage import Damage
+from pycs.rng import Rng
 
 
 ##############################################################################
@@ -86,7 +86,7 @@ class TestCharacter(unittest.TestCase):
         self.assertFalse(self.creat.has_condition(Condition.OK))
         self.assertEqual(self.creat.death_saves, 0)
         # Does the creature come back after a 20?
-        with patch.object(dice, "roll") as mock:
+        with patch.object(Rng, "d20") as mock:
             mock.return_value = 20
             self.creat.start_turn()
             self.assertEqual(self.creat.hp, 1)
@@ -101,12 +101,12 @@ class TestCharacter(unittest.TestCase):
         )
         self.assertEqual(self.creat.hp, 0)
 
-        with patch.object(dice, "roll") as mock:
+        with patch.object(Rng, "d20") as mock:
             mock.return_value = 2
             self.creat.start_turn()
             self.assertEqual(self.creat.death_saves, 1)
         # Test death
-        with patch.object(dice, "roll") as mock:
+        with patch.object(Rng, "d20") as mock:
             mock.return_value = 1
             self.creat.start_turn()
             self.assertEqual(self.creat.death_saves, 3)
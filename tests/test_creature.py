@@ -3,18 +3,20 @@
 """Tests for `creature`"""
 
 
+import io
 import unittest
 from unittest.mock import Mock, patch
 from pycs.arena import Arena
 from pycs.attack import MeleeAttack
 from pycs.attack import RangedAttack
-from pycs.constant import Condition
+from pycs.constant import Condition, DOWN
 from pycs.constant import MonsterType
 from pycs.constant import Stat
 from pycs.creature import Creature
 from pycs.creature import DamageType
 from pycs.damage import Damage
 from pycs.effect import Effect
+from pycs.gear import Leather
 from pycs.gear import Scimitar
 
 
@@ -63,6 +65,16 @@ class TestCreature(unittest.TestCase):
         self.assertTrue(self.creat.has_condition(Condition.PRONE))
         self.creat.remove_condition(Condition.PRONE)
         self.assertFalse(self.creat.has_condition(Condition.PRONE))
+        self.creat.add_condition(Condition.UNCONSCIOUS)
+        self.assertTrue(self.creat.has_condition(DOWN))
+        self.assertTrue(self.creat.has_condition(Condition.PRONE, Condition.UNCONSCIOUS))
+        self.assertFalse(self.creat.is_alive())
+        self.assertEqual(list(self.creat.conditions), [Condition.OK, Condition.UNCONSCIOUS])
+        self.assertEqual(self.creat.conditions.describe(), "ok, unconscious")
+        self.assertEqual(Condition.PRONE.describe(), "prone")
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            self.creat.add_condition(DOWN)
+        self.assertIn("is now dead, unconscious", mock_stdout.getvalue())
 
     ######################################################################
     def test_type(self) -> None:
@@ -110,6 +122,27 @@ class TestCreature(unittest.TestCase):
         self.assertEqual(self.creat.ac, 9)
         self.creat.remove_effect(eff)
         self.assertFalse(self.creat.has_effect("AC Effect"))
+        self.assertEqual(self.creat.ac, 11)
+
+    ########################################################################
+    def test_derived_forgotten(self) -> None:
+        """Cached values follow changes to stats and gear"""
+        self.assertEqual(self.creat.stat_bonus(Stat.WIS), 4)
+        self.assertEqual(self.creat.spellcast_save, 14)
+        self.creat.stats[Stat.WIS] = 20
+        self.assertEqual(self.creat.stat_bonus(Stat.WIS), 5)
+        self.assertEqual(self.creat.spellcast_save, 15)
+
+        self.creat.add_gear(Scimitar())
+        self.assertEqual(self.creat.actions[0].use_stat, Stat.DEX)
+        self.creat.stats[Stat.STR] = 16
+        self.assertEqual(self.creat.actions[0].use_stat, Stat.STR)
+
+        self.creat._ac = None  # pylint: disable=protected-access
+        self.creat.forget_derived()
+        self.assertEqual(self.creat.ac, 9)
+        self.creat.add_gear(Leather())
+        self.assertEqual(self.creat.ac, 10)
 
     ########################################################################
     def test_heal(self) -> None:
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Tests for `decision`"""
+
+
+import unittest
+from unittest.mock import patch
+from pycs.arena import Arena
+from pycs.attack import MeleeAttack
+from pycs.constant import Condition, Stat
+from pycs.creature import Creature
+from pycs.damageroll import DamageRoll
+
+
+##############################################################################
+##############################################################################
+class TestDecisionContext(unittest.TestCase):
+    """Tests for `DecisionContext`"""
+
+    ########################################################################
+    def setUp(self) -> None:
+        """Set up test fixtures, if any."""
+        kwargs = {"str": 10, "int": 10, "dex": 10, "wis": 10, "con": 10, "cha": 10, "hp": 10, "ac": 10}
+        self.arena = Arena(max_x=10, max_y=10)
+        self.hero = Creature(side="a", **kwargs)
+        self.villain = Creature(side="b", **kwargs)
+        self.arena.add_combatant(self.hero, (0, 0))
+        self.arena.add_combatant(self.villain, (3, 3))
+
+    ########################################################################
+    def test_memoized(self) -> None:
+        """Test questions are only worked out once"""
+        with patch.object(Arena, "pick_closest_enemy", wraps=self.arena.pick_closest_enemy) as mock:
+            self.assertEqual(self.hero.pick_closest_enemy(), [self.villain])
+            self.assertEqual(self.hero.pick_closest_enemy(), [self.villain])
+            self.assertEqual(mock.call_count, 1)
+        self.assertIs(self.hero.decision, self.hero.decision)
+
+    ########################################################################
+    def test_invalidated(self) -> None:
+        """Test moving or falling means starting again"""
+        context = self.hero.decision
+        self.assertEqual(context.distance(self.villain), 4)
+        self.arena[(3, 3)] = None
+        self.arena[(1, 1)] = self.villain
+        self.villain.coords = (1, 1)
+        self.assertFalse(context.valid())
+        self.assertEqual(self.hero.decision.distance(self.villain), 1)
+        self.villain.add_condition(Condition.UNCONSCIOUS)
+        self.assertEqual(self.hero.pick_closest_enemy(), [])
+
+    ########################################################################
+    def test_max_dmg(self) -> None:
+        """Test the best damage follows a change in stats mid-combat"""
+        attack = MeleeAttack("Club", dmgroll=DamageRoll("1d6"))
+        self.hero.add_action(attack)
+        self.assertEqual(int(self.hero.decision.max_dmg(attack)), 6)
+        self.hero.stats[Stat.STR] = 16
+        self.assertTrue(self.hero.decision.valid())
+        self.assertEqual(int(self.hero.decision.max_dmg(attack)), 9)
+
+
+# EOF
@@ -8,6 +8,7 @@ from pycs.effects import Effects
 from pycs.constant import DamageType
 from pycs.damage import Damage
 
+
 ##############################################################################
 ##############################################################################
 ##############################################################################
@@ -41,6 +42,30 @@ class TestEffects(unittest.TestCase):
         self.owner.hit(Damage(5, DamageType.FIRE), source=attacker, critical=False, atkname="Demo")
         self.assertEqual(self.owner.damage_this_turn[0], Damage(1, DamageType.ACID))
 
+    def test_only_overriding_effects(self) -> None:
+        """Test hooks only go to the effects that implement them"""
+        self.eff.add_effect(source=self.owner, effect=Effect(name="plain"))
+        self.eff.add_effect(source=self.owner, effect=FauxEffect(name="faux"))
+        self.assertEqual([_[0] for _ in self.eff._implementing("hook_being_hit")], ["faux"])
+        self.assertEqual(self.eff._implementing("hook_d20"), [])
+        self.eff.remove_effect("faux")
+        self.assertEqual(self.eff._implementing("hook_being_hit"), [])
+        self.assertEqual(self.eff.hook_being_hit(Damage(3)), Damage(3))
+
+    def test_aura(self) -> None:
+        """Test auras are only registered once - even before joining an arena"""
+        self.owner.add_effect(effect=AuraEffect(name="aura"))
+        newer = AuraEffect(name="aura")
+        self.owner.add_effect(effect=newer)
+        self.assertEqual(self.arena.roster.auras(), [newer])
+        self.owner.remove_effect("aura")
+        self.assertEqual(self.arena.roster.auras(), [])
+
+        loner = Creature(**self.kwargs)
+        loner.add_effect(effect=AuraEffect(name="aura"))
+        self.arena.add_combatant(loner, (2, 2))
+        self.assertEqual(self.arena.roster.auras(), [loner.effects["aura"]])
+
 
 ##############################################################################
 ##############################################################################
@@ -50,3 +75,12 @@ class FauxEffect(Effect):
 
     def hook_being_hit(self, dmg: Damage) -> Damage:
         return Damage(1, DamageType.ACID)
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class AuraEffect(Effect):
+    """Fake effect with an area"""
+
+    aura_radius = 2
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""Tests for `encounter`"""
+
+
+import unittest
+from unittest.mock import patch
+import pycs
+from pycs.arena import Arena
+from pycs.encounter import Encounter
+from pycs.gear import Longsword
+from pycs.monsters import Gnoll
+from pycs.rng import DEFAULT_RNG, Rng
+
+
+##############################################################################
+def small_army(arena: Arena) -> None:
+    """Something to build an encounter from"""
+    for i in range(3):
+        arena.add_combatant(Gnoll(name=f"Gnoll{i}", side="Gnoll"))
+    arena.add_combatant(Gnoll(name="Leader", side="Gnoll", gear=[Longsword()]), coords=(1, 2))
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class TestEncounter(unittest.TestCase):
+    """Tests for `encounter` class."""
+
+    ########################################################################
+    def setUp(self) -> None:
+        """Set up test fixtures, if any."""
+        self.enc = Encounter(small_army)
+
+    ########################################################################
+    def test_populate(self) -> None:
+        """Each arena gets its own copies"""
+        self.assertEqual(len(self.enc), 4)
+        arena1 = Arena(rng=Rng(1))
+        arena2 = Arena(rng=Rng(2))
+        first = self.enc.populate(arena1)
+        second = self.enc.populate(arena2)
+        self.assertEqual([_.name for _ in first], ["Gnoll0", "Gnoll1", "Gnoll2", "Leader"])
+        self.assertEqual(arena1.roster.pick_everyone(), first)
+        for one, two in zip(first, second):
+            self.assertIsNot(one, two)
+            self.assertIs(one.arena, arena1)
+            self.assertIs(two.arena, arena2)
+            for act in one.actions:
+                self.assertIs(act.owner, one)
+        self.assertEqual(first[3].coords, (1, 2))
+        self.assertEqual(second[3].coords, (1, 2))
+        self.assertIs(first[3].gear[0].owner, first[3])
+
+    ########################################################################
+    def test_rerolled(self) -> None:
+        """Hit points and placement come from the arena's dice"""
+        again = Encounter(small_army)
+        one = self.enc.populate(Arena(rng=Rng(5)))
+        two = again.populate(Arena(rng=Rng(5)))
+        self.assertEqual([(_.hp, _.coords) for _ in one], [(_.hp, _.coords) for _ in two])
+        one[0].hp = 0
+        three = self.enc.populate(Arena(rng=Rng(5)))
+        self.assertEqual(three[0].hp, two[0].hp)
+
+    ########################################################################
+    def test_prototypes_not_rolled(self) -> None:
+        """Building the prototypes doesn't roll any dice"""
+        with patch.object(DEFAULT_RNG, "roll") as roll:
+            enc = Encounter(small_army)
+        roll.assert_not_called()
+        self.assertEqual(len(enc), 4)
+
+    ########################################################################
+    def test_default_encounter(self) -> None:
+        """The default encounter follows the army flags"""
+        self.assertIs(pycs.default_encounter(), pycs.default_encounter())
+        with patch.object(pycs, "DRAGON_ARMY", True), patch.object(pycs, "GNOLL_ARMY", False):
+            dragons = pycs.default_encounter()
+        assert dragons.scenario is not None
+        self.assertIn("dragon_army", dragons.scenario)
+        self.assertNotIn("gnoll_army", dragons.scenario)
+        self.assertIsNot(pycs.default_encounter(), dragons)
+
+
+# EOF
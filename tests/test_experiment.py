@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""Tests for `experiment`"""
+
+
+import unittest
+from unittest.mock import patch
+from pycs.encounter import Encounter
+from pycs.experiment import paired_comparison
+from pycs.log import get_level, set_level, QUIET
+from pycs.monsters import Gnoll, Orc
+
+
+##############################################################################
+def skirmish(arena: Encounter) -> None:
+    """Small fight to compare"""
+    arena.add_combatant(Gnoll(name="Gnoll", side="Gnoll"), (0, 0))
+    arena.add_combatant(Orc(name="Orc", side="Orc"), (3, 3))
+
+
+##############################################################################
+def bigger_skirmish(arena: Encounter) -> None:
+    """The same fight with some help for the gnoll"""
+    skirmish(arena)
+    arena.add_combatant(Gnoll(name="Helper", side="Gnoll"), (0, 1))
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class TestExperiment(unittest.TestCase):
+    """Tests for paired comparisons"""
+
+    ########################################################################
+    def setUp(self) -> None:
+        """Set up test fixtures, if any."""
+        self.level = get_level()
+        set_level(QUIET)
+
+    ########################################################################
+    def tearDown(self) -> None:
+        """Tear down test fixtures, if any."""
+        set_level(self.level)
+
+    ########################################################################
+    def test_same_variant(self) -> None:
+        """The same encounter with the same seeds can't differ"""
+        res = paired_comparison({"one": Encounter(skirmish), "two": Encounter(skirmish)}, "Gnoll", 6, seed=1)
+        self.assertEqual([_.name for _ in res], ["one", "two"])
+        self.assertEqual(res[0].win_rate, res[1].win_rate)
+        self.assertEqual((res[1].difference, res[1].low, res[1].high), (0.0, 0.0, 0.0))
+
+    ########################################################################
+    def test_antithetic(self) -> None:
+        """Each combat is also fought with flipped d20s"""
+        with patch("pycs.experiment._won", return_value=1.0) as mock:
+            res = paired_comparison(
+                {"one": Encounter(skirmish), "two": Encounter(bigger_skirmish)}, "Gnoll", 3, seed=2, antithetic=True
+            )
+        self.assertEqual(mock.call_count, 12)
+        self.assertEqual([_.args[3] for _ in mock.call_args_list[:4]], [False, True, False, True])
+        self.assertEqual(res[1].win_rate, 1.0)
+
+    ########################################################################
+    def test_no_rounds(self) -> None:
+        """Nothing to compare without any combats"""
+        with self.assertRaises(ValueError):
+            paired_comparison({"one": Encounter(skirmish)}, "Gnoll", 0, seed=1)
+
+    ########################################################################
+    def test_workers(self) -> None:
+        """The same results however many workers fight the combats"""
+        variants = {"one": Encounter(skirmish), "two": Encounter(bigger_skirmish)}
+        self.assertEqual(
+            paired_comparison(variants, "Gnoll", 5, seed=3), paired_comparison(variants, "Gnoll", 5, seed=3, workers=2)
+        )
+
+
+# EOF
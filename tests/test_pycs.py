@@ -3,10 +3,17 @@
 """Tests for `pycs` package."""
 
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 import unittest
+from unittest.mock import patch
 from click.testing import CliRunner
 
+import pycs
 from pycs import cli
+from pycs.cache import ResultCache
+from pycs.log import log, get_level, set_level, QUIET
+from pycs.statistics import Statistics
 
 
 class TestPycs(unittest.TestCase):
@@ -27,3 +34,100 @@ class TestPycs(unittest.TestCase):
         help_result = runner.invoke(cli.main, ["--help"])
         assert help_result.exit_code == 0
         assert "Show this message and exit." in help_result.output
+        assert "--workers" in help_result.output
+        assert "--quiet" in help_result.output
+        assert "--seed" in help_result.output
+        assert "--target-ci" in help_result.output
+        assert "--no-cache" in help_result.output
+
+    def test_command_line_quiet(self) -> None:
+        """Test --quiet drops the turn by turn report but keeps warnings"""
+        real_combat = pycs.combat_test
+
+        def combat(*args: Any, **kwargs: Any) -> tuple[str, Statistics]:
+            log.warning("Something is wrong")
+            return real_combat(*args, **kwargs)
+
+        level = get_level()
+        runner = CliRunner()
+        try:
+            with patch.object(pycs, "combat_test", side_effect=combat):
+                loud = runner.invoke(cli.main, ["--seed", "1"])
+                quiet = runner.invoke(cli.main, ["--quiet", "--seed", "1", "--no-cache"])
+        finally:
+            set_level(level)
+        self.assertEqual(quiet.exit_code, 0)
+        self.assertIn("##### Turn", loud.output)
+        self.assertNotIn("##### Turn", quiet.output)
+        self.assertIn("Something is wrong", quiet.output)
+        self.assertIn("Winning stats", quiet.output)
+
+    def test_split_rounds(self) -> None:
+        """Test combats are shared evenly and numbered on"""
+        self.assertEqual(pycs.split_rounds(10, 7, 3), [(10, 3), (13, 2), (15, 2)])
+        self.assertEqual(pycs.split_rounds(0, 2, 4), [(0, 1), (1, 1)])
+
+    def test_run_batch(self) -> None:
+        """Test the winners of a batch are counted"""
+        with patch.object(pycs, "combat_test") as mock:
+            mock.side_effect = [("a", Statistics()), ("b", Statistics()), ("a", Statistics())]
+            wins, stats = pycs.run_combats(3, workers=1)
+        self.assertEqual(wins, {"a": 2, "b": 1})
+        self.assertIsInstance(stats, Statistics)
+
+    def test_run_batch_seeds(self) -> None:
+        """Test each combat in a seeded batch gets its own seed"""
+        with patch.object(pycs, "combat_test") as mock:
+            mock.return_value = ("a", Statistics())
+            pycs.run_batch(3, 2, seed=9)
+        self.assertEqual([_.args[0] for _ in mock.call_args_list], ["9/3", "9/4"])
+
+    def test_run_combats_workers(self) -> None:
+        """Test a seeded run gives the same results however many workers there are"""
+        level = get_level()
+        set_level(QUIET)
+        try:
+            results = [pycs.run_combats(4, workers=_, seed=11) for _ in (1, 2)]
+        finally:
+            set_level(level)
+        (wins1, stats1), (wins2, stats2) = results
+        self.assertEqual(wins1, wins2)
+        self.assertEqual(sum(wins1.values()), 4)
+        self.assertEqual(sorted(stats1.all_types()), sorted(stats2.all_types()))
+        for type_ in stats1.all_types():
+            self.assertEqual(stats1.type_summary(type_), stats2.type_summary(type_))
+
+    def test_run_combats_cached(self) -> None:
+        """Test seeded combats that have been fought before aren't fought again"""
+        cache = ResultCache(":memory:")
+        with patch.object(pycs, "combat_test") as mock:
+            mock.return_value = ("a", Statistics())
+            pycs.run_combats(3, seed=4, cache=cache)
+            wins, _ = pycs.run_combats(5, seed=4, cache=cache)
+            pycs.run_combats(2, cache=cache)
+        self.assertEqual(wins, {"a": 5})
+        self.assertEqual([_.args[0] for _ in mock.call_args_list], ["4/0", "4/1", "4/2", "4/3", "4/4", None, None])
+
+    def test_run_to_precision(self) -> None:
+        """Test combats stop once the win rates are known well enough"""
+        with patch.object(pycs, "combat_test") as mock:
+            mock.return_value = ("a", Statistics())
+            wins, _, rounds = pycs.run_to_precision(0.05, 1000, seed=1, batch=40)
+        self.assertEqual(rounds, 80)
+        self.assertEqual(wins, {"a": 80})
+        self.assertEqual(mock.call_args_list[-1].args[0], "1/79")
+        with patch.object(pycs, "combat_test") as mock:
+            mock.side_effect = [("a" if _ % 2 else "b", Statistics()) for _ in range(150)]
+            wins, _, rounds = pycs.run_to_precision(0.05, 150, batch=40)
+        self.assertEqual(rounds, 150)
+        self.assertEqual(wins, {"a": 75, "b": 75})
+
+    def test_run_to_precision_pool(self) -> None:
+        """Test the workers are started once for all the batches"""
+        with patch.object(pycs, "combat_test") as mock, patch.object(pycs, "new_pool") as pool:
+            mock.return_value = ("a", Statistics())
+            pool.side_effect = lambda workers: ThreadPoolExecutor(max_workers=workers)
+            wins, _, rounds = pycs.run_to_precision(0.05, 1000, workers=2, seed=1, batch=40)
+        self.assertEqual(rounds, 80)
+        self.assertEqual(wins, {"a": 80})
+        pool.assert_called_once_with(2)
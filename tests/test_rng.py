@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+"""Tests for `rng`"""
+
+
+import unittest
+from pycs.rng import Rng, parse_dice, roll_max, compile_dice, combat_seed
+
+
+##############################################################################
+##############################################################################
+class TestRng(unittest.TestCase):
+    """Tests for `rng`"""
+
+    ########################################################################
+    def test_parse_dice(self) -> None:
+        """Test understanding dice expressions"""
+        self.assertEqual(parse_dice("2d6+3"), (2, 6, 3))
+        self.assertEqual(parse_dice("d20"), (1, 20, 0))
+        self.assertEqual(parse_dice("1d4 - 1"), (1, 4, -1))
+        with self.assertRaises(ValueError):
+            parse_dice("fish")
+
+    ########################################################################
+    def test_roll_max(self) -> None:
+        """Test roll_max()"""
+        self.assertEqual(roll_max("8d6"), 48)
+        self.assertEqual(roll_max("2d4+2"), 10)
+
+    ########################################################################
+    def test_compile_dice(self) -> None:
+        """Test compiled dice expressions"""
+        dice = compile_dice("3d6+1")
+        self.assertEqual((dice.count, dice.sides, dice.bonus), (3, 6, 1))
+        self.assertEqual(dice.max, 19)
+        self.assertEqual(dice.min, 4)
+        self.assertEqual(dice.mean, 11.5)
+        self.assertIs(compile_dice("3d6+1"), dice)
+        rng = Rng(3)
+        for _ in range(100):
+            self.assertTrue(dice.min <= rng.roll(dice) <= dice.max)
+
+    ########################################################################
+    def test_roll(self) -> None:
+        """Test rolls stay in range"""
+        rng = Rng(1)
+        for _ in range(100):
+            self.assertTrue(4 <= rng.roll("2d6+2") <= 14)
+            self.assertTrue(1 <= rng.d20() <= 20)
+
+    ########################################################################
+    def test_seeded(self) -> None:
+        """Test the same seed gives the same rolls"""
+        rng1 = Rng("fish")
+        rng2 = Rng("fish")
+        self.assertEqual([rng1.roll("3d8") for _ in range(20)], [rng2.roll("3d8") for _ in range(20)])
+
+    ########################################################################
+    def test_combat_seed(self) -> None:
+        """Test combat_seed()"""
+        self.assertIsNone(combat_seed(None, 3))
+        self.assertEqual(combat_seed(7, 3), combat_seed(7, 3))
+        self.assertNotEqual(combat_seed(7, 3), combat_seed(7, 4))
+
+    ########################################################################
+    def test_streams(self) -> None:
+        """Each creature gets its own stream - the same whoever else rolls"""
+        one = Rng("x", streams=True)
+        two = Rng("x", streams=True)
+        one.stream("Orc").d20()
+        self.assertIs(one.stream("Gnoll"), one.stream("Gnoll"))
+        self.assertEqual(one.stream("Gnoll").d20(), two.stream("Gnoll").d20())
+        self.assertEqual(Rng("x").stream("Gnoll").seed, "x")
+        flipped = Rng("y", antithetic=True)
+        self.assertEqual(flipped.d20(), 21 - Rng("y").d20())
+
+
+# EOF
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+"""Tests for `roster`"""
+
+
+import unittest
+from unittest.mock import Mock
+from pycs.arena import Arena
+from pycs.constant import Condition, MonsterType
+from pycs.creature import Creature
+
+
+##############################################################################
+##############################################################################
+class TestRoster(unittest.TestCase):
+    """Tests for `roster` package."""
+
+    ########################################################################
+    def setUp(self) -> None:
+        """Set up test fixtures, if any."""
+        self.arena = Arena(max_x=10, max_y=10)
+        self.roster = self.arena.roster
+        kwargs = {"str": 10, "int": 10, "dex": 10, "wis": 10, "con": 10, "cha": 10, "hp": 10, "ac": 10}
+        self.one = Creature(side="a", **kwargs)
+        self.two = Creature(side="b", type=MonsterType.UNDEAD, **kwargs)
+        self.arena.add_combatant(self.one, (0, 0))
+        self.arena.add_combatant(self.two, (5, 5))
+
+    ########################################################################
+    def test_rosters(self) -> None:
+        """Test who is standing follows conditions"""
+        self.assertEqual([_.join_order for _ in self.roster.pick_everyone()], [0, 1])
+        self.assertTrue(self.roster.still_going())
+        self.assertEqual(self.roster.remaining_type(self.one, MonsterType.UNDEAD), [self.two])
+        self.two.add_condition(Condition.PRONE)
+        self.assertIsNotNone(self.roster._standing)  # pylint: disable=protected-access
+        self.two.add_condition(Condition.UNCONSCIOUS)
+        self.assertEqual(self.roster.pick_alive(), [self.one])
+        self.assertEqual(self.roster.not_dead(), [self.one, self.two])
+        self.assertEqual(self.roster.remaining_type(self.one, MonsterType.UNDEAD), [])
+        self.assertFalse(self.roster.still_going())
+        self.assertEqual(self.roster.winning_side(), "a")
+        self.two.remove_condition(Condition.UNCONSCIOUS)
+        self.assertEqual(self.roster.my_side("b"), [self.two])
+        self.assertEqual(dict(self.roster.remaining_participants_count()), {"a": 1, "b": 1})
+
+    ########################################################################
+    def test_reorder(self) -> None:
+        """Test the initiative order is kept"""
+        self.roster.reorder([self.two, self.one])
+        self.assertEqual(self.roster.pick_alive(), [self.two, self.one])
+
+    ########################################################################
+    def test_auras(self) -> None:
+        """Test auras are an ordered set"""
+        first, second = Mock(), Mock()
+        self.roster.add_aura(first)
+        self.roster.add_aura(second)
+        self.roster.add_aura(first)
+        self.assertEqual(self.roster.auras(), [first, second])
+        self.roster.remove_aura(first)
+        self.roster.remove_aura(first)
+        self.assertEqual(self.roster.auras(), [second])
+
+    ########################################################################
+    def test_subscribe(self) -> None:
+        """Test listening for events"""
+        self.roster.subscribe(self.one, "start_others_turn", 3)
+        self.assertEqual(self.roster.listeners("start_others_turn"), {self.one: 3})
+        self.roster.unsubscribe(self.one, "start_others_turn")
+        self.roster.unsubscribe(self.one, "start_others_turn")
+        self.assertEqual(self.roster.listeners("start_others_turn"), {})
+
+
+# EOF
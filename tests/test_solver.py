@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+"""Tests for `solver`"""
+
+
+import unittest
+from pycs.attack import Attack
+from pycs.monsters import Ankylosaurus, Orc, Skeleton, Troll
+from pycs.rng import compile_dice
+from pycs.solver import UnsupportedError, attack_distribution, dice_distribution, initiative_orders, solve_duel
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class TestSolver(unittest.TestCase):
+    """Tests for the exact duel solver"""
+
+    ########################################################################
+    def test_dice_distribution(self) -> None:
+        """Test the chances of dice totals"""
+        dist = dice_distribution(compile_dice("2d6"), 1)
+        self.assertAlmostEqual(sum(dist.values()), 1.0)
+        self.assertEqual(min(dist), 3)
+        self.assertEqual(max(dist), 13)
+        self.assertAlmostEqual(dist[8], 6 / 36)
+        self.assertEqual(dice_distribution(None, 4), {4: 1.0})
+
+    ########################################################################
+    def test_attack_distribution(self) -> None:
+        """Test the chance of each amount of damage from an attack"""
+        orc = Orc(name="Orc", side="o")
+        skel = Skeleton(name="Skel", side="s")
+        greataxe = orc.pick_action_by_name("Greataxe")
+        assert isinstance(greataxe, Attack)
+        dist = attack_distribution(greataxe, skel)
+        self.assertAlmostEqual(sum(dist.values()), 1.0)
+        # +5 to hit against AC 13 - hits on 8 or more, 13 rolls out of 20
+        self.assertAlmostEqual(dist[0], 7 / 20)
+        # Normal hits (8 to 19) are 1d12+3, criticals 12+1d12+3
+        self.assertEqual(max(dist), 27)
+        self.assertAlmostEqual(dist[4], 12 / 20 / 12)
+        skel._ac = 30
+        skel.forget_derived()
+        self.assertEqual(attack_distribution(greataxe, skel), {0: 1.0})
+        greataxe.owner = None
+        with self.assertRaises(UnsupportedError):
+            attack_distribution(greataxe, skel)
+
+    ########################################################################
+    def test_initiative_orders(self) -> None:
+        """Test ties go to the later joiner - as Arena.do_initiative()"""
+        orders = initiative_orders([Skeleton(name="One", side="a"), Skeleton(name="Two", side="b")])
+        self.assertAlmostEqual(sum(orders.values()), 1.0)
+        self.assertAlmostEqual(orders[(1, 0)], 0.5 + 1 / 40)
+
+    ########################################################################
+    def test_solve_duel(self) -> None:
+        """Test an orc against skeletons - checked against 4000 simulated combats each"""
+        res = solve_duel(Orc(name="Orc", side="o"), Skeleton(name="Skel", side="s"))
+        self.assertEqual(res.unsupported, [])
+        self.assertAlmostEqual(sum(res.win_probability.values()), 1.0)
+        self.assertAlmostEqual(res.win_probability["o"], 0.791, places=3)
+        self.assertGreater(res.expected_rounds, 1.0)
+        res = solve_duel(Orc(name="Orc", side="o"), Skeleton(name="Skel1", side="s"), Skeleton(name="Skel2", side="s"))
+        self.assertAlmostEqual(res.win_probability["o"], 0.241, places=3)
+
+    ########################################################################
+    def test_unsupported(self) -> None:
+        """Test what can't be modelled is flagged"""
+        with self.assertRaises(UnsupportedError) as context:
+            solve_duel(Troll(name="Troll", side="t"), Orc(name="Orc", side="o"))
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertIn("Troll.hook_start_turn()", str(context.exception))
+        # Ignoring the troll's regeneration still leaves nothing to model it attacking with
+        with self.assertRaises(UnsupportedError) as context:
+            solve_duel(Troll(name="Troll", side="t"), Orc(name="Orc", side="o"), strict=False)
+        self.assertIn("Troll", str(context.exception))
+        res = solve_duel(Ankylosaurus(name="Anky", side="a"), Orc(name="Orc", side="o"), strict=False)
+        self.assertEqual(res.unsupported, ["Anky: Tail side effect"])
+        self.assertAlmostEqual(sum(res.win_probability.values()), 1.0)
+
+    ########################################################################
+    def test_sides(self) -> None:
+        """Test needing two sides"""
+        with self.assertRaises(ValueError):
+            solve_duel(Orc(name="Orc1", side="o"), Orc(name="Orc2", side="o"))
+
+
+# EOF
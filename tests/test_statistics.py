@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+"""Tests for `statistics`"""
+
+
+import unittest
+from pycs.damage import Damage
+from pycs.statistics import Statistics
+
+
+##############################################################################
+class Orc:
+    """Stand in for a creature"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+##############################################################################
+class Elf(Orc):
+    """Stand in for another type of creature"""
+
+
+##############################################################################
+##############################################################################
+class TestStatistics(unittest.TestCase):
+    """Tests for `statistics`"""
+
+    ########################################################################
+    def setUp(self) -> None:
+        """Set up test fixtures, if any."""
+        self.orc = Orc("Grunt")
+        self.elf = Elf("Legolas")
+        self.stats = Statistics()
+        self.stats.add(source=self.orc, target=self.elf, hit=True, atkname="Axe", dmg=Damage(7), critical=True)
+        self.stats.add(source=self.orc, target=self.elf, hit=False, atkname="Axe")
+        self.stats.add(source=self.elf, target=self.orc, hit=True, atkname="Bow", dmg=Damage(4))
+
+    ########################################################################
+    def test_creature_summary(self) -> None:
+        """Test creature_summary()"""
+        self.assertEqual(
+            self.stats.creature_summary(self.orc), {"Axe": {"hits": 1, "misses": 1, "damage": 7, "crits": 1}}
+        )
+        self.assertEqual(self.stats.creature_summary(Orc("Nobody")), {})
+
+    ########################################################################
+    def test_type_summary(self) -> None:
+        """Test type_summary() and all_types()"""
+        self.assertEqual(list(self.stats.all_types()), ["Orc", "Elf"])
+        self.assertEqual(self.stats.type_summary("Elf"), {"Bow": {"hits": 1, "misses": 0, "damage": 4, "crits": 0}})
+
+    ########################################################################
+    def test_add(self) -> None:
+        """Test merging statistics with different interned names"""
+        other = Statistics()
+        other.add(source=Elf("Arwen"), target=self.orc, hit=True, atkname="Sword", dmg=Damage(3))
+        other.add(source=self.elf, target=self.orc, hit=True, atkname="Bow", dmg=Damage(2))
+        self.stats += other
+        self.assertEqual(len(self.stats), 5)
+        self.assertEqual(self.stats.creature_summary(self.elf)["Bow"]["damage"], 6)
+        self.assertEqual(self.stats.type_summary("Elf")["Sword"]["hits"], 1)
+
+    ########################################################################
+    def test_events(self) -> None:
+        """Test the raw events are kept"""
+        events = list(self.stats.events())
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[2]["source"], "Legolas")
+        self.assertEqual(events[2]["targettype"], "Orc")
+        self.assertEqual(events[2]["damage"], 4)
+
+    ########################################################################
+    def test_summary_only(self) -> None:
+        """Test only keeping the totals"""
+        summary = Statistics(summary_only=True)
+        summary.add(source=self.orc, target=self.elf, hit=True, atkname="Axe", dmg=Damage(5))
+        self.assertEqual(len(summary), 0)
+        self.assertEqual(summary.creature_summary(self.orc)["Axe"]["damage"], 5)
+        # Merging in a summary drops the events we had
+        self.stats += summary
+        self.assertEqual(len(self.stats), 0)
+        self.assertEqual(self.stats.creature_summary(self.orc)["Axe"]["damage"], 12)
+        self.assertEqual(self.stats.type_summary("Orc")["Axe"]["hits"], 2)
+
+
+# EOF
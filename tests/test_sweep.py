@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+"""Tests for `sweep`"""
+
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from pycs import sweep
+from pycs.sweep import Sweep, build_encounter, describe, substitute
+
+SCENARIO = {
+    "Humans": [
+        {
+            "type": "Fighter",
+            "name": "Frank",
+            "level": "$level",
+            "race": "Human",
+            "gear": [{"type": "Longsword", "magic_bonus": "$magic"}],
+        }
+    ],
+    "Gnoll": [{"type": "Gnoll", "count": 2}],
+}
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class TestSweep(unittest.TestCase):
+    """Tests for parameter sweeps"""
+
+    ########################################################################
+    def setUp(self) -> None:
+        """Set up test fixtures, if any."""
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    ########################################################################
+    def tearDown(self) -> None:
+        """Tear down test fixtures, if any."""
+        self.tmpdir.cleanup()
+
+    ########################################################################
+    def test_substitute(self) -> None:
+        """Test axis values are put into the scenario"""
+        scen = substitute(SCENARIO, {"level": 2, "magic": 1})
+        self.assertEqual(scen["Humans"][0]["level"], 2)
+        self.assertEqual(scen["Humans"][0]["gear"][0]["magic_bonus"], 1)
+        self.assertEqual(SCENARIO["Humans"][0]["level"], "$level")
+        self.assertEqual(describe(scen), describe(dict(reversed(scen.items()))))
+
+    ########################################################################
+    def test_build_encounter(self) -> None:
+        """Test a scenario becomes creatures"""
+        enc = build_encounter(substitute(SCENARIO, {"level": 2, "magic": 1}))
+        names = [(_.name, _.side) for _ in enc._prototypes]  # pylint: disable=protected-access
+        self.assertEqual(names, [("Frank", "Humans"), ("Gnoll0", "Gnoll"), ("Gnoll1", "Gnoll")])
+        frank = enc._prototypes[0]  # pylint: disable=protected-access
+        self.assertEqual(frank.level, 2)
+        self.assertEqual(frank.gear[0].magic_bonus, 1)
+        with self.assertRaises(ValueError):
+            build_encounter({"a": [{"type": "Unicorn"}]})
+
+    ########################################################################
+    def test_unique_names(self) -> None:
+        """Test nobody shares a name - and so a stream of rolls"""
+        enc = build_encounter(
+            {
+                "Gnoll": [{"type": "Gnoll"}, {"type": "Gnoll"}],
+                "Rivals": [{"type": "Gnoll"}],
+            }
+        )
+        names = [_.name for _ in enc._prototypes]  # pylint: disable=protected-access
+        self.assertEqual(names, ["Gnoll", "Gnoll (Gnoll)", "Gnoll (Rivals)"])
+
+    ########################################################################
+    def test_only_new_cells(self) -> None:
+        """Test cells that have been run before come from the cache"""
+        path = os.path.join(self.tmpdir.name, "results.sqlite")
+        swp = Sweep(SCENARIO, {"level": [1, 2], "magic": [0]}, 3, seed=1, cache_path=path)
+        with patch.object(sweep, "run_cell", wraps=sweep.run_cell) as mock:
+            first = swp.run()
+            self.assertEqual(mock.call_count, 2)
+            swp.axes["magic"].append(1)
+            second = swp.run()
+            self.assertEqual(mock.call_count, 4)
+        self.assertEqual(len(second), 4)
+        self.assertEqual(second[0], first[0])
+        self.assertEqual(sum(second[3][1].values()), 3)
+
+        again = Sweep(SCENARIO, {"level": [1, 2], "magic": [0, 1]}, 4, seed=1, cache_path=path)
+        with patch.object(sweep, "run_cell", wraps=sweep.run_cell) as mock:
+            third = again.run()
+        self.assertEqual([_.args[1:3] for _ in mock.call_args_list], [(3, 1)] * 4)
+        self.assertEqual(sum(third[3][1].values()), 4)
+
+
+# EOF
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+
+"""Tests for `util`"""
+
+
+import unittest
+from pycs.util import check_args, wilson_interval
+
+
+##############################################################################
+##############################################################################
+##############################################################################
+class TestUtil(unittest.TestCase):
+    """Tests for `util` functions."""
+
+    ########################################################################
+    def test_check_args(self) -> None:
+        """Test unknown arguments are caught"""
+        check_args({"a", "b"}, "Test", {"a": 1})
+        with self.assertRaises(AssertionError):
+            check_args({"a", "b"}, "Test", {"c": 1})
+
+    ########################################################################
+    def test_wilson_interval(self) -> None:
+        """Test the interval on a proportion"""
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(low, 0.4038, places=4)
+        self.assertAlmostEqual(high, 0.5962, places=4)
+        low, high = wilson_interval(0, 10)
+        self.assertEqual(low, 0.0)
+        self.assertAlmostEqual(high, 0.2775, places=4)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+
+
+# EOF